@@ -0,0 +1,25 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Timing benchmarks for the test base.
+
+These are not unit tests; each is run as a module, for example
+``python -m benchmarks.import_time``, and compares its results against
+the stored baselines.
+
+Timings only compare on the same machine, so the baselines are not
+committed. Store them first with ``--update``, for example on the base
+branch of a CI job, then run again without it on the change to check.
+"""
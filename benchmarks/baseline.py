@@ -0,0 +1,82 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import os
+from typing import Callable, Dict, Optional
+
+from spinnaker_testbase.micro_benchmark import (
+    get_baseline_store, update_baselines)
+
+#: File holding the stored results if TESTBASE_BENCHMARK_BASELINES is not set
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baselines.json")
+# These time new interpreters and file systems, which vary by more than
+# the calls assert_benchmark times, in seconds
+_NOISE = 0.01
+
+
+def parse_args(
+        description: str,
+        add_arguments: Optional[
+            Callable[[argparse.ArgumentParser], None]] = None
+        ) -> argparse.Namespace:
+    """
+    Parses the command line options shared by all the benchmarks.
+
+    :param description: What the benchmark measures
+    :param add_arguments: Adds any options only this benchmark has
+    :returns: The parsed options
+    """
+    parser = argparse.ArgumentParser(description=description)
+    if add_arguments is not None:
+        add_arguments(parser)
+    parser.add_argument(
+        "--update", action="store_true", default=update_baselines(),
+        help="store the results as the new baselines; "
+             "also set by TESTBASE_BENCHMARK_UPDATE")
+    parser.add_argument(
+        "--repeats", type=int, default=5,
+        help="number of times to repeat each measurement")
+    return parser.parse_args()
+
+
+def check_results(results: Dict[str, float], update: bool) -> int:
+    """
+    Prints results next to their baselines and looks for regressions.
+
+    The baselines are kept as by BaseTestCase.assert_benchmark, in
+    TESTBASE_BENCHMARK_BASELINES or else baselines.json here.
+
+    :param results: Seconds taken by each benchmark
+    :param update: If True the results are stored instead of checked
+    :returns: Exit code; 1 if any result is slower than allowed
+    """
+    store = get_baseline_store(BASELINE_FILE, _NOISE)
+    assert store is not None
+    baselines = store.read()
+    for name, seconds in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:60} {seconds * 1000:10.1f} ms  (no baseline)")
+            continue
+        ratio = seconds / baseline if baseline else float("inf")
+        print(f"{name:60} {seconds * 1000:10.1f} ms  x{ratio:.2f}")
+    if update:
+        store.store_all(results)
+        print(f"Baselines written to {store.path}")
+        return 0
+    regressions = store.regressions(results)
+    for regression in regressions:
+        print(regression)
+    return 1 if regressions else 0
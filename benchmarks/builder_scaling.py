@@ -0,0 +1,211 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+from contextlib import contextmanager
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import types
+from typing import Any, Callable, Iterator, List, Tuple
+from unittest import mock
+
+from spinnaker_testbase import root_script_builder
+from spinnaker_testbase.root_script_builder import RootScriptBuilder
+
+from .baseline import check_results, parse_args
+
+_BINARIES = """# combined binaries [{name}_a.aplx,
+#   {name}_b.aplx,
+#   {name}_c.aplx]
+"""
+_PLAIN = """import time
+{binaries}
+time.sleep(0)
+"""
+_RUN_SCRIPT = """
+def run_script(*, split: bool = False):
+    print(split)
+
+# combined binaries [{name}_a.aplx, {name}_b.aplx]
+# split binaries [{name}_a.aplx,
+#     {name}_split.aplx]
+"""
+_MAIN = """
+def main():
+    pass
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def build_tree(root: str, n_scripts: int, depth: int, width: int) -> str:
+    """
+    Writes a tree of synthetic example scripts.
+
+    The scripts cycle through plain scripts with and without a multi-line
+    binaries comment, run_script scripts and main guarded scripts.
+
+    :param root: Folder to write the repository in
+    :param n_scripts: Total number of scripts
+    :param depth: Number of folder levels below the scripts folder
+    :param width: Number of sub folders in each folder
+    :returns: The repository folder; scripts are in its ``examples`` folder
+    """
+    folders = [os.path.join(root, "examples")]
+    for _ in range(depth):
+        folders = [os.path.join(folder, f"level_{index}")
+                   for folder in folders for index in range(width)]
+    for folder in folders:
+        os.makedirs(folder)
+    for index in range(n_scripts):
+        name = f"script_{index}"
+        kind = index % 4
+        if kind == 0:
+            text = _PLAIN.format(binaries=_BINARIES.format(name=name))
+        elif kind == 1:
+            text = _PLAIN.format(binaries="")
+        elif kind == 2:
+            text = _RUN_SCRIPT.format(name=name)
+        else:
+            text = _MAIN
+        with open(os.path.join(folders[index % len(folders)], name + ".py"),
+                  "w", encoding="utf-8") as script:
+            script.write(text)
+    os.makedirs(os.path.join(root, "integration_tests"))
+    return root
+
+
+def add_tests(builder: RootScriptBuilder,
+              scripts: List[Tuple[str, str]]) -> str:
+    """
+    Analyses the scripts and writes their tests as the builder does.
+
+    :param builder: The builder to write the tests with
+    :param scripts: The path and local path of each script
+    :returns: The text of the tests
+    """
+    # pylint: disable=protected-access
+    test_file = io.StringIO()
+    for script_path, local_path in scripts:
+        builder._add_test_script(
+            script_path, local_path, test_file, {}, {}, {})
+    return test_file.getvalue()
+
+
+@contextmanager
+def slow_filesystem(latency: float) -> Iterator[None]:
+    """
+    Adds a delay to each directory listing and file open the builder does.
+
+    :param latency: Seconds to add to each call
+    :returns: Nothing; the delay applies inside the context
+    """
+    if latency <= 0:
+        yield
+        return
+
+    def delayed(call: Callable) -> Callable:
+        def delayed_call(*args: Any, **kwargs: Any) -> Any:
+            time.sleep(latency)
+            return call(*args, **kwargs)
+        return delayed_call
+
+    with mock.patch.object(root_script_builder.os, "listdir",
+                           delayed(os.listdir)), \
+            mock.patch.object(root_script_builder, "open",
+                              delayed(open), create=True):
+        yield
+
+
+def _builder_in(repository: str) -> RootScriptBuilder:
+    """
+    Makes a builder that writes its tests into the synthetic repository.
+    """
+    name = "synthetic_script_builder"
+    module = types.ModuleType(name)
+    module.__file__ = os.path.join(
+        repository, "integration_tests", "script_builder.py")
+    sys.modules[name] = module
+    builder_class = type("SyntheticBuilder", (RootScriptBuilder,),
+                         {"__module__": name})
+    return builder_class()
+
+
+def _median_time(repeats: int, call: Callable[[], Any]) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scripts", type=int, default=10000,
+                        help="number of scripts in the tree")
+    parser.add_argument("--depth", type=int, default=3,
+                        help="folder levels below the examples folder")
+    parser.add_argument("--width", type=int, default=4,
+                        help="sub folders in each folder")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="milliseconds added to each listing and open")
+
+
+def main() -> int:
+    """
+    Times each phase of building the tests for a synthetic script tree.
+
+    :returns: Exit code
+    """
+    args = parse_args(
+        "Measures how RootScriptBuilder scales with the number of scripts",
+        _add_arguments)
+    shape = f"{args.scripts}x{args.depth}x{args.width}"
+    if args.latency > 0:
+        shape += f"+{args.latency:g}ms"
+    with tempfile.TemporaryDirectory() as root:
+        repository = build_tree(root, args.scripts, args.depth, args.width)
+        examples = os.path.join(repository, "examples")
+        builder = _builder_in(repository)
+        prefix_len = len(repository) + 1
+        with slow_filesystem(args.latency / 1000):
+            # pylint: disable=protected-access
+            scripts = builder._find_scripts(examples, prefix_len)
+            results = {
+                f"builder.walk.{shape}": _median_time(
+                    args.repeats,
+                    lambda: builder._find_scripts(examples, prefix_len)),
+                f"builder.analyse.{shape}": _median_time(
+                    args.repeats, lambda: [
+                        builder._script_details(script_path)
+                        for script_path, _ in scripts]),
+                f"builder.add.{shape}": _median_time(
+                    args.repeats, lambda: add_tests(builder, scripts)),
+                f"builder.total.{shape}": _median_time(
+                    args.repeats,
+                    lambda: builder.create_test_scripts(["examples"])),
+            }
+    for name, seconds in results.items():
+        print(f"{name}: {len(scripts) / seconds:.0f} scripts per second")
+    return check_results(results, args.update)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pkgutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+import spinnaker_testbase
+
+from .baseline import check_results, parse_args
+
+# Number of packages listed in each module's breakdown
+_TOP = 8
+
+
+def testbase_modules() -> List[str]:
+    """
+    :returns: The names of all the spinnaker_testbase modules
+    """
+    return ["spinnaker_testbase"] + sorted(
+        f"spinnaker_testbase.{info.name}"
+        for info in pkgutil.iter_modules(spinnaker_testbase.__path__))
+
+
+def import_times(module: str, pycache: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Imports a module in a new interpreter with ``-X importtime``.
+
+    :param module: Name of the module to import
+    :param pycache: Folder for the byte code; an empty one gives a cold start
+    :returns: Total seconds for the module, and the seconds spent in each
+        top level package imported along the way
+    """
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+    # Warm runs need the cold run to have written the byte code
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env, capture_output=True, text=True, check=True)
+    total = 0.0
+    packages: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[12:].split("|")
+        name = name.strip()
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0.0) + int(self_us) / 1e6
+        if name == module:
+            total = int(cumulative_us) / 1e6
+    return total, packages
+
+
+def main() -> int:
+    """
+    Measures the cold and warm import time of each module.
+
+    :returns: Exit code
+    """
+    args = parse_args(
+        "Measures the import time of each spinnaker_testbase module")
+    results: Dict[str, float] = {}
+    for module in testbase_modules():
+        with tempfile.TemporaryDirectory() as pycache:
+            cold, packages = import_times(module, pycache)
+            warm = statistics.median(
+                import_times(module, pycache)[0]
+                for _ in range(args.repeats))
+        results[f"import.cold.{module}"] = cold
+        results[f"import.warm.{module}"] = warm
+        print(f"{module}: cold {cold * 1000:.1f} ms, "
+              f"warm {warm * 1000:.1f} ms")
+        for package, seconds in sorted(
+                packages.items(), key=lambda item: -item[1])[:_TOP]:
+            print(f"    {seconds * 1000:10.1f} ms  {package}")
+    return check_results(results, args.update)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict
+
+from .baseline import check_results, parse_args
+
+# Imports the test case and sets up one script as a new worker would
+_FIRST_SETUP = """
+import time
+start = time.perf_counter()
+from spinnaker_testbase.root_test_case import RootTestCase
+RootTestCase()._setup({script!r})
+print(time.perf_counter() - start)
+"""
+
+
+def first_setup(script: str) -> float:
+    """
+    Times importing RootTestCase and its first _setup in a new interpreter.
+
+    :param script: Path of the script to set up for
+    :returns: Seconds taken
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _FIRST_SETUP.format(script=script)],
+        capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def repeat_setup(script: str, repeats: int) -> float:
+    """
+    Times _setup once everything is imported.
+
+    :param script: Path of the script to set up for
+    :param repeats: Number of times to call _setup
+    :returns: Median seconds per call
+    """
+    # pylint: disable=import-outside-toplevel
+    from spinnaker_testbase.root_test_case import RootTestCase
+    test_case = RootTestCase()
+    cwd = os.getcwd()
+    times = []
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            # pylint: disable=protected-access
+            test_case._setup(script)
+            times.append(time.perf_counter() - start)
+    finally:
+        os.chdir(cwd)
+    return statistics.median(times)
+
+
+def main() -> int:
+    """
+    Measures the overhead RootTestCase._setup adds to each test.
+
+    :returns: Exit code
+    """
+    args = parse_args("Measures the cost of RootTestCase._setup")
+    script = os.path.abspath(__file__)
+    results: Dict[str, float] = {
+        "setup.first": statistics.median(
+            first_setup(script) for _ in range(args.repeats)),
+        "setup.repeat": repeat_setup(script, args.repeats * 100),
+    }
+    return check_results(results, args.update)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,8 +19,32 @@ There is need to use this repository unless you want to run some or all tests
 locally
 """
 
-from .base_test_case import BaseTestCase
-from .root_script_builder import RootScriptBuilder
-from .script_checker import ScriptChecker
+from importlib import import_module
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_test_case import BaseTestCase
+    from .root_script_builder import RootScriptBuilder
+    from .script_checker import ScriptChecker
 
 __all__ = ["BaseTestCase", "RootScriptBuilder", "ScriptChecker"]
+
+# The test cases pull in the whole tool chain and matplotlib,
+# so they are only imported when first asked for.
+_LAZY = {
+    "BaseTestCase": ".base_test_case",
+    "RootScriptBuilder": ".root_script_builder",
+    "ScriptChecker": ".script_checker",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
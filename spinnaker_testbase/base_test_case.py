@@ -16,8 +16,17 @@ from logging import LogRecord
 import os
 import random
 import sys
-from typing import List
+from typing import Any, Callable, List, Optional, Sequence, Union
+from numpy.typing import ArrayLike
 from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.utilities.base_database import BaseDatabase
+from .golden_data import check_golden, regenerate_enabled, save_golden
+from .iobuf_scanner import ERROR_PATTERN, IobufMatch, scan_iobufs
+from .log_capture import IndexedLogCapture, record_messages
+from .micro_benchmark import (
+    BenchmarkStats, get_baseline_store, measure, update_baselines)
+from .provenance_queries import (
+    ProvenanceDatabase, close_provenance_connections, provenance_database)
 from .root_test_case import RootTestCase
 
 
@@ -32,26 +41,38 @@ class BaseTestCase(RootTestCase):
     def setUp(self) -> None:
         file = sys.modules[self.__module__].__file__
         assert file is not None
+        self._start_coverage()
         self._setup(file)
 
+    def tearDown(self) -> None:
+        close_provenance_connections()
+        super().tearDown()
+
     def assert_logs_messages(
-            self, log_records: List[LogRecord], sub_message: str,
-            log_level: str = 'ERROR', count: int = 1,
+            self, log_records: Union[List[LogRecord], IndexedLogCapture],
+            sub_message: str, log_level: str = 'ERROR', count: int = 1,
             allow_more: bool = False) -> None:
         """
         Tool to assert the log messages contain the sub-message.
 
-        :param log_records: list of log message
+        Both the raw message and the message after formatting are checked.
+
+        :param log_records: list of log message or an IndexedLogCapture.
+            An IndexedLogCapture avoids rescanning records on each call.
         :param sub_message: text to look for
         :param log_level: level to look for
         :param count: number of times this message should be found
         :param allow_more: If True, OK to have more than count repeats
         """
-        seen = 0
-        for record in log_records:
-            if record.levelname == log_level and \
-                    sub_message in str(record.msg):
-                seen += 1
+        if isinstance(log_records, IndexedLogCapture):
+            seen = log_records.count(sub_message, log_level)
+        else:
+            seen = 0
+            for record in log_records:
+                if record.levelname == log_level and any(
+                        sub_message in message
+                        for message in record_messages(record)):
+                    seen += 1
         if allow_more and seen > count:
             return
         if seen != count:
@@ -72,3 +93,155 @@ class BaseTestCase(RootTestCase):
         """
         app_iobuf_file_path = FecDataView.get_app_provenance_dir_path()
         return os.listdir(app_iobuf_file_path)
+
+    def scan_iobufs(self, patterns: Sequence[str], system: bool = True,
+                    app: bool = True) -> List[IobufMatch]:
+        """
+        Searches the iobuf files of the last run in parallel.
+
+        :param patterns: Regular expressions to look for
+        :param system: If True search the system iobuf files
+        :param app: If True search the application iobuf files
+        :returns: The matching lines with the core that wrote them
+        """
+        directories = []
+        if system:
+            directories.append(FecDataView.get_system_provenance_dir_path())
+        if app:
+            directories.append(FecDataView.get_app_provenance_dir_path())
+        return scan_iobufs(directories, patterns)
+
+    def assert_no_iobuf_errors(self, system: bool = True) -> None:
+        """
+        Asserts that no core logged an error to its iobuf.
+
+        :param system: If True system cores are checked as well as app cores
+        :raises AssertionError: If any iobuf has an error line
+        """
+        errors = self.scan_iobufs([ERROR_PATTERN], system=system)
+        if errors:
+            lines = [str(error) for error in errors[:10]]
+            if len(errors) > 10:
+                lines.append(f"... and {len(errors) - 10} more")
+            raise self.failureException(
+                f"{len(errors)} iobuf errors:\n" + "\n".join(lines))
+
+    def get_provenance(self) -> ProvenanceDatabase:
+        """
+        Gets a read only view of the last run's provenance database.
+
+        The view is shared until the database file changes,
+        so repeated checks do not reread it.
+
+        :returns: The provenance of the last run
+        """
+        return provenance_database(BaseDatabase.default_database_file())
+
+    def assert_core_provenance_at_most(
+            self, sub_description: str, maximum: float) -> None:
+        """
+        Asserts no core recorded a value above a limit.
+
+        :param sub_description: Text the provenance description contains
+        :param maximum: Largest acceptable value
+        :raises AssertionError: If any core recorded more
+        """
+        over = self.get_provenance().cores(sub_description).above(maximum)
+        if over:
+            raise self.failureException(
+                f"{len(over)} cores with {sub_description} over {maximum}: "
+                f"{over[:10]}")
+
+    def assert_router_provenance_at_most(
+            self, sub_description: str, maximum: float) -> None:
+        """
+        Asserts no router recorded a value above a limit.
+
+        :param sub_description: Text the provenance description contains
+        :param maximum: Largest acceptable value
+        :raises AssertionError: If any router recorded more
+        """
+        over = self.get_provenance().routers(sub_description).above(maximum)
+        if over:
+            raise self.failureException(
+                f"{len(over)} routers with {sub_description} over {maximum}: "
+                f"{[(x, y, value) for x, y, _, value in over[:10]]}")
+
+    def assert_no_dropped_packets(self) -> None:
+        """
+        Asserts no router dropped a multicast packet.
+
+        :raises AssertionError: If any router dropped a packet
+        """
+        self.assert_router_provenance_at_most("Dropped_Multicast_Packets", 0)
+
+    def assert_matches_golden(
+            self, golden_path: str, rtol: float = 0.0, atol: float = 0.0,
+            **arrays: ArrayLike) -> None:
+        """
+        Asserts recorded arrays match those saved in a golden .npz file.
+
+        For example
+        ``self.assert_matches_golden("golden.npz", atol=0.1, v=voltages)``.
+        Each keyword names an array in the file.
+        The tolerances are those of numpy.isclose; by default exact.
+
+        If TESTBASE_REGENERATE_GOLDEN is true the arrays are written to
+        the file instead, keeping any other arrays in it.
+
+        :param golden_path: The .npz file, relative to the test directory
+        :param rtol: Relative tolerance
+        :param atol: Absolute tolerance
+        :param arrays: The recorded arrays by name
+        :raises AssertionError: If any array differs from its golden copy
+        """
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        golden_path = os.path.join(os.path.dirname(class_file), golden_path)
+        if regenerate_enabled():
+            save_golden(golden_path, arrays)
+            return
+        problems = check_golden(golden_path, arrays, rtol, atol)
+        if problems:
+            raise self.failureException(
+                f"Does not match {golden_path}:\n" + "\n".join(problems))
+
+    def assert_benchmark(
+            self, name: str, function: Callable[[], Any], repeats: int = 20,
+            warmup: int = 3, budget: Optional[float] = None
+            ) -> BenchmarkStats:
+        """
+        Times repeated calls of a function and checks it is fast enough.
+
+        The statistics are written to the benchmarks report so they can be
+        tracked over time.
+        If TESTBASE_BENCHMARK_BASELINES names a file, best given as an
+        absolute path, the median must also be within
+        TESTBASE_BENCHMARK_TOLERANCE times the stored baseline.
+        If TESTBASE_BENCHMARK_UPDATE is true the median is stored as the
+        new baseline instead.
+
+        :param name: Name of the benchmark in the report and baselines
+        :param function: What to time; called with no arguments
+        :param repeats: Number of timed calls
+        :param warmup: Number of calls before timing starts
+        :param budget: Most seconds the median call may take, if limited
+        :returns: The statistics of the timed calls
+        :raises AssertionError: If the median is over budget or baseline
+        """
+        stats = BenchmarkStats.from_times(
+            name, measure(function, repeats, warmup))
+        self.report(stats.summary(), "benchmarks")
+        if budget is not None and stats.median > budget:
+            raise self.failureException(
+                f"{name} median {stats.median * 1000:.3f} ms is over the "
+                f"budget of {budget * 1000:.3f} ms")
+        store = get_baseline_store()
+        if store is not None:
+            if update_baselines():
+                store.store(stats)
+            else:
+                problem = store.check(stats)
+                if problem is not None:
+                    raise self.failureException(problem)
+        return stats
@@ -0,0 +1,501 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import importlib
+import inspect
+import multiprocessing
+from multiprocessing.queues import Queue
+import os
+from queue import Empty
+import re
+import sys
+from threading import Condition
+import time
+from typing import (
+    Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple,
+    Type, TypeVar)
+import unittest
+
+from .config_overrides import add_config_override
+from .memory_tracker import RecyclePolicy, current_rss
+from .trace_events import name_process, span
+
+#: Environment variable set in a worker to the name of its board
+WORKER_BOARD_ENV = "TESTBASE_WORKER_BOARD"
+#: Environment variable listing real boards as host:version,host:version
+BOARDS_ENV = "TESTBASE_BOARDS"
+
+_CHECK_SCRIPT = re.compile(r'check_script\("([^"]+)"')
+_RUN_SCRIPT = re.compile(r'from (\S+) import run_script')
+# Comment in a script saying it only runs on a version 5 board
+_SPIN_FIVE_COMMENT = re.compile(
+    r"^\s*#.*\bneeds spin ?(?:5|five)\b", re.IGNORECASE | re.MULTILINE)
+
+
+class Board(NamedTuple):
+    """
+    A machine the scheduler can hand to a worker.
+    """
+    #: Host name or IP address. Ignored for virtual boards.
+    name: str
+    #: The board version as used in the Machine version cfg option
+    version: int = 5
+    #: If True the worker runs on a virtual board of this version
+    virtual: bool = False
+
+
+class ScriptOutcome(NamedTuple):
+    """
+    The result of running one test method on a board.
+    """
+    #: Name of the test method
+    test: str
+    #: One of "pass", "skip", "fail" or "error"
+    status: str
+    #: Name of the board used or None if no board was suitable
+    board: Optional[str]
+    #: Seconds taken including worker start up
+    duration: float
+    #: Failure, error or skip text; empty on a pass
+    message: str = ""
+
+
+def virtual_boards(n_boards: int, version: int = 5) -> List[Board]:
+    """
+    Creates virtual boards to stand in for real ones.
+
+    :param n_boards: Number of boards wanted
+    :param version: Version of board to pretend to be
+    :returns: List of distinct virtual boards
+    """
+    return [Board(f"virtual{i}", version, True) for i in range(n_boards)]
+
+
+def boards_from_env() -> List[Board]:
+    """
+    Gets the real boards listed in TESTBASE_BOARDS.
+
+    Each board is written as host:version, for example
+    ``TESTBASE_BOARDS=192.168.240.1:5,192.168.240.253:3``.
+    The version defaults to 5 if left out.
+
+    :returns: The boards, or an empty list if none are listed
+    :raises ValueError: If a version is not a number
+    """
+    boards = []
+    for spec in os.environ.get(BOARDS_ENV, "").split(","):
+        spec = spec.strip()
+        if not spec:
+            continue
+        host, _, version = spec.partition(":")
+        try:
+            boards.append(Board(host, int(version) if version else 5))
+        except ValueError as ex:
+            raise ValueError(
+                f"{BOARDS_ENV} entry {spec} is not host:version") from ex
+    return boards
+
+
+class BoardLeaseManager(object):
+    """
+    Hands out free boards and takes them back.
+
+    Callers block until a suitable board is free.
+    """
+
+    __slots__ = ("_boards", "_condition", "_free")
+
+    def __init__(self, boards: Sequence[Board]):
+        """
+        :param boards: All the boards that can be leased
+        """
+        self._boards = list(boards)
+        self._free = list(boards)
+        self._condition = Condition()
+
+    @staticmethod
+    def _suitable(board: Board, spin_five_only: bool) -> bool:
+        return board.version == 5 or not spin_five_only
+
+    def can_satisfy(self, spin_five_only: bool) -> bool:
+        """
+        Checks if any board, free or not, meets the requirement.
+
+        :param spin_five_only: If True only version 5 boards are suitable
+        :returns: True if at least one board could ever be leased
+        """
+        return any(self._suitable(board, spin_five_only)
+                   for board in self._boards)
+
+    def acquire(self, spin_five_only: bool = False) -> Board:
+        """
+        Waits for a suitable board and takes it.
+
+        Boards that are not version 5 are preferred for scripts that do not
+        need one so the version 5 boards stay free for those that do.
+
+        :param spin_five_only: If True only version 5 boards are suitable
+        :returns: A board no other caller holds
+        :raises ValueError: If no board could ever be suitable
+        """
+        if not self.can_satisfy(spin_five_only):
+            raise ValueError("No board meets the requirement")
+        with self._condition:
+            while True:
+                suitable = [board for board in self._free
+                            if self._suitable(board, spin_five_only)]
+                if suitable:
+                    suitable.sort(key=lambda board: board.version == 5)
+                    self._free.remove(suitable[0])
+                    return suitable[0]
+                self._condition.wait()
+
+    def release(self, board: Board) -> None:
+        """
+        Returns a board so it can be leased again.
+
+        :param board: A board previously returned by acquire
+        """
+        with self._condition:
+            self._free.append(board)
+            self._condition.notify_all()
+
+    @contextmanager
+    def lease(self, spin_five_only: bool = False) -> Iterator[Board]:
+        """
+        Holds a board for the duration of a with block.
+
+        The board is returned even if the block raises.
+
+        :param spin_five_only: If True only version 5 boards are suitable
+        :returns: A context manager yielding the leased board
+        """
+        board = self.acquire(spin_five_only)
+        try:
+            yield board
+        finally:
+            self.release(board)
+
+    @property
+    def n_free(self) -> int:
+        """
+        The number of boards not currently leased.
+        """
+        with self._condition:
+            return len(self._free)
+
+
+def apply_board(board: Board) -> None:
+    """
+    Forces the config of all later scripts to use this board.
+
+    :param board: The board to use
+    """
+    add_config_override("Machine", "version", str(board.version))
+    add_config_override("Machine", "spalloc_server", None)
+    add_config_override("Machine", "remote_spinnaker_url", None)
+    if board.virtual:
+        add_config_override("Machine", "virtual_board", "True")
+        add_config_override("Machine", "machine_name", None)
+    else:
+        add_config_override("Machine", "virtual_board", "False")
+        add_config_override("Machine", "machine_name", board.name)
+
+
+def in_worker() -> bool:
+    """
+    Checks if this process is a scheduler worker.
+
+    :returns: True if running in a worker started by a BoardScheduler
+    """
+    return WORKER_BOARD_ENV in os.environ
+
+
+def run_test_method(module_name: str, class_name: str, method_name: str,
+                    **trace_args: str) -> Tuple[str, str]:
+    """
+    Runs one test method in this process.
+
+    :param module_name: Module holding the test class
+    :param class_name: Name of the test class
+    :param method_name: Name of the test method
+    :param trace_args: Extra values recorded in the trace span
+    :returns: The status, one of "pass", "skip", "fail" or "error",
+        and the failure, error or skip text
+    """
+    module = importlib.import_module(module_name)
+    test = getattr(module, class_name)(method_name)
+    result = unittest.TestResult()
+    with span(method_name, "test", **trace_args):
+        test.run(result)
+    if result.errors:
+        return "error", result.errors[0][1]
+    if result.failures:
+        return "fail", result.failures[0][1]
+    if result.skipped:
+        return "skip", result.skipped[0][1]
+    return "pass", ""
+
+
+def _run_tests_in_worker(
+        board: Board, reports_dir: Optional[str], policy: RecyclePolicy,
+        tasks: Queue, results: Queue) -> None:
+    """
+    Runs tests from the task queue until told to stop or due for renewal.
+    """
+    os.environ[WORKER_BOARD_ENV] = board.name
+    name_process(f"worker on {board.name}")
+    apply_board(board)
+    if reports_dir is not None:
+        add_config_override(
+            "Reports", "default_report_file_path", reports_dir)
+    scripts_run = 0
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        status, message = run_test_method(*task, board=board.name)
+        scripts_run += 1
+        recycle = policy.should_recycle(scripts_run, current_rss())
+        results.put((status, message, recycle))
+        if recycle:
+            return
+
+
+class _Worker(object):
+    """
+    A worker process and the queues used to talk to it.
+    """
+
+    __slots__ = ("process", "tasks", "results")
+
+    def __init__(self, board: Board, reports_dir: Optional[str],
+                 policy: RecyclePolicy):
+        """
+        :param board: The board the worker runs on
+        :param reports_dir: Where the worker writes reports, if forced
+        :param policy: When the worker should stop so it can be replaced
+        """
+        context = multiprocessing.get_context("spawn")
+        self.tasks = context.Queue()
+        self.results = context.Queue()
+        self.process = context.Process(
+            target=_run_tests_in_worker,
+            args=(board, reports_dir, policy, self.tasks, self.results))
+        self.process.start()
+
+    def stop(self) -> None:
+        """
+        Asks the worker to finish and waits for it.
+        """
+        if self.process.is_alive():
+            self.tasks.put(None)
+        self.process.join()
+
+
+_F = TypeVar("_F", bound=Callable)
+
+
+def needs_spin_five(test_method: _F) -> _F:
+    """
+    Marks a test method as only able to run on a version 5 board.
+
+    The scheduler then only gives the test a version 5 board, or skips it
+    if it has none.
+
+    :param test_method: The test method to mark
+    :returns: The same method, marked
+    """
+    setattr(test_method, "needs_spin_five", True)
+    return test_method
+
+
+def script_needs_spin_five(script_path: str) -> bool:
+    """
+    Checks if a script says it only runs on a version 5 board.
+
+    The script says so with a comment such as ``# needs spin five``.
+
+    :param script_path: The script to read
+    :returns: True if the script has the comment
+    """
+    try:
+        with open(script_path, encoding="utf-8") as script_file:
+            return _SPIN_FIVE_COMMENT.search(script_file.read()) is not None
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def method_needs_spin_five(test_class: Type[unittest.TestCase],
+                           method_name: str) -> bool:
+    """
+    Checks if a test method will only run on a version 5 board.
+
+    :param test_class: The class of the test
+    :param method_name: Name of the test method
+    :returns: True if the method is marked with needs_spin_five, itself
+        calls assert_not_spin_three, or runs a script that needs spin five
+    """
+    method = getattr(test_class, method_name)
+    if getattr(method, "needs_spin_five", False):
+        return True
+    try:
+        if "assert_not_spin_three(" in inspect.getsource(method):
+            return True
+        script = find_test_script(test_class, method_name)
+    except (OSError, TypeError):
+        return False
+    return script is not None and script_needs_spin_five(script)
+
+
+def find_test_script(test_class: Type[unittest.TestCase],
+                     method_name: str) -> Optional[str]:
+    """
+    Finds the script a generated test method runs.
+
+    Works for both the check_script and the run_script styles written by
+    RootScriptBuilder, so split and combined variants map to one script.
+
+    :param test_class: The generated TestScripts class
+    :param method_name: Name of the test method
+    :returns: Absolute path to the script or None if not recognised
+    """
+    source = inspect.getsource(getattr(test_class, method_name))
+    class_file = sys.modules[test_class.__module__].__file__
+    assert class_file is not None
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(class_file)))
+    match = _CHECK_SCRIPT.search(source)
+    if match:
+        return os.path.join(root_dir, match.group(1))
+    match = _RUN_SCRIPT.search(source)
+    if match:
+        return os.path.join(
+            root_dir, match.group(1).replace(".", os.sep) + ".py")
+    return None
+
+
+class BoardScheduler(object):
+    """
+    Runs the methods of a generated test class on several boards at once.
+
+    Tests run in worker processes, one per leased board. A worker is
+    replaced by a fresh one when its recycle policy says so; by default
+    after every test. If a worker dies the board is returned and the test
+    reported as an error.
+    """
+
+    __slots__ = ("_leases", "_n_workers", "_reports_root", "_policy",
+                 "_workers")
+
+    def __init__(self, boards: Sequence[Board],
+                 reports_root: Optional[str] = None,
+                 policy: Optional[RecyclePolicy] = None):
+        """
+        :param boards: The boards to run on; one worker per board
+        :param reports_root:
+            If provided each board's workers write their reports to a
+            sub directory of this named after the board.
+            Otherwise the scripts' cfg decides.
+        :param policy:
+            When to replace a worker. Defaults to RecyclePolicy.from_env()
+        """
+        self._leases = BoardLeaseManager(boards)
+        self._n_workers = len(boards)
+        self._reports_root = reports_root
+        self._policy = RecyclePolicy.from_env() if policy is None else policy
+        # Live worker of each board; only used while the board is leased
+        self._workers: Dict[str, _Worker] = {}
+
+    def _run_one(self, test_class: Type[unittest.TestCase],
+                 method_name: str) -> ScriptOutcome:
+        spin_five = method_needs_spin_five(test_class, method_name)
+        if not self._leases.can_satisfy(spin_five):
+            return ScriptOutcome(
+                method_name, "skip", None, 0.0, "No suitable board")
+        with self._leases.lease(spin_five) as board:
+            start = time.time()
+            worker = self._workers.pop(board.name, None)
+            if worker is None or not worker.process.is_alive():
+                reports_dir = None
+                if self._reports_root is not None:
+                    reports_dir = os.path.join(
+                        self._reports_root, board.name)
+                    os.makedirs(reports_dir, exist_ok=True)
+                worker = _Worker(board, reports_dir, self._policy)
+            worker.tasks.put(
+                (test_class.__module__, test_class.__name__, method_name))
+            # Read before join as a large message blocks the worker exit
+            outcome = None
+            while outcome is None and worker.process.is_alive():
+                try:
+                    outcome = worker.results.get(timeout=1.0)
+                except Empty:
+                    pass
+            if outcome is None:
+                try:
+                    outcome = worker.results.get(timeout=1.0)
+                except Empty:
+                    pass
+            if outcome is None:
+                worker.process.join()
+                return ScriptOutcome(
+                    method_name, "error", board.name, time.time() - start,
+                    f"Worker exited with code {worker.process.exitcode}")
+            status, message, recycle = outcome
+            if recycle:
+                worker.stop()
+            else:
+                self._workers[board.name] = worker
+            return ScriptOutcome(
+                method_name, status, board.name, time.time() - start,
+                message)
+
+    def _run_and_report(
+            self, test_class: Type[unittest.TestCase], method_name: str,
+            on_outcome: Optional[Callable[[ScriptOutcome], None]]
+            ) -> ScriptOutcome:
+        outcome = self._run_one(test_class, method_name)
+        if on_outcome is not None:
+            on_outcome(outcome)
+        return outcome
+
+    def run_tests(self, test_class: Type[unittest.TestCase],
+                  method_names: Optional[Sequence[str]] = None,
+                  on_outcome: Optional[Callable[[ScriptOutcome], None]] = None
+                  ) -> List[ScriptOutcome]:
+        """
+        Runs the test methods spreading them over the boards.
+
+        :param test_class: The generated TestScripts class
+        :param method_names:
+            The test methods to run. Defaults to all starting with test
+        :param on_outcome:
+            Called with each outcome as soon as its test finishes
+        :returns: One outcome per method in the order given
+        """
+        if method_names is None:
+            method_names = unittest.TestLoader().getTestCaseNames(test_class)
+        # Names the scheduler lane and starts the trace before any worker
+        name_process("scheduler")
+        try:
+            with ThreadPoolExecutor(self._n_workers) as executor:
+                return list(executor.map(
+                    lambda name: self._run_and_report(
+                        test_class, name, on_outcome), method_names))
+        finally:
+            for worker in self._workers.values():
+                worker.stop()
+            self._workers.clear()
@@ -0,0 +1,79 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, List, Optional, Tuple
+
+from spinn_utilities import conf_loader
+from spinn_utilities.configs import CamelCaseConfigParser
+
+# Scripts reload their configuration each time they call setup,
+# so values set with set_config before the script starts are lost.
+# These overrides are reapplied after every full configuration load.
+_overrides: Dict[Tuple[str, str], str] = {}
+_original_load_config = conf_loader.load_config
+
+
+def _load_config_with_overrides(
+        local_name: Optional[str], user_cfg: Optional[str],
+        defaults: List[str]) -> CamelCaseConfigParser:
+    configs = _original_load_config(local_name, user_cfg, defaults)
+    apply_config_overrides(configs)
+    return configs
+
+
+def apply_config_overrides(configs: CamelCaseConfigParser) -> None:
+    """
+    Writes all the current overrides into a loaded configuration.
+
+    :param configs: The configuration to change
+    """
+    for (section, option), value in _overrides.items():
+        configs.set(section, option, value)
+
+
+def add_config_override(
+        section: str, option: str, value: Optional[str]) -> None:
+    """
+    Forces a config value for all scripts run after this call.
+
+    :param section: What section to set the option in.
+    :param option: What option to set.
+    :param value: Value to set option to. None is written as "None"
+    """
+    _overrides[(section, option)] = "None" if value is None else value
+    conf_loader.load_config = _load_config_with_overrides
+
+
+def remove_config_override(section: str, option: str) -> None:
+    """
+    Stops forcing a config value. Does nothing if it was not forced.
+
+    :param section: What section the option is in.
+    :param option: What option to stop forcing.
+    """
+    _overrides.pop((section, option), None)
+
+
+def clear_config_overrides() -> None:
+    """
+    Stops forcing all config values.
+    """
+    _overrides.clear()
+
+
+def get_config_overrides() -> Dict[Tuple[str, str], str]:
+    """
+    :returns: A copy of the current overrides keyed by (section, option)
+    """
+    return dict(_overrides)
@@ -0,0 +1,201 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+from .file_lock import update_json
+
+#: Environment variable with the JSON file mapping tests to their binaries
+COVERAGE_INDEX_ENV = "TESTBASE_COVERAGE_INDEX"
+#: Environment variable with a comma separated list of changed binaries
+#: or C source directories; only tests loading them are run
+CHANGED_ENV = "TESTBASE_CHANGED"
+
+# The application name set in a SpiNNaker C makefile
+_APP = re.compile(r"^\s*APP\s*[:?]?=\s*(\S+)", re.MULTILINE)
+# Tests change directory so relative paths are from where the run started
+_START_DIR = os.getcwd()
+
+
+def _binary_name(binary: str) -> str:
+    name = os.path.basename(binary)
+    return name if name.endswith(".aplx") else name + ".aplx"
+
+
+def binaries_built_in(directory: str) -> Set[str]:
+    """
+    Finds the binaries the makefiles in a directory tree build.
+
+    :param directory: A C source or makefile directory
+    :returns: Names of the aplx files; empty if no makefile names one
+    """
+    found: Set[str] = set()
+    for folder, _, files in os.walk(directory):
+        for name in files:
+            if not name.startswith("Makefile"):
+                continue
+            with open(os.path.join(folder, name), encoding="utf-8",
+                      errors="replace") as makefile:
+                found.update(f"{app}.aplx"
+                             for app in _APP.findall(makefile.read()))
+    return found
+
+
+def changed_binaries(changes: Iterable[str]) -> Optional[Set[str]]:
+    """
+    Works out which binaries a set of changes affects.
+
+    Each change is either an aplx file, with or without a path, or a
+    C source directory whose makefiles name the binaries built there.
+
+    :param changes: Changed binaries or C source directories
+    :returns: Names of the affected binaries, or None if a change can not
+        be tied to any binary so every test must run
+    """
+    binaries: Set[str] = set()
+    for change in changes:
+        if change.endswith(".aplx"):
+            binaries.add(_binary_name(change))
+            continue
+        directory = os.path.join(_START_DIR, change)
+        if not os.path.isdir(directory):
+            # A changed source file; use the makefiles next to it
+            directory = os.path.dirname(directory)
+        built = binaries_built_in(directory)
+        if not built:
+            return None
+        binaries.update(built)
+    return binaries
+
+
+class CoverageIndex(object):
+    """
+    Remembers which binaries each test loaded the last time it ran.
+    """
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: str):
+        """
+        :param path: The JSON file to hold the index
+        """
+        self._path = path
+
+    def _read(self) -> Dict[str, List[str]]:
+        try:
+            with open(self._path, encoding="utf-8") as index_file:
+                return json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            # A damaged index just means every test is selected
+            return {}
+
+    def record(self, test_id: str, binaries: Iterable[str]) -> None:
+        """
+        Records the binaries a test loaded, replacing any earlier record.
+
+        :param test_id: The test, as returned by RootTestCase._test_id
+        :param binaries: Paths or names of the binaries loaded
+        """
+        names = sorted({_binary_name(binary) for binary in binaries})
+
+        def _update(index: Dict[str, List[str]]) -> Dict[str, List[str]]:
+            index[test_id] = names
+            return index
+        update_json(self._path, _update)
+
+    def test_ids(self) -> List[str]:
+        """
+        :returns: All the tests in the index, sorted
+        """
+        return sorted(self._read())
+
+    def selected(self, test_ids: Iterable[str],
+                 changed: Set[str]) -> List[str]:
+        """
+        Finds the tests that need to run for some changed binaries.
+
+        Tests not in the index are always selected as nothing is known
+        about what they load.
+
+        :param test_ids: The tests to choose from
+        :param changed: Names of the changed binaries
+        :returns: The tests that load a changed binary or are unknown
+        """
+        index = self._read()
+        return [test_id for test_id in test_ids
+                if test_id not in index or changed.intersection(
+                    index[test_id])]
+
+
+def get_coverage_index() -> Optional[CoverageIndex]:
+    """
+    Gets the coverage index if TESTBASE_COVERAGE_INDEX names a file.
+
+    :returns: The index or None if no index is configured
+    """
+    path = os.environ.get(COVERAGE_INDEX_ENV, None)
+    if not path:
+        return None
+    return CoverageIndex(os.path.join(_START_DIR, path))
+
+
+# pylint: disable=invalid-name
+_changed: Optional[Set[str]] = None
+_changed_read = False
+
+
+def get_changed_binaries() -> Optional[Set[str]]:
+    """
+    Gets the binaries named, directly or by source, in TESTBASE_CHANGED.
+
+    :returns: Names of the changed binaries or None to run every test
+    """
+    global _changed, _changed_read  # pylint: disable=global-statement
+    if not _changed_read:
+        changes = [change.strip() for change in
+                   os.environ.get(CHANGED_ENV, "").split(",")
+                   if change.strip()]
+        _changed = changed_binaries(changes) if changes else None
+        _changed_read = True
+    return _changed
+
+
+def main() -> None:
+    """
+    Lists the tests in an index that load any of the changed binaries.
+    """
+    parser = argparse.ArgumentParser(
+        description="List the tests that load changed binaries.")
+    parser.add_argument("index", help="The coverage index JSON file")
+    parser.add_argument(
+        "changes", nargs="+",
+        help="Changed aplx files or C source directories")
+    args = parser.parse_args()
+    changed = changed_binaries(args.changes)
+    if changed is None:
+        print("Unable to tie the changes to binaries; run every test")
+        return
+    index = CoverageIndex(args.index)
+    for test_id in index.selected(index.test_ids(), changed):
+        print(test_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .file_lock import file_lock, replace_file
+
+#: Environment variable with the size in KB the error file may grow to
+ERROR_FILE_KB_ENV = "TESTBASE_ERROR_FILE_KB"
+DEFAULT_LIMIT_KB = 256
+#: Name of the error file as used by FecDataView.get_error_file
+ERROR_FILE_NAME = "ErrorFile.txt"
+
+# Fields that say two records are the same error
+_KEY_FIELDS = ("source", "error", "message")
+# Source of the record counting the events dropped to keep under the limit
+_DROPPED = "error journal"
+
+
+def _key(record: Dict[str, Any]) -> tuple:
+    return tuple(record.get(field, "") for field in _KEY_FIELDS)
+
+
+def _text_record(lines: List[str]) -> Dict[str, Any]:
+    return {"message": "\n".join(lines).rstrip(), "count": 1}
+
+
+def journal_line(record: Dict[str, Any], width: int = 200) -> str:
+    """
+    Describes a record in one line.
+
+    :param record: A record from an ErrorJournal
+    :param width: Characters of the message to include
+    :returns: The count, error, source and the start of the message
+    """
+    message = " ".join(str(record.get("message", "")).split())
+    if len(message) > width:
+        message = message[:width] + "..."
+    text = f"{record.get('count', 1)} x {record.get('error', '')}"
+    if record.get("source"):
+        text += f" in {record['source']}"
+    return f"{text}: {message}"
+
+
+class ErrorJournal(object):
+    """
+    The error file held as one JSON record per distinct error.
+
+    Repeats of an error only update its count and last time.
+    When the file would grow over its limit the oldest records are
+    dropped, leaving a record counting how many events were lost.
+    The message and details of each record, such as the transceiver, are
+    cut to an eighth of the limit so one record can not fill the file.
+    """
+
+    __slots__ = ("_path", "_limit")
+
+    def __init__(self, path: str, limit: Optional[int] = None):
+        """
+        :param path: The error file
+        :param limit: Size in bytes the file may grow to.
+            Defaults to TESTBASE_ERROR_FILE_KB which defaults to 256
+        """
+        self._path = path
+        if limit is None:
+            limit = int(os.environ.get(
+                ERROR_FILE_KB_ENV, DEFAULT_LIMIT_KB)) * 1024
+        self._limit = limit
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Reads the records one at a time.
+
+        Text that is not a record, such as a traceback appended by
+        spinnman or an error file from an older version, is returned as
+        the message of a record of its own. Each run of such lines is
+        kept together, indentation and all.
+
+        :returns: Each record in the order they were first recorded
+        """
+        if not os.path.exists(self._path):
+            return
+        text: List[str] = []
+        with open(self._path, encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if not isinstance(record, dict):
+                    if text or line.strip():
+                        text.append(line.rstrip("\n"))
+                    continue
+                if text:
+                    yield _text_record(text)
+                    text = []
+                yield record
+        if text:
+            yield _text_record(text)
+
+    def _write(self, records: List[Dict[str, Any]]) -> None:
+        marker: Optional[Dict[str, Any]] = None
+        if records and records[0].get("source") == _DROPPED:
+            marker = records.pop(0)
+        # json.dumps escapes to ASCII so characters are bytes
+        lines = [json.dumps(record) + "\n" for record in records]
+        size = sum(len(line) for line in lines)
+        while True:
+            head = [] if marker is None else [json.dumps(marker) + "\n"]
+            if not lines or size + sum(len(line) for line in head) <= \
+                    self._limit:
+                break
+            oldest = records.pop(0)
+            size -= len(lines.pop(0))
+            if marker is None:
+                marker = {"source": _DROPPED, "error": "Dropped",
+                          "message": "older errors dropped to stay under "
+                                     "the size limit",
+                          "count": 0}
+            marker["count"] += oldest.get("count", 1)
+        replace_file(self._path, "".join(head + lines))
+
+    def merge(self, new_records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Adds records, counting any that match an existing record.
+
+        The file is locked so records merged at the same time by other
+        processes sharing it are kept.
+
+        :param new_records: Records, for example from another journal
+        """
+        with file_lock(self._path):
+            self._merge(new_records)
+
+    def _merge(self, new_records: Iterable[Dict[str, Any]]) -> None:
+        records = list(self.records())
+        index = {_key(record): record for record in records}
+        for new in new_records:
+            new = dict(new)
+            for field in ("message", "detail"):
+                new[field] = str(new.get(field, ""))[:self._limit // 8]
+            existing = index.get(_key(new))
+            if existing is None:
+                records.append(new)
+                index[_key(new)] = new
+            else:
+                existing["count"] = existing.get("count", 1) + \
+                    new.get("count", 1)
+                existing["last"] = max(
+                    existing.get("last", 0.0), new.get("last", 0.0))
+        self._write(records)
+
+    def record(self, source: str, error: BaseException,
+               detail: str = "") -> None:
+        """
+        Records that an error happened.
+
+        :param source: What raised the error, such as the test class file
+        :param error: The error
+        :param detail: Anything else worth knowing, kept only the first time
+        """
+        now = time.time()
+        self.merge([{"source": source, "error": type(error).__name__,
+                     "message": str(error), "detail": detail,
+                     "count": 1, "first": now, "last": now}])
+
+    def take(self) -> List[Dict[str, Any]]:
+        """
+        Reads all the records and removes the file.
+
+        :returns: All the records
+        """
+        records = list(self.records())
+        if os.path.exists(self._path):
+            os.remove(self._path)
+        return records
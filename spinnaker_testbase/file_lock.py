@@ -0,0 +1,107 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, Iterator, Optional
+
+if sys.platform == "win32":
+    import msvcrt  # pylint: disable=import-error
+
+    def _lock(descriptor: int) -> None:
+        while True:
+            try:
+                # Gives up after about ten seconds, so keep trying
+                msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                pass
+
+    def _unlock(descriptor: int) -> None:
+        msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(descriptor: int) -> None:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+
+    def _unlock(descriptor: int) -> None:
+        fcntl.flock(descriptor, fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """
+    Holds a lock on a file against other processes and threads.
+
+    Used around reading, changing and rewriting the JSON files shared by
+    parallel workers, so no update is lost. The lock is taken on a
+    separate file, path with .lock added, which is left in place.
+
+    :param path: The file being updated
+    :returns: Nothing; the lock is held inside the context
+    """
+    with open(f"{path}.lock", "a+b") as lock_file:
+        lock_file.seek(0)
+        _lock(lock_file.fileno())
+        try:
+            yield
+        finally:
+            lock_file.seek(0)
+            _unlock(lock_file.fileno())
+
+
+def replace_file(path: str, text: str) -> None:
+    """
+    Rewrites a file so readers see either the old or the new text.
+
+    The text is written to path with the process id added and then
+    moved over the file.
+
+    :param path: The file to rewrite
+    :param text: The new contents
+    """
+    temp_path = f"{path}.{os.getpid()}"
+    with open(temp_path, "w", encoding="utf-8") as temp_file:
+        temp_file.write(text)
+    os.replace(temp_path, path)
+
+
+def update_json(path: str, update: Callable[
+        [Dict[str, Any]], Optional[Dict[str, Any]]]) -> None:
+    """
+    Changes a JSON file shared with other processes without losing
+    their changes.
+
+    The file is reread under file_lock, passed to update and the result
+    written back with replace_file. A missing or damaged file reads as
+    empty.
+
+    :param path: The JSON file holding a dict
+    :param update:
+        Given the current contents; returns the new contents,
+        or None to leave the file unchanged
+    """
+    with file_lock(path):
+        try:
+            with open(path, encoding="utf-8") as json_file:
+                data = json.load(json_file)
+        except (FileNotFoundError, ValueError):
+            data = {}
+        data = update(data)
+        if data is not None:
+            replace_file(
+                path, json.dumps(data, indent=1, sort_keys=True) + "\n")
@@ -0,0 +1,139 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from typing import Dict, List, Optional
+
+import numpy
+from numpy.typing import ArrayLike, NDArray
+
+#: Environment variable that makes golden assertions rewrite their files
+REGENERATE_ENV = "TESTBASE_REGENERATE_GOLDEN"
+
+# Number of differing values listed in a mismatch report
+_SHOW = 5
+
+
+def regenerate_enabled() -> bool:
+    """
+    Checks if TESTBASE_REGENERATE_GOLDEN is set to true.
+
+    :returns: True if golden files should be written rather than checked
+    """
+    return os.environ.get(REGENERATE_ENV, 'false').lower() == 'true'
+
+
+def _is_numeric(array: NDArray) -> bool:
+    return numpy.issubdtype(array.dtype, numpy.number) or \
+        numpy.issubdtype(array.dtype, numpy.bool_)
+
+
+def compare_arrays(actual: ArrayLike, expected: ArrayLike,
+                   rtol: float = 0.0, atol: float = 0.0) -> Optional[str]:
+    """
+    Compares two arrays in one pass, as numpy.isclose does.
+
+    NaN matches NaN. Arrays that are not numeric must be equal.
+
+    :param actual: The values recorded
+    :param expected: The golden values
+    :param rtol: Relative tolerance
+    :param atol: Absolute tolerance
+    :returns: A short description of the differences or None if they match
+    """
+    actual = numpy.asarray(actual)
+    expected = numpy.asarray(expected)
+    if actual.shape != expected.shape:
+        return f"shape {actual.shape} expected {expected.shape}"
+    numeric = _is_numeric(actual) and _is_numeric(expected)
+    if numeric:
+        close = numpy.isclose(
+            actual, expected, rtol=rtol, atol=atol, equal_nan=True)
+    else:
+        close = numpy.asarray(actual == expected)
+    bad = numpy.flatnonzero(~close)
+    if not bad.size:
+        return None
+    lines = [f"{bad.size} of {close.size} values differ"]
+    if numeric:
+        diff = numpy.abs(actual.astype(numpy.float64).ravel()[bad] -
+                         expected.astype(numpy.float64).ravel()[bad])
+        diff = numpy.where(numpy.isnan(diff), numpy.inf, diff)
+        worst = int(numpy.argmax(diff))
+        lines[0] += (f"; largest difference {diff[worst]} at "
+                     f"{_index(bad[worst], actual.shape)}")
+    for flat in bad[:_SHOW]:
+        lines.append(f"    at {_index(flat, actual.shape)}: "
+                     f"{actual.ravel()[flat]!r} expected "
+                     f"{expected.ravel()[flat]!r}")
+    if bad.size > _SHOW:
+        lines.append(f"    ... and {bad.size - _SHOW} more")
+    return "\n".join(lines)
+
+
+def _index(flat: int, shape: tuple) -> tuple:
+    return tuple(int(i) for i in numpy.unravel_index(flat, shape))
+
+
+def save_golden(path: str, arrays: Dict[str, ArrayLike]) -> None:
+    """
+    Writes arrays into a compressed golden file.
+
+    Arrays already in the file under other names are kept.
+
+    :param path: The .npz file
+    :param arrays: The arrays to store by name
+    """
+    stored: Dict[str, NDArray] = {}
+    if os.path.exists(path):
+        with numpy.load(path, allow_pickle=False) as golden:
+            stored.update((name, golden[name]) for name in golden.files
+                          if name not in arrays)
+    stored.update((name, numpy.asarray(array))
+                  for name, array in arrays.items())
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # savez adds .npz to names without it, so keep the suffix
+    temp_path = f"{path}.{os.getpid()}.npz"
+    # The stubs mistake the names for the allow_pickle keyword
+    numpy.savez_compressed(temp_path, **stored)  # type: ignore[arg-type]
+    os.replace(temp_path, path)
+
+
+def check_golden(path: str, arrays: Dict[str, ArrayLike],
+                 rtol: float = 0.0, atol: float = 0.0) -> List[str]:
+    """
+    Compares arrays with those of the same name in a golden file.
+
+    Only the arrays named are read from the file.
+
+    :param path: The .npz file
+    :param arrays: The recorded arrays by name
+    :param rtol: Relative tolerance
+    :param atol: Absolute tolerance
+    :returns: One description per array that does not match
+    """
+    if not os.path.exists(path):
+        return [f"No golden file {path}; "
+                f"set {REGENERATE_ENV}=true to create it"]
+    problems = []
+    with numpy.load(path, allow_pickle=False) as golden:
+        for name, actual in arrays.items():
+            if name not in golden.files:
+                problems.append(f"{name}: not in {path}")
+                continue
+            problem = compare_arrays(actual, golden[name], rtol, atol)
+            if problem is not None:
+                problems.append(f"{name}: {problem}")
+    return problems
@@ -0,0 +1,145 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import mmap
+import multiprocessing
+import os
+import re
+from typing import (
+    Iterable, Iterator, List, NamedTuple, Optional, Pattern, Sequence, Tuple)
+
+_FILE_NAME = re.compile(r"iobuf_for_chip_(\d+)_(\d+)_processor_id_(\d+)\.txt")
+_SEVERITY = re.compile(rb"\[(ERROR|WARNING|INFO|DEBUG)\]")
+
+#: Pattern matching the lines SpiNNaker code logs at error level
+ERROR_PATTERN = r"\[ERROR\]"
+
+# Below this many bytes starting processes takes longer than the scan
+_PARALLEL_BYTES = 128 * 1024 * 1024
+
+
+class IobufMatch(NamedTuple):
+    """
+    A line of an iobuf file that matched a pattern.
+    """
+    #: X coordinate of the chip
+    x: int
+    #: Y coordinate of the chip
+    y: int
+    #: Processor id on the chip
+    p: int
+    #: Line number in the file, starting at 1
+    line_number: int
+    #: ERROR, WARNING, INFO or DEBUG if the line has a tag, otherwise None
+    severity: Optional[str]
+    #: The whole line without the line end
+    line: str
+    #: The pattern that matched
+    pattern: str
+    #: Path of the iobuf file
+    path: str
+
+    def __str__(self) -> str:
+        return f"{self.x}, {self.y}, {self.p}:{self.line_number}: {self.line}"
+
+
+def _matching_lines(data: mmap.mmap, pattern: Pattern[bytes]
+                    ) -> Iterator[Tuple[int, bytes]]:
+    """
+    Finds the lines a pattern matches, with their line numbers.
+    """
+    line_number = 1
+    counted_to = 0
+    for found in pattern.finditer(data):
+        start = data.rfind(b"\n", 0, found.start()) + 1
+        end = data.find(b"\n", found.start())
+        if end < 0:
+            end = len(data)
+        line_number += data[counted_to:start].count(b"\n")
+        counted_to = start
+        yield line_number, data[start:end]
+
+
+def _scan_file(path: str, patterns: Sequence[Pattern[bytes]]
+               ) -> List[IobufMatch]:
+    """
+    Scans one iobuf file using a memory map.
+    """
+    name_match = _FILE_NAME.search(os.path.basename(path))
+    if name_match is None:
+        return []
+    x, y, p = (int(value) for value in name_match.groups())
+    matches: List[IobufMatch] = []
+    with open(path, "rb") as iobuf_file:
+        if os.fstat(iobuf_file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(iobuf_file.fileno(), 0,
+                       access=mmap.ACCESS_READ) as data:
+            for pattern in patterns:
+                for line_number, line in _matching_lines(data, pattern):
+                    severity = _SEVERITY.search(line)
+                    matches.append(IobufMatch(
+                        x, y, p, line_number,
+                        severity.group(1).decode() if severity else None,
+                        line.decode("utf-8", "replace").rstrip("\r"),
+                        pattern.pattern.decode(), path))
+    return matches
+
+
+def _scan_files(paths: Sequence[str], patterns: Sequence[Pattern[bytes]]
+                ) -> List[IobufMatch]:
+    """
+    Scans some iobuf files one after another.
+    """
+    return [match for path in paths for match in _scan_file(path, patterns)]
+
+
+def scan_iobufs(directories: Iterable[str], patterns: Sequence[str],
+                max_workers: Optional[int] = None) -> List[IobufMatch]:
+    """
+    Searches all the iobuf files in some directories in parallel.
+
+    The regular expression engine holds the GIL, so the files are split
+    between worker processes. Small runs are scanned in this process as
+    starting the workers would take longer.
+
+    :param directories: Directories holding iobuf files
+    :param patterns: Regular expressions to look for
+    :param max_workers: Number of processes to use. Defaults to one per core
+    :returns: Matches sorted by chip, core, line and pattern
+    """
+    compiled = [re.compile(pattern.encode("utf-8")) for pattern in patterns]
+    paths = [os.path.join(directory, name)
+             for directory in directories if os.path.isdir(directory)
+             for name in os.listdir(directory) if _FILE_NAME.search(name)]
+    sizes = {path: os.path.getsize(path) for path in paths}
+    n_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    matches: List[IobufMatch] = []
+    if n_workers < 2 or sum(sizes.values()) < _PARALLEL_BYTES:
+        matches = _scan_files(paths, compiled)
+    else:
+        # Dealing out the largest first keeps the chunks a similar size
+        paths.sort(key=sizes.__getitem__, reverse=True)
+        chunks = [paths[index::n_workers] for index in range(n_workers)]
+        with ProcessPoolExecutor(
+                n_workers,
+                mp_context=multiprocessing.get_context("spawn")) as executor:
+            for found in executor.map(_scan_files, chunks, repeat(compiled)):
+                matches.extend(found)
+    matches.sort(key=lambda match: (
+        match.x, match.y, match.p, match.path, match.line_number,
+        match.pattern))
+    return matches
@@ -0,0 +1,135 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from logging import LogRecord
+import re
+from types import TracebackType
+from typing import (
+    Dict, List, Optional, Pattern, Sequence, Tuple, Type, Union)
+
+from typing_extensions import Self
+
+
+def record_messages(record: LogRecord) -> Tuple[str, str]:
+    """
+    Gets both the raw and the formatted message of a record.
+
+    :param record: The record to read
+    :returns: The unformatted message and the message after formatting.
+        If formatting fails the unformatted message is returned twice.
+    """
+    raw = str(record.msg)
+    try:
+        return raw, record.getMessage()
+    except (TypeError, ValueError):
+        return raw, raw
+
+
+class IndexedLogCapture(logging.Handler):
+    """
+    Captures log records indexed by level.
+
+    Counts are remembered so asking again only looks at records that
+    arrived since. Both the raw and the formatted message are searched.
+
+    Use as a context manager around the code that logs.
+    """
+
+    def __init__(self, logger_name: Optional[str] = None):
+        """
+        :param logger_name: Logger to capture. Defaults to the root logger.
+        """
+        super().__init__(logging.NOTSET)
+        self._logger = logging.getLogger(logger_name)
+        self._old_level = self._logger.level
+        self._records: List[LogRecord] = []
+        # The distinct messages of each record by level
+        self._messages: Dict[str, List[Tuple[str, ...]]] = {}
+        # (level, pattern, flags) to [matches, messages scanned]
+        self._counts: Dict[Tuple[str, str, int], List[int]] = {}
+
+    def __enter__(self) -> Self:
+        self._old_level = self._logger.level
+        self._logger.setLevel(1)
+        self._logger.addHandler(self)
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self._logger.removeHandler(self)
+        self._logger.setLevel(self._old_level)
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Stores and indexes a record.
+
+        :param record: The record just logged
+        """
+        raw, formatted = record_messages(record)
+        message = (raw, ) if raw == formatted else (raw, formatted)
+        self._records.append(record)
+        self._messages.setdefault(record.levelname, []).append(message)
+
+    @property
+    def records(self) -> List[LogRecord]:
+        """
+        All the records captured so far in the order they arrived.
+        """
+        return self._records
+
+    def count_matches(
+            self, patterns: Sequence[Union[str, Pattern[str]]],
+            log_level: str = 'ERROR') -> List[int]:
+        """
+        Counts the records at a level that match each pattern.
+
+        All the patterns are checked in a single pass over the records
+        not yet seen for any of them.
+
+        :param patterns: Regular expressions, as strings or compiled
+        :param log_level: Level name to look at
+        :returns: Number of matching records for each pattern in order
+        """
+        compiled = [re.compile(pattern) for pattern in patterns]
+        # The handler lock is held by logging while a record is emitted
+        self.acquire()
+        try:
+            messages = self._messages.get(log_level, [])
+            states = [self._counts.setdefault(
+                (log_level, pattern.pattern, pattern.flags), [0, 0])
+                for pattern in compiled]
+            start = min((state[1] for state in states), default=0)
+            for index in range(start, len(messages)):
+                message = messages[index]
+                for pattern, state in zip(compiled, states):
+                    if index >= state[1] and any(
+                            pattern.search(text) for text in message):
+                        state[0] += 1
+            for state in states:
+                state[1] = len(messages)
+            return [state[0] for state in states]
+        finally:
+            self.release()
+
+    def count(self, sub_message: str, log_level: str = 'ERROR') -> int:
+        """
+        Counts the records at a level that contain some text.
+
+        :param sub_message: Text to look for
+        :param log_level: Level name to look at
+        :returns: Number of matching records
+        """
+        return self.count_matches([re.escape(sub_message)], log_level)[0]
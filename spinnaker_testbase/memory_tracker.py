@@ -0,0 +1,149 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sys
+import tracemalloc
+from types import TracebackType
+from typing import List, NamedTuple, Optional, Type
+
+from typing_extensions import Self
+
+#: Environment variable that turns on the per script memory report
+MEMORY_LOG_ENV = "TESTBASE_MEMORY_LOG"
+#: Environment variable with how many scripts a worker runs before renewal
+RECYCLE_SCRIPTS_ENV = "TESTBASE_RECYCLE_SCRIPTS"
+#: Environment variable with the worker size in MB that forces a renewal
+RECYCLE_RSS_ENV = "TESTBASE_RECYCLE_RSS_MB"
+
+# Number of allocation sites listed when tracemalloc is tracing
+_TOP_ALLOCATORS = 10
+
+
+def memory_log_enabled() -> bool:
+    """
+    Checks if TESTBASE_MEMORY_LOG is set to true.
+
+    :returns: True if the memory used by each script should be reported
+    """
+    return os.environ.get(MEMORY_LOG_ENV, 'false').lower() == 'true'
+
+
+def current_rss() -> int:
+    """
+    Gets the resident set size of this process.
+
+    :returns: Size in bytes or 0 if it can not be found on this system
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        pass
+    try:
+        # pylint: disable=import-outside-toplevel
+        import resource
+    except ImportError:
+        return 0
+    # Only the peak is available; in kilobytes except on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RecyclePolicy(NamedTuple):
+    """
+    When a worker process should be replaced by a fresh one.
+
+    Applies to the workers of a BoardScheduler, used with TESTBASE_BOARDS
+    or TESTBASE_VIRTUAL_WORKERS, and to work queue workers.
+    """
+    #: Scripts a worker runs before it is replaced
+    max_scripts: int = 1
+    #: Resident size in bytes at which a worker is replaced; 0 for no limit
+    max_rss: int = 0
+
+    @classmethod
+    def from_env(cls) -> "RecyclePolicy":
+        """
+        Reads TESTBASE_RECYCLE_SCRIPTS and TESTBASE_RECYCLE_RSS_MB.
+
+        :returns: The policy; by default a worker runs a single script
+        """
+        return cls(
+            max(1, int(os.environ.get(RECYCLE_SCRIPTS_ENV, "1"))),
+            int(float(os.environ.get(RECYCLE_RSS_ENV, "0")) * 1024 * 1024))
+
+    def should_recycle(self, scripts_run: int, rss: int) -> bool:
+        """
+        :param scripts_run: Scripts the worker has run
+        :param rss: Current resident size of the worker in bytes
+        :returns: True if the worker should be replaced
+        """
+        if scripts_run >= self.max_scripts:
+            return True
+        return 0 < self.max_rss <= rss
+
+
+class MemoryTracker(object):
+    """
+    Measures how much the process grows while a block runs.
+
+    If tracemalloc is tracing, the allocation sites that grew most are
+    also found.
+    """
+
+    __slots__ = ("_before", "_after", "_snapshot", "_top")
+
+    def __init__(self) -> None:
+        self._before = 0
+        self._after = 0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self._top: List[str] = []
+
+    def __enter__(self) -> Self:
+        if tracemalloc.is_tracing():
+            self._snapshot = tracemalloc.take_snapshot()
+        self._before = current_rss()
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self._after = current_rss()
+        if self._snapshot is not None and tracemalloc.is_tracing():
+            stats = tracemalloc.take_snapshot().compare_to(
+                self._snapshot, "lineno")
+            self._top = [str(stat) for stat in stats[:_TOP_ALLOCATORS]]
+            self._snapshot = None
+
+    @property
+    def growth(self) -> int:
+        """
+        Bytes the resident size grew by.
+        """
+        return self._after - self._before
+
+    def summary(self, script: str) -> str:
+        """
+        Describes the memory used by a script.
+
+        :param script: Name of the script the block ran
+        :returns: One line of sizes plus one line per top allocation site
+        """
+        mega = 1024 * 1024
+        lines = [f"{script} rss before {self._before / mega:.1f} MB "
+                 f"after {self._after / mega:.1f} MB "
+                 f"growth {self.growth / mega:.1f} MB"]
+        lines.extend(f"    {line}" for line in self._top)
+        return "\n".join(lines)
@@ -0,0 +1,312 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+from threading import Lock, Thread
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .board_scheduler import in_worker
+
+#: Environment variable with the localhost port to serve metrics on
+METRICS_PORT_ENV = "TESTBASE_METRICS_PORT"
+#: Environment variable with the file to write the metrics to at exit
+METRICS_FILE_ENV = "TESTBASE_METRICS_FILE"
+
+#: Upper bounds in seconds of the script duration histogram buckets
+DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+def _label_text(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace(
+        "\n", "\\n") for _, value in labels)
+    return "{" + ",".join(
+        f'{name}="{value}"'
+        for (name, _), value in zip(labels, escaped)) + "}"
+
+
+class _Histogram(object):
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, n_buckets: int):
+        """
+        :param n_buckets: Number of buckets, not counting the +Inf one
+        """
+        self.counts = [0] * n_buckets
+        self.total = 0.0
+        self.count = 0
+
+
+class MetricsRegistry(object):
+    """
+    Counters, gauges and histograms for a suite run.
+
+    Rendered in the Prometheus text format.
+    """
+
+    __slots__ = ("_lock", "_help", "_counters", "_gauges", "_histograms",
+                 "_buckets", "_server")
+
+    def __init__(self, buckets: Sequence[float] = DURATION_BUCKETS):
+        """
+        :param buckets: Upper bounds of the histogram buckets
+        """
+        self._lock = Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[_Labels, float]] = {}
+        self._gauges: Dict[str, Dict[_Labels, float]] = {}
+        self._histograms: Dict[str, Dict[_Labels, _Histogram]] = {}
+        self._buckets = tuple(sorted(buckets))
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def inc(self, name: str, help_text: str, amount: float = 1.0,
+            **labels: str) -> None:
+        """
+        Adds to a counter.
+
+        :param name: Name of the counter
+        :param help_text: Description of the counter
+        :param amount: How much to add
+        :param labels: Labels picking which series to add to
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._help.setdefault(name, ("counter", help_text))
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def set(self, name: str, help_text: str, value: float,
+            **labels: str) -> None:
+        """
+        Sets a gauge.
+
+        :param name: Name of the gauge
+        :param help_text: Description of the gauge
+        :param value: The new value
+        :param labels: Labels picking which series to set
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._help.setdefault(name, ("gauge", help_text))
+            self._gauges.setdefault(name, {})[key] = value
+
+    def clear(self, name: str) -> None:
+        """
+        Removes all the series of a gauge.
+
+        :param name: Name of the gauge
+        """
+        with self._lock:
+            self._gauges.pop(name, None)
+
+    def observe(self, name: str, help_text: str, value: float,
+                **labels: str) -> None:
+        """
+        Adds a value to a histogram.
+
+        :param name: Name of the histogram
+        :param help_text: Description of the histogram
+        :param value: The value seen
+        :param labels: Labels picking which series to add to
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._help.setdefault(name, ("histogram", help_text))
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = _Histogram(len(self._buckets))
+                series[key] = histogram
+            for index, bound in enumerate(self._buckets):
+                if value <= bound:
+                    histogram.counts[index] += 1
+            histogram.total += value
+            histogram.count += 1
+
+    def render(self) -> str:
+        """
+        :returns: All the metrics in the Prometheus text format
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._help):
+                kind, help_text = self._help[name]
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in sorted(
+                        self._counters.get(name, {}).items()):
+                    lines.append(f"{name}{_label_text(labels)} {value:g}")
+                for labels, value in sorted(
+                        self._gauges.get(name, {}).items()):
+                    lines.append(f"{name}{_label_text(labels)} {value:g}")
+                for labels, histogram in sorted(
+                        self._histograms.get(name, {}).items()):
+                    for bound, count in zip(self._buckets, histogram.counts):
+                        bucket = labels + (("le", f"{bound:g}"),)
+                        lines.append(
+                            f"{name}_bucket{_label_text(bucket)} {count}")
+                    bucket = labels + (("le", "+Inf"),)
+                    lines.append(f"{name}_bucket{_label_text(bucket)} "
+                                 f"{histogram.count}")
+                    lines.append(f"{name}_sum{_label_text(labels)} "
+                                 f"{histogram.total:g}")
+                    lines.append(f"{name}_count{_label_text(labels)} "
+                                 f"{histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Writes the metrics to a file.
+
+        :param path: Where to write them
+        """
+        with open(path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(self.render())
+
+    def serve(self, port: int) -> int:
+        """
+        Serves the metrics on localhost from a background thread.
+
+        :param port: Port to listen on; 0 picks a free one
+        :returns: The port being listened on
+        """
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                """
+                Sends the current metrics whatever the path.
+                """
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                # Keep scrapes out of the test output
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        Thread(target=self._server.serve_forever, daemon=True,
+               name="testbase metrics").start()
+        return self._server.server_address[1]
+
+    def shutdown(self) -> None:
+        """
+        Stops serving the metrics.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# pylint: disable=invalid-name
+_metrics: Optional[MetricsRegistry] = None
+
+
+def _at_exit(registry: MetricsRegistry, path: Optional[str]) -> None:
+    registry.shutdown()
+    if path:
+        registry.write(path)
+
+
+def get_metrics() -> Optional[MetricsRegistry]:
+    """
+    Gets the metrics registry if metrics are turned on.
+
+    Metrics are on if TESTBASE_METRICS_PORT or TESTBASE_METRICS_FILE is set.
+    The port is served on localhost and the file is written at exit.
+    Board workers do not keep metrics; the scheduler records their outcomes.
+
+    :returns: The shared registry or None if metrics are off
+    """
+    global _metrics  # pylint: disable=global-statement
+    port = os.environ.get(METRICS_PORT_ENV)
+    path = os.environ.get(METRICS_FILE_ENV)
+    if not (port or path) or in_worker():
+        return None
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+        if port:
+            _metrics.serve(int(port))
+        _metrics.set("testbase_start_time_seconds",
+                     "When the metrics were started", time.time())
+        atexit.register(_at_exit, _metrics, path)
+    return _metrics
+
+
+def record_script(status: str, duration: float) -> None:
+    """
+    Records that a script has finished.
+
+    :param status: pass, fail, error, skip or cached
+    :param duration: Seconds the script took
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return
+    metrics.inc("testbase_scripts_total", "Scripts finished by outcome",
+                status=status)
+    if status != "cached":
+        metrics.observe("testbase_script_duration_seconds",
+                        "Time taken to run each script", duration)
+    metrics.clear("testbase_current_script")
+
+
+def record_attempt() -> None:
+    """
+    Records that runsafe is about to make an attempt.
+    """
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.inc("testbase_runsafe_attempts_total",
+                    "Attempts made by runsafe including retries")
+
+
+def record_retry(exception: BaseException) -> None:
+    """
+    Records that runsafe will retry after an exception.
+
+    :param exception: The exception that caused the retry
+    """
+    metrics = get_metrics()
+    if metrics is not None:
+        metrics.inc("testbase_runsafe_retries_total",
+                    "Retries made by runsafe by exception type",
+                    exception=type(exception).__name__)
+
+
+def record_script_start(script: str) -> None:
+    """
+    Records which script is now running.
+
+    :param script: The script about to run
+    """
+    metrics = get_metrics()
+    if metrics is None:
+        return
+    metrics.clear("testbase_current_script")
+    metrics.set("testbase_current_script",
+                "Start time of the script now running", time.time(),
+                script=script)
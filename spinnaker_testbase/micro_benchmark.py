@@ -0,0 +1,220 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy
+
+from .file_lock import update_json
+
+#: Environment variable with the JSON file of stored benchmark baselines
+BASELINES_ENV = "TESTBASE_BENCHMARK_BASELINES"
+#: Environment variable that stores the results as the new baselines
+UPDATE_ENV = "TESTBASE_BENCHMARK_UPDATE"
+#: Environment variable with how many times slower than baseline is allowed
+TOLERANCE_ENV = "TESTBASE_BENCHMARK_TOLERANCE"
+DEFAULT_TOLERANCE = 2.0
+#: Differences smaller than this are timing noise, in seconds
+DEFAULT_NOISE = 0.001
+
+
+class BenchmarkStats(NamedTuple):
+    """
+    The distribution of the times taken by repeated calls, in seconds.
+    """
+    #: Name of the benchmark
+    name: str
+    #: Number of timed calls
+    repeats: int
+    minimum: float
+    median: float
+    p90: float
+    p99: float
+    maximum: float
+    mean: float
+
+    @classmethod
+    def from_times(cls, name: str, times: Sequence[float]) -> "BenchmarkStats":
+        """
+        Summarises the times of each call.
+
+        :param name: Name of the benchmark
+        :param times: Seconds taken by each call
+        :returns: The statistics of the times
+        """
+        values = numpy.asarray(times, dtype=numpy.float64)
+        p50, p90, p99 = numpy.percentile(values, [50, 90, 99])
+        return cls(name, len(values), float(values.min()), float(p50),
+                   float(p90), float(p99), float(values.max()),
+                   float(values.mean()))
+
+    def summary(self) -> str:
+        """
+        :returns: One line with the main statistics in milliseconds
+        """
+        return (f"{self.name} over {self.repeats} runs: "
+                f"min {self.minimum * 1000:.3f} ms "
+                f"median {self.median * 1000:.3f} ms "
+                f"p90 {self.p90 * 1000:.3f} ms "
+                f"max {self.maximum * 1000:.3f} ms")
+
+
+def measure(function: Callable[[], Any], repeats: int = 20,
+            warmup: int = 3) -> List[float]:
+    """
+    Times repeated calls of a function.
+
+    The warm up calls are not timed. As in timeit, garbage collection is
+    off while each call is timed.
+
+    :param function: What to time
+    :param repeats: Number of timed calls
+    :param warmup: Number of calls before timing starts
+    :returns: Seconds taken by each timed call
+    """
+    for _ in range(warmup):
+        function()
+    times = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+    finally:
+        if enabled:
+            gc.enable()
+    return times
+
+
+class BaselineStore(object):
+    """
+    The times of earlier benchmark runs, in seconds, keyed by name.
+
+    Used by both BaseTestCase.assert_benchmark and the benchmarks folder.
+    """
+
+    __slots__ = ("_path", "_noise")
+
+    def __init__(self, path: str, noise: float = DEFAULT_NOISE):
+        """
+        :param path: The JSON file holding the baselines
+        :param noise: Seconds slower than allowed that are still ignored
+        """
+        self._path = path
+        self._noise = noise
+
+    @property
+    def path(self) -> str:
+        """
+        The JSON file holding the baselines.
+        """
+        return self._path
+
+    def read(self) -> Dict[str, float]:
+        """
+        :returns: The stored times in seconds
+        """
+        try:
+            with open(self._path, encoding="utf-8") as baseline_file:
+                return json.load(baseline_file)
+        except FileNotFoundError:
+            return {}
+
+    def store_all(self, results: Dict[str, float]) -> None:
+        """
+        Keeps times as the baselines, replacing any with the same name.
+
+        :param results: Seconds taken by each benchmark
+        """
+        def _update(baselines: Dict[str, float]) -> Dict[str, float]:
+            baselines.update(results)
+            return baselines
+        update_json(self._path, _update)
+
+    def store(self, stats: BenchmarkStats) -> None:
+        """
+        Keeps the median of a run as the baseline for its benchmark.
+
+        :param stats: The run to keep
+        """
+        self.store_all({stats.name: stats.median})
+
+    def regressions(self, results: Dict[str, float]) -> List[str]:
+        """
+        Compares times with their baselines.
+
+        Each time must be within TESTBASE_BENCHMARK_TOLERANCE times the
+        baseline, plus the noise. Times without a baseline always pass.
+
+        :param results: Seconds taken by each benchmark
+        :returns: Why each time that is too slow is too slow
+        """
+        tolerance = float(os.environ.get(TOLERANCE_ENV, DEFAULT_TOLERANCE))
+        baselines = self.read()
+        problems = []
+        for name, seconds in results.items():
+            baseline = baselines.get(name)
+            if baseline is None or \
+                    seconds <= baseline * tolerance + self._noise:
+                continue
+            problems.append(
+                f"{name} took {seconds * 1000:.3f} ms, over {tolerance} "
+                f"times the baseline {baseline * 1000:.3f} ms")
+        return problems
+
+    def check(self, stats: BenchmarkStats) -> Optional[str]:
+        """
+        Compares the median of a run with its baseline.
+
+        :param stats: The run to check
+        :returns: Why the run is too slow or None if it is not
+        """
+        problems = self.regressions({stats.name: stats.median})
+        return problems[0] if problems else None
+
+
+def get_baseline_store(
+        default: Optional[str] = None,
+        noise: float = DEFAULT_NOISE) -> Optional[BaselineStore]:
+    """
+    Gets the baselines in the file TESTBASE_BENCHMARK_BASELINES names.
+
+    The path is resolved when this is called, so a relative path is from
+    the current directory; give an absolute path if the tests change
+    directory first, as ScriptChecker does.
+
+    :param default: The file to use if TESTBASE_BENCHMARK_BASELINES is
+        not set
+    :param noise: Seconds slower than allowed that are still ignored
+    :returns: The store or None if no baselines are configured
+    """
+    path = os.environ.get(BASELINES_ENV, None) or default
+    if not path:
+        return None
+    return BaselineStore(os.path.abspath(path), noise)
+
+
+def update_baselines() -> bool:
+    """
+    Checks if TESTBASE_BENCHMARK_UPDATE is set to true.
+
+    :returns: True if results should replace the stored baselines
+    """
+    return os.environ.get(UPDATE_ENV, 'false').lower() == 'true'
@@ -0,0 +1,237 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import deque
+import io
+import logging
+import os
+import sys
+import tempfile
+from types import TracebackType
+from typing import Deque, List, Optional, TextIO, Tuple, Type, Union
+from unittest import SkipTest
+import zlib
+
+from typing_extensions import Self
+
+#: Environment variable selecting the capture mode; ring or spool
+CAPTURE_ENV = "TESTBASE_CAPTURE_OUTPUT"
+#: Environment variable with the number of characters a ring keeps
+CAPTURE_LIMIT_ENV = "TESTBASE_CAPTURE_LIMIT"
+DEFAULT_LIMIT = 1000000
+
+
+class RingBuffer(io.TextIOBase):
+    """
+    Text stream that keeps only the most recent output.
+    """
+
+    def __init__(self, limit: int = DEFAULT_LIMIT):
+        """
+        :param limit: Number of characters to keep
+        """
+        super().__init__()
+        self._limit = limit
+        self._chunks: Deque[str] = deque()
+        self._size = 0
+        self._dropped = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self._limit:
+            extra = self._size - self._limit
+            oldest = self._chunks[0]
+            if len(oldest) <= extra:
+                self._chunks.popleft()
+                removed = len(oldest)
+            else:
+                self._chunks[0] = oldest[extra:]
+                removed = extra
+            self._size -= removed
+            self._dropped += removed
+        return len(text)
+
+    def getvalue(self) -> str:
+        """
+        :returns: The output kept, noting how much was dropped
+        """
+        text = "".join(self._chunks)
+        if self._dropped:
+            text = f"... {self._dropped} characters dropped ...\n" + text
+        return text
+
+    def clear(self) -> None:
+        """
+        Forgets all the output so far.
+        """
+        self._chunks.clear()
+        self._size = 0
+        self._dropped = 0
+
+
+class SpoolFile(io.TextIOBase):
+    """
+    Text stream that compresses all the output into a temporary file.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._file = tempfile.TemporaryFile()
+        self._compressor = zlib.compressobj()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._file.write(self._compressor.compress(text.encode("utf-8")))
+        return len(text)
+
+    def getvalue(self) -> str:
+        """
+        :returns: All the output so far
+        """
+        self._file.write(self._compressor.flush(zlib.Z_SYNC_FLUSH))
+        self._file.seek(0)
+        data = zlib.decompressobj().decompress(self._file.read())
+        self._file.seek(0, os.SEEK_END)
+        return data.decode("utf-8", "replace")
+
+    def clear(self) -> None:
+        """
+        Forgets all the output so far.
+        """
+        self._file.seek(0)
+        self._file.truncate()
+        self._compressor = zlib.compressobj()
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+# pylint: disable=invalid-name
+_active: Optional["OutputCapture"] = None
+
+
+def _stream_handlers() -> List[logging.StreamHandler]:
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)]
+    return [handler for logger in loggers for handler in logger.handlers
+            if isinstance(handler, logging.StreamHandler)]
+
+
+class OutputCapture(object):
+    """
+    Holds back stdout and stderr while a script runs.
+
+    Logging handlers already writing to stdout or stderr are pointed at
+    the capture too, as they keep the stream they were made with.
+
+    The output is written out only if the block raises an exception other
+    than SkipTest, or if emit is called, for example before a retry.
+    Used as a context manager; without a buffer it does nothing.
+    """
+
+    __slots__ = ("_buffer", "_stdout", "_stderr", "_handlers")
+
+    def __init__(self, buffer: Optional[Union[RingBuffer, SpoolFile]]):
+        """
+        :param buffer: Where to keep the output or None to not capture
+        """
+        self._buffer = buffer
+        self._stdout: TextIO = sys.stdout
+        self._stderr: TextIO = sys.stderr
+        # Each redirected logging handler and the stream it had
+        self._handlers: List[Tuple[logging.StreamHandler, TextIO]] = []
+
+    def __enter__(self) -> Self:
+        global _active  # pylint: disable=global-statement
+        if self._buffer is not None:
+            self._stdout = sys.stdout
+            self._stderr = sys.stderr
+            sys.stdout = sys.stderr = self._buffer  # type: ignore[assignment]
+            for handler in _stream_handlers():
+                if handler.stream in (self._stdout, self._stderr):
+                    self._handlers.append((handler, handler.stream))
+                    handler.setStream(self._buffer)  # type: ignore[arg-type]
+            _active = self
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        global _active  # pylint: disable=global-statement
+        if self._buffer is None:
+            return
+        sys.stdout = self._stdout
+        sys.stderr = self._stderr
+        for handler, stream in self._handlers:
+            handler.setStream(stream)
+        self._handlers.clear()
+        _active = None
+        if exc_type is not None and not issubclass(exc_type, SkipTest):
+            self.emit(f"failed with {exc_type.__name__}")
+        self._buffer.close()
+
+    def emit(self, reason: str) -> None:
+        """
+        Writes out the output held so far and then forgets it.
+
+        :param reason: Why the output is being shown
+        """
+        if self._buffer is None:
+            return
+        text = self._buffer.getvalue()
+        self._buffer.clear()
+        if text:
+            self._stdout.write(f"==== Captured output; {reason} ====\n")
+            self._stdout.write(text)
+            if not text.endswith("\n"):
+                self._stdout.write("\n")
+            self._stdout.write("==== End of captured output ====\n")
+            self._stdout.flush()
+
+
+def capture_output() -> OutputCapture:
+    """
+    Gets a capture for the mode set in TESTBASE_CAPTURE_OUTPUT.
+
+    ring keeps only the last TESTBASE_CAPTURE_LIMIT characters in memory.
+    spool keeps everything compressed in a temporary file.
+    Anything else turns capture off.
+
+    :returns: A capture to use as a context manager
+    """
+    mode = os.environ.get(CAPTURE_ENV, "").lower()
+    if mode == "ring":
+        return OutputCapture(RingBuffer(
+            int(os.environ.get(CAPTURE_LIMIT_ENV, DEFAULT_LIMIT))))
+    if mode == "spool":
+        return OutputCapture(SpoolFile())
+    return OutputCapture(None)
+
+
+def emit_captured(reason: str) -> None:
+    """
+    Writes out any output being captured, for example before a retry.
+
+    :param reason: Why the output is being shown
+    """
+    if _active is not None:
+        _active.emit(reason)
@@ -15,7 +15,7 @@
 import platform
 import subprocess
 import time
-from typing import Set
+from typing import Dict, Set
 
 
 class Ping(object):
@@ -25,6 +25,10 @@ class Ping(object):
 
     #: The unreachable host cache.
     unreachable: Set[str] = set()
+    #: When each host last answered, by time.monotonic
+    reachable: Dict[str, float] = {}
+    #: Seconds an answer is trusted for
+    reachable_ttl = 60.0
 
     @staticmethod
     def ping(ip_address: str) -> int:
@@ -51,6 +55,23 @@ class Ping(object):
         process.wait()
         return process.returncode
 
+    @staticmethod
+    def answers(ip_address: str) -> bool:
+        """
+        Pings a host once, remembering if it answered.
+
+        A host that does not answer is not marked unreachable.
+
+        :param ip_address:
+            The IP address to ping. Hostnames can be used, but are not
+            recommended.
+        :returns: True if the host answered
+        """
+        if Ping.ping(ip_address) != 0:
+            return False
+        Ping.reachable[ip_address] = time.monotonic()
+        return True
+
     @staticmethod
     def host_is_reachable(ip_address: str) -> bool:
         """
@@ -67,9 +88,12 @@ class Ping(object):
         """
         if ip_address in Ping.unreachable:
             return False
+        if time.monotonic() - Ping.reachable.get(
+                ip_address, -Ping.reachable_ttl) < Ping.reachable_ttl:
+            return True
         tries = 0
         while True:
-            if Ping.ping(ip_address) == 0:
+            if Ping.answers(ip_address):
                 return True
             tries += 1
             if tries > 10:
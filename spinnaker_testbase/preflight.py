@@ -0,0 +1,159 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import glob
+import multiprocessing
+import os
+import sys
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .root_script_builder import RootScriptBuilder
+
+#: Environment variable that turns on the preflight check
+PREFLIGHT_ENV = "TESTBASE_PREFLIGHT"
+#: Environment variable with the binary search paths; without it
+#: declared binaries are not looked for
+BINARY_PATHS_ENV = "TESTBASE_BINARY_PATHS"
+
+
+def preflight_enabled() -> bool:
+    """
+    Checks if TESTBASE_PREFLIGHT is set to true.
+
+    :returns: True if scripts should be checked before they are run
+    """
+    return os.environ.get(PREFLIGHT_ENV, 'false').lower() == 'true'
+
+
+def model_binary_folders() -> List[str]:
+    """
+    Finds the model_binaries folders of the installed packages.
+
+    The tools only register these when a simulator is made, so they are
+    looked for on the file system without importing the packages.
+
+    :returns: Folders named model_binaries, or ending in it, in the top
+        two levels of each package
+    """
+    folders: List[str] = []
+    for path in sys.path:
+        if not os.path.isdir(path):
+            continue
+        for depth in (1, 2):
+            for folder in sorted(glob.glob(os.path.join(
+                    path, *["*"] * depth, "*model_binaries"))):
+                if os.path.isdir(folder) and folder not in folders:
+                    folders.append(folder)
+    return folders
+
+
+def binary_search_paths() -> Optional[List[str]]:
+    """
+    Gets the folders binaries may be found in.
+
+    These are the paths in TESTBASE_BINARY_PATHS followed by the
+    model_binaries folders of the installed packages.
+
+    :returns: Folders in the order they are searched,
+        or None if TESTBASE_BINARY_PATHS is not set
+    """
+    paths = os.environ.get(BINARY_PATHS_ENV, "")
+    if not paths:
+        return None
+    return [path for path in paths.split(os.pathsep) if path] + \
+        model_binary_folders()
+
+
+def _compile_script(script_path: str) -> Optional[str]:
+    """
+    Compiles a script without running it.
+
+    :returns: Description of the syntax error or None if it compiled
+    """
+    try:
+        with open(script_path, encoding="utf-8") as script_file:
+            compile(script_file.read(), script_path, "exec")
+    except SyntaxError as ex:
+        return f"{script_path}:{ex.lineno}: {ex.msg}"
+    return None
+
+
+def _declared_binaries(script_path: str) -> Tuple[str, List[str]]:
+    """
+    Reads the combined and split binaries comments of a script.
+    """
+    # pylint: disable=protected-access
+    _, _, combined, split = RootScriptBuilder()._script_details(script_path)
+    binaries = []
+    for binary in combined + split:
+        binary = binary.strip()
+        if binary:
+            if not binary.endswith(".aplx"):
+                binary += ".aplx"
+            binaries.append(binary)
+    return script_path, binaries
+
+
+def _find_binary(binary: str, search_paths: Sequence[str]) -> Optional[str]:
+    for path in search_paths:
+        if os.path.isfile(os.path.join(path, binary)):
+            return os.path.join(path, binary)
+    return None
+
+
+def preflight(scripts: Sequence[str],
+              search_paths: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Checks scripts can be run without needing a board to find out.
+
+    All scripts are compiled in a process pool and the binaries declared in
+    their combined binaries and split binaries comments are looked for in
+    parallel. Binaries are only looked for if there are search paths, as
+    scripts may register folders of their own when run.
+
+    :param scripts: Paths of the scripts to check
+    :param search_paths:
+        Folders to find binaries in. Defaults to binary_search_paths()
+    :returns: One line per problem found; empty if all is well
+    """
+    if search_paths is None:
+        search_paths = binary_search_paths()
+    problems = [f"{script}: script not found" for script in scripts
+                if not os.path.isfile(script)]
+    scripts = [script for script in scripts if os.path.isfile(script)]
+    if not scripts:
+        return problems
+
+    # Spawned as forking a process running threads can deadlock
+    with ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn")) as processes:
+        compiled = processes.map(_compile_script, scripts)
+        if search_paths is None:
+            problems.extend(error for error in compiled if error)
+            return problems
+        with ThreadPoolExecutor() as threads:
+            users: Dict[str, Set[str]] = {}
+            for script, binaries in threads.map(_declared_binaries, scripts):
+                for binary in binaries:
+                    users.setdefault(binary, set()).add(script)
+            found = threads.map(
+                lambda binary: _find_binary(binary, search_paths), users)
+            for binary, path in zip(list(users), found):
+                if path is None:
+                    problems.append(
+                        f"{binary} not found in {list(search_paths)}; "
+                        f"declared by {', '.join(sorted(users[binary]))}")
+        problems.extend(error for error in compiled if error)
+    return problems
@@ -0,0 +1,228 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+from numpy.typing import NDArray
+
+_CORE_QUERY = """
+    SELECT description, x, y, p, the_value FROM core_provenance_view
+    """
+_ROUTER_QUERY = """
+    SELECT description, x, y, -1, the_value FROM router_provenance
+    """
+
+# Identifies a version of a file: inode, modification time and size
+_Stamp = Tuple[int, int, int]
+# Read only connections by database path; reopened if the file changes
+_connections: Dict[str, Tuple[_Stamp, sqlite3.Connection]] = {}
+# Loaded databases by path; reloaded if the file changes
+_databases: Dict[str, Tuple[_Stamp, "ProvenanceDatabase"]] = {}
+
+
+class ProvenanceColumns(object):
+    """
+    Provenance values for one description held as arrays.
+
+    Row i of each array is one value; for routers p is -1.
+    """
+
+    __slots__ = ("x", "y", "p", "values")
+
+    def __init__(self, x: NDArray, y: NDArray, p: NDArray, values: NDArray):
+        """
+        :param x: Chip X coordinates
+        :param y: Chip Y coordinates
+        :param p: Processor ids or -1 for routers
+        :param values: The provenance values
+        """
+        self.x = x
+        self.y = y
+        self.p = p
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def max(self) -> float:
+        """
+        :returns: The largest value or 0 if there are none
+        """
+        return float(self.values.max()) if len(self.values) else 0.0
+
+    def total(self) -> float:
+        """
+        :returns: The sum of all the values
+        """
+        return float(self.values.sum())
+
+    def above(self, limit: float) -> List[Tuple[int, int, int, float]]:
+        """
+        Finds the rows with a value over a limit.
+
+        :param limit: Largest acceptable value
+        :returns: (x, y, p, value) for each row over the limit
+        """
+        over = numpy.nonzero(self.values > limit)[0]
+        return [(int(self.x[i]), int(self.y[i]), int(self.p[i]),
+                 float(self.values[i])) for i in over]
+
+
+def _group(rows: List[Tuple]) -> Dict[str, ProvenanceColumns]:
+    """
+    Splits rows of (description, x, y, p, value) by description.
+    """
+    if not rows:
+        return {}
+    descriptions = numpy.array([row[0] for row in rows], dtype=object)
+    numbers = numpy.array([row[1:] for row in rows], dtype=numpy.float64)
+    grouped = {}
+    for description in numpy.unique(descriptions):
+        mask = descriptions == description
+        selected = numpy.compress(mask, numbers, axis=0)
+        grouped[str(description)] = ProvenanceColumns(
+            selected[:, 0].astype(numpy.int32),
+            selected[:, 1].astype(numpy.int32),
+            selected[:, 2].astype(numpy.int32),
+            selected[:, 3])
+    return grouped
+
+
+def _stamp(path: str) -> _Stamp:
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _connection(path: str) -> sqlite3.Connection:
+    stamp = _stamp(path)
+    cached = _connections.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    if cached is not None:
+        # A new run replaced the file
+        cached[1].close()
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    _connections[path] = (stamp, connection)
+    return connection
+
+
+def close_provenance_connections() -> None:
+    """
+    Closes all the cached database connections.
+
+    Called by BaseTestCase.tearDown so connections are not kept between
+    tests.
+    """
+    for _, connection in _connections.values():
+        connection.close()
+    _connections.clear()
+    _databases.clear()
+
+
+class ProvenanceDatabase(object):
+    """
+    Read only view of a provenance database for assertions.
+
+    Each table is read with one query the first time it is needed and
+    kept indexed by description.
+    """
+
+    __slots__ = ("_path", "_core", "_router")
+
+    def __init__(self, path: str):
+        """
+        :param path: Path to the database file
+        """
+        self._path = path
+        self._core: Optional[Dict[str, ProvenanceColumns]] = None
+        self._router: Optional[Dict[str, ProvenanceColumns]] = None
+
+    def _load(self, query: str) -> Dict[str, ProvenanceColumns]:
+        try:
+            rows = _connection(self._path).execute(query).fetchall()
+        except sqlite3.OperationalError:
+            # No such table as nothing of that type was recorded
+            return {}
+        return _group(rows)
+
+    def _cores(self) -> Dict[str, ProvenanceColumns]:
+        if self._core is None:
+            self._core = self._load(_CORE_QUERY)
+        return self._core
+
+    def _routers(self) -> Dict[str, ProvenanceColumns]:
+        if self._router is None:
+            self._router = self._load(_ROUTER_QUERY)
+        return self._router
+
+    @staticmethod
+    def _matching(table: Dict[str, ProvenanceColumns],
+                  sub_description: str) -> ProvenanceColumns:
+        found = [columns for description, columns in table.items()
+                 if sub_description in description]
+        if not found:
+            empty = numpy.zeros(0, dtype=numpy.int32)
+            return ProvenanceColumns(
+                empty, empty, empty, numpy.zeros(0, dtype=numpy.float64))
+        return ProvenanceColumns(
+            *(numpy.concatenate([getattr(columns, name) for columns in found])
+              for name in ProvenanceColumns.__slots__))
+
+    def core_descriptions(self) -> List[str]:
+        """
+        :returns: The descriptions used for core provenance
+        """
+        return sorted(self._cores())
+
+    def router_descriptions(self) -> List[str]:
+        """
+        :returns: The descriptions used for router provenance
+        """
+        return sorted(self._routers())
+
+    def cores(self, sub_description: str) -> ProvenanceColumns:
+        """
+        Gets the core values whose description contains some text.
+
+        :param sub_description: Text the description must contain
+        :returns: The values from all matching descriptions
+        """
+        return self._matching(self._cores(), sub_description)
+
+    def routers(self, sub_description: str) -> ProvenanceColumns:
+        """
+        Gets the router values whose description contains some text.
+
+        :param sub_description: Text the description must contain
+        :returns: The values from all matching descriptions
+        """
+        return self._matching(self._routers(), sub_description)
+
+
+def provenance_database(path: str) -> ProvenanceDatabase:
+    """
+    Gets the view of a database, reusing it while the file is unchanged.
+
+    :param path: Path to the database file
+    :returns: A view reading the database at most once per table
+    """
+    stamp = _stamp(path)
+    cached = _databases.get(path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, ProvenanceDatabase(path))
+        _databases[path] = cached
+    return cached[1]
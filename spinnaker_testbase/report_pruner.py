@@ -0,0 +1,222 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import logging
+import os
+from queue import Queue
+import re
+import shutil
+import sys
+from threading import Thread, get_native_id
+import time
+from typing import Iterable, List, NamedTuple, Optional, Set, Tuple
+
+#: Environment variable with the number of runs to keep in a reports folder
+KEEP_RUNS_ENV = "TESTBASE_KEEP_RUNS"
+#: Environment variable with the size in MB a reports folder may grow to
+MAX_REPORTS_MB_ENV = "TESTBASE_MAX_REPORTS_MB"
+
+# Names of the run directories, and their archives, made by the tools
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2}-\d{6}")
+# Seconds to pause between deletions to leave the disk to the tests
+_PAUSE = 0.05
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionPolicy(NamedTuple):
+    """
+    How many old runs a reports folder may keep.
+    """
+    #: Number of newest runs to keep; 0 for no limit
+    keep_runs: int = 0
+    #: Total bytes the runs may take; 0 for no limit
+    max_bytes: int = 0
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        """
+        Reads TESTBASE_KEEP_RUNS and TESTBASE_MAX_REPORTS_MB.
+
+        :returns: The policy; by default nothing is removed
+        """
+        return cls(
+            int(os.environ.get(KEEP_RUNS_ENV, "0")),
+            int(float(os.environ.get(MAX_REPORTS_MB_ENV, "0")) * 1024 * 1024))
+
+    @property
+    def active(self) -> bool:
+        """
+        True if this policy may remove anything.
+        """
+        return self.keep_runs > 0 or self.max_bytes > 0
+
+
+def _size(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    total = 0
+    for folder, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(folder, name))
+            except OSError:
+                pass
+    return total
+
+
+def _is_protected(path: str, protected: Iterable[str]) -> bool:
+    return any(os.path.commonpath([path, kept]) == path
+               for kept in protected)
+
+
+def stale_runs(reports_root: str, policy: RetentionPolicy,
+               protected: Iterable[str], started: str) -> List[str]:
+    """
+    Finds the runs in a reports folder the policy says to remove.
+
+    Only entries named by a run time stamp are considered, and any
+    entry from a run at or after the started time stamp is kept.
+
+    :param reports_root: The reports folder
+    :param policy: How much to keep
+    :param protected: Paths that must not be removed, nor anything holding
+        them
+    :param started: Time stamp in the run directory format of when this
+        session started
+    :returns: Paths to remove, oldest first
+    """
+    protected = [os.path.abspath(path) for path in protected]
+    runs = sorted(
+        (name for name in os.listdir(reports_root) if _TIMESTAMP.match(name)),
+        reverse=True)
+    stale: List[str] = []
+    total = 0
+    for index, name in enumerate(runs):
+        path = os.path.abspath(os.path.join(reports_root, name))
+        if name >= started or _is_protected(path, protected):
+            total += _size(path) if policy.max_bytes else 0
+            continue
+        if 0 < policy.keep_runs <= index:
+            stale.append(path)
+            continue
+        if policy.max_bytes:
+            total += _size(path)
+            if total > policy.max_bytes:
+                stale.append(path)
+    stale.reverse()
+    return stale
+
+
+def _lower_priority() -> None:
+    """
+    Makes the calling thread the last to get the CPU, where supported.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            # On Linux the niceness of a thread is its own
+            os.setpriority(os.PRIO_PROCESS, get_native_id(), 19)
+        except OSError:
+            pass
+
+
+def _timestamp_now() -> str:
+    now = datetime.datetime.now()
+    return (f"{now.year:04}-{now.month:02}-{now.day:02}-{now.hour:02}"
+            f"-{now.minute:02}-{now.second:02}-{now.microsecond:06}")
+
+
+class ReportPruner(object):
+    """
+    Removes old runs from reports folders on a low priority thread.
+
+    Each reports folder is pruned once, the first time it is submitted.
+    """
+
+    __slots__ = ("_policy", "_started", "_queue", "_seen", "_removed")
+
+    def __init__(self, policy: RetentionPolicy,
+                 started: Optional[str] = None):
+        """
+        :param policy: How much to keep in each reports folder
+        :param started: Time stamp of the session start; runs from then on
+            are never removed. Defaults to now.
+        """
+        self._policy = policy
+        self._started = started or _timestamp_now()
+        self._queue: "Queue[Tuple[str, List[str]]]" = Queue()
+        self._seen: Set[str] = set()
+        self._removed: List[str] = []
+        Thread(target=self._run, daemon=True,
+               name="testbase report pruner").start()
+
+    def _run(self) -> None:
+        _lower_priority()
+        while True:
+            reports_root, protected = self._queue.get()
+            try:
+                for path in stale_runs(reports_root, self._policy,
+                                       protected, self._started):
+                    if os.path.isdir(path):
+                        shutil.rmtree(path, ignore_errors=True)
+                    else:
+                        os.remove(path)
+                    self._removed.append(path)
+                    time.sleep(_PAUSE)
+            except OSError:
+                logger.exception("Unable to prune %s", reports_root)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, reports_root: str, protected: Iterable[str]) -> None:
+        """
+        Queues a reports folder to be pruned; does not wait.
+
+        :param reports_root: Folder holding the run directories
+        :param protected: Paths that must not be removed
+        """
+        reports_root = os.path.abspath(reports_root)
+        if reports_root in self._seen or not os.path.isdir(reports_root):
+            return
+        self._seen.add(reports_root)
+        self._queue.put((reports_root, list(protected)))
+
+    def flush(self) -> List[str]:
+        """
+        Waits for all the queued folders to be pruned.
+
+        :returns: All the paths removed so far
+        """
+        self._queue.join()
+        return list(self._removed)
+
+
+# pylint: disable=invalid-name
+_pruner: Optional[ReportPruner] = None
+
+
+def get_report_pruner() -> Optional[ReportPruner]:
+    """
+    Gets the pruner if TESTBASE_KEEP_RUNS or TESTBASE_MAX_REPORTS_MB is set.
+
+    :returns: The shared pruner or None if nothing is to be pruned
+    """
+    global _pruner  # pylint: disable=global-statement
+    if _pruner is None:
+        policy = RetentionPolicy.from_env()
+        if not policy.active:
+            return None
+        _pruner = ReportPruner(policy)
+    return _pruner
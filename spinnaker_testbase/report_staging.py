@@ -0,0 +1,202 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import hashlib
+import logging
+import os
+from queue import Queue
+import shutil
+from threading import Thread
+from typing import Dict, List, Optional, Set, Tuple
+
+from .config_overrides import add_config_override, get_config_overrides
+from .run_archiver import ARCHIVE_ENV, ARCHIVE_FORMAT_ENV, archive_directory
+
+#: Environment variable with a fast local directory to write reports to
+STAGE_ENV = "TESTBASE_STAGE_REPORTS"
+
+# Name of the reports folder made in the report file path
+_REPORTS = "reports"
+_REPORT_PATH = ("Reports", "default_report_file_path")
+
+logger = logging.getLogger(__name__)
+
+
+def move_directory(source: str, destination: str) -> str:
+    """
+    Copies a directory to another file system and deletes the original.
+
+    The copy only gets its final name once complete.
+
+    :param source: The directory to move
+    :param destination: The path it should end up at
+    :returns: The destination
+    """
+    partial = destination + ".partial"
+    shutil.copytree(source, partial)
+    os.replace(partial, destination)
+    shutil.rmtree(source)
+    return destination
+
+
+class ReportStager(object):
+    """
+    Points the reports of each script at a scratch directory and moves
+    finished runs to where they would otherwise have been written.
+
+    Runs are moved by a background thread once a later run has started,
+    or when finish is called, so the paths FecDataView gives for the
+    current run stay valid until the process ends.
+    If a compression is given runs are archived instead of copied.
+    """
+
+    __slots__ = ("_scratch", "_compression", "_roots", "_queued", "_queue",
+                 "_moved", "_forced")
+
+    def __init__(self, scratch: str, compression: Optional[str] = None):
+        """
+        :param scratch: Fast local directory, such as a tmpfs
+        :param compression: xz or gz to archive the runs as they are moved
+        """
+        self._scratch = os.path.join(os.path.abspath(scratch),
+                                     str(os.getpid()))
+        self._compression = compression
+        # Persistent report file path of each staging report file path
+        self._roots: Dict[str, str] = {}
+        self._queued: Set[str] = set()
+        self._queue: "Queue[Tuple[str, str]]" = Queue()
+        self._moved: List[str] = []
+        # Report file path forced by another override, if any
+        self._forced: Optional[str] = None
+        Thread(target=self._run, daemon=True,
+               name="testbase report stager").start()
+
+    def _run(self) -> None:
+        while True:
+            source, reports_dir = self._queue.get()
+            try:
+                os.makedirs(reports_dir, exist_ok=True)
+                if self._compression is None:
+                    self._moved.append(move_directory(source, os.path.join(
+                        reports_dir, os.path.basename(source))))
+                else:
+                    self._moved.append(archive_directory(
+                        source, self._compression, reports_dir))
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Unable to move %s", source)
+            finally:
+                self._queue.task_done()
+
+    def stage(self) -> str:
+        """
+        Makes the next script write its reports to the scratch directory.
+
+        The persistent location is the one forced by another override,
+        such as a worker's board directory, or else the current directory
+        as used by the DEFAULT report file path.
+
+        :returns: The report file path used instead
+        """
+        override = get_config_overrides().get(_REPORT_PATH)
+        if override not in self._roots:
+            self._forced = override
+        persistent = os.path.abspath(
+            os.getcwd() if self._forced is None else self._forced)
+        staging = os.path.join(self._scratch, hashlib.sha1(
+            persistent.encode("utf-8")).hexdigest()[:12])
+        os.makedirs(staging, exist_ok=True)
+        self._roots[staging] = persistent
+        add_config_override(*_REPORT_PATH, staging)
+        return staging
+
+    def persistent_path(self, path: str) -> str:
+        """
+        Gets where a staged path ends up.
+
+        :param path: A path in the scratch directory
+        :returns: The persistent path, or the path itself if not staged
+        """
+        path = os.path.abspath(path)
+        for staging, persistent in self._roots.items():
+            if os.path.commonpath([path, staging]) == staging:
+                return os.path.join(persistent, os.path.relpath(path, staging))
+        return path
+
+    def submit_finished(self, current: Optional[str]) -> None:
+        """
+        Queues every staged run except the current one to be moved.
+
+        :param current: The run FecDataView points at, if any
+        """
+        current = None if current is None else os.path.abspath(current)
+        for staging, persistent in self._roots.items():
+            staged_reports = os.path.join(staging, _REPORTS)
+            if not os.path.isdir(staged_reports):
+                continue
+            for name in sorted(os.listdir(staged_reports)):
+                run_dir = os.path.join(staged_reports, name)
+                if run_dir == current or run_dir in self._queued or \
+                        not os.path.isdir(run_dir):
+                    continue
+                self._queued.add(run_dir)
+                self._queue.put(
+                    (run_dir, os.path.join(persistent, _REPORTS)))
+
+    def flush(self) -> List[str]:
+        """
+        Waits for the queued runs to be moved.
+
+        :returns: Where all the runs moved so far ended up
+        """
+        self._queue.join()
+        return list(self._moved)
+
+    def finish(self) -> List[str]:
+        """
+        Moves every staged run, including the current one, and waits.
+
+        :returns: Where all the runs moved so far ended up
+        """
+        self.submit_finished(None)
+        return self.flush()
+
+
+# pylint: disable=invalid-name
+_stager: Optional[ReportStager] = None
+
+
+def get_report_stager() -> Optional[ReportStager]:
+    """
+    Gets the stager if TESTBASE_STAGE_REPORTS names a scratch directory.
+
+    If TESTBASE_ARCHIVE is true and GLOBAL_REPORTS is set the runs are
+    archived as they are moved. Without GLOBAL_REPORTS the error file is
+    in the run directory, so runs are copied to keep it readable.
+    Everything staged is moved before the interpreter exits.
+
+    :returns: The shared stager or None if staging is off
+    """
+    global _stager  # pylint: disable=global-statement
+    if _stager is None:
+        scratch = os.environ.get(STAGE_ENV, None)
+        if not scratch:
+            return None
+        compression = None
+        if os.environ.get(ARCHIVE_ENV, 'false').lower() == 'true' and \
+                os.environ.get("GLOBAL_REPORTS", None):
+            compression = os.environ.get(ARCHIVE_FORMAT_ENV, "xz")
+        _stager = ReportStager(scratch, compression)
+        atexit.register(_stager.finish)
+    return _stager
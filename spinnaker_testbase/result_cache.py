@@ -0,0 +1,266 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ast
+import hashlib
+from importlib import metadata
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from .file_lock import update_json
+
+#: Environment variable with the path of the cache file
+RESULT_CACHE_ENV = "TESTBASE_RESULT_CACHE"
+#: Environment variable that when true makes every script run
+FORCE_RUN_ENV = "TESTBASE_FORCE_RUN"
+
+# Files of an editable install that can change what a script does
+_SOURCE_SUFFIXES = (".py", ".cfg")
+
+# pylint: disable=invalid-name
+_packages_key: Optional[str] = None
+
+
+def _editable_source_key(url: str) -> str:
+    """
+    Hashes the Python and cfg files of an editable install.
+    """
+    digest = hashlib.sha256()
+    top = url2pathname(urlparse(url).path)
+    for folder, dirs, files in os.walk(top):
+        dirs[:] = sorted(name for name in dirs
+                         if not name.startswith(".") and
+                         name != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(_SOURCE_SUFFIXES):
+                path = os.path.join(folder, name)
+                digest.update(os.path.relpath(path, top).encode("utf-8"))
+                with open(path, "rb") as a_file:
+                    digest.update(a_file.read())
+    return digest.hexdigest()
+
+
+def _package_key(dist: metadata.Distribution) -> str:
+    """
+    Describes what is installed for one package.
+
+    As well as the version this covers the commit it was installed from,
+    if any, and the hashes of its files, so a reinstall from git at the
+    same version still counts as a change. The files of an editable
+    install are hashed where they are.
+    """
+    parts = [f"{dist.metadata['Name']}=={dist.version}"]
+    direct_url = dist.read_text("direct_url.json")
+    if direct_url:
+        parts.append(direct_url)
+        try:
+            origin = json.loads(direct_url)
+        except ValueError:
+            origin = {}
+        if origin.get("dir_info", {}).get("editable", False):
+            parts.append(_editable_source_key(origin.get("url", "")))
+    parts.append(dist.read_text("RECORD") or "")
+    return "\n".join(parts)
+
+
+def _installed_packages_key() -> str:
+    """
+    Hashes what is installed for every package.
+
+    Done once per process as installing packages mid run is not supported.
+    """
+    global _packages_key  # pylint: disable=global-statement
+    if _packages_key is None:
+        digest = hashlib.sha256()
+        for key in sorted(_package_key(dist)
+                          for dist in metadata.distributions()):
+            digest.update(key.encode("utf-8"))
+        _packages_key = digest.hexdigest()
+    return _packages_key
+
+
+def _hash_files(paths: Iterable[str]) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(path.encode("utf-8"))
+        with open(path, "rb") as a_file:
+            digest.update(a_file.read())
+    return digest.hexdigest()
+
+
+def local_imports(script_path: str, root_dir: str) -> Set[str]:
+    """
+    Finds the Python files in the repository a script imports.
+
+    Imports are followed transitively.
+    Modules outside root_dir and the script's directory are ignored.
+
+    :param script_path: Path to the script
+    :param root_dir: Directory module names are relative to
+    :returns: Paths of the script and every local file it imports
+    """
+    found: Set[str] = set()
+    todo = [os.path.abspath(script_path)]
+    while todo:
+        path = todo.pop()
+        if path in found:
+            continue
+        found.add(path)
+        with open(path, encoding="utf-8") as a_file:
+            tree = ast.parse(a_file.read(), path)
+        names: List[str] = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                names.append(node.module)
+                names.extend(f"{node.module}.{alias.name}"
+                             for alias in node.names)
+        # Importing a.b.c also runs the __init__ of a and a.b
+        parts = [name.split(".") for name in names]
+        names = [".".join(part[:i]) for part in parts
+                 for i in range(1, len(part) + 1)]
+        for name in set(names):
+            relative = name.replace(".", os.sep)
+            for base in (root_dir, os.path.dirname(path)):
+                for candidate in (
+                        os.path.join(base, relative + ".py"),
+                        os.path.join(base, relative, "__init__.py")):
+                    if os.path.isfile(candidate):
+                        todo.append(os.path.abspath(candidate))
+    return found
+
+
+class ResultCache(object):
+    """
+    Remembers which scripts passed and what they depended on.
+
+    The key for a script covers its source, the local files it imports
+    and the installed packages, including the commit or files of those
+    installed from git or in editable mode.
+    The binaries a passing run loaded are stored with the result and
+    must be unchanged for the result to be reused.
+    """
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: str):
+        """
+        :param path: The JSON file to hold the cache
+        """
+        self._path = path
+
+    def _read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except ValueError:
+            # A damaged cache just means everything runs again
+            return {}
+
+    @staticmethod
+    def source_key(script_path: str, root_dir: str) -> str:
+        """
+        Computes the key for a script ignoring binaries.
+
+        :param script_path: Path to the script
+        :param root_dir: Directory module names are relative to
+        :returns: Hex digest covering sources and package versions
+        """
+        digest = hashlib.sha256()
+        digest.update(_hash_files(
+            local_imports(script_path, root_dir)).encode("utf-8"))
+        digest.update(_installed_packages_key().encode("utf-8"))
+        return digest.hexdigest()
+
+    def cached_binaries(
+            self, script_path: str, root_dir: str) -> Optional[List[str]]:
+        """
+        Looks for an earlier pass that is still valid.
+
+        :param script_path: Path to the script
+        :param root_dir: Directory module names are relative to
+        :returns:
+            The paths of the binaries the passing run loaded,
+            or None if the script must be run.
+        """
+        if os.environ.get(FORCE_RUN_ENV, 'false').lower() == 'true':
+            return None
+        entry = self._read().get(os.path.abspath(script_path))
+        if entry is None:
+            return None
+        if entry["key"] != self.source_key(script_path, root_dir):
+            return None
+        binaries = entry["binaries"]
+        if not all(os.path.isfile(binary) for binary in binaries):
+            return None
+        if entry["binaries_key"] != _hash_files(binaries):
+            return None
+        return binaries
+
+    def record_pass(self, script_path: str, root_dir: str,
+                    binaries: Iterable[str]) -> None:
+        """
+        Records that a script passed.
+
+        :param script_path: Path to the script
+        :param root_dir: Directory module names are relative to
+        :param binaries: Paths of the binaries the run loaded
+        """
+        binaries = sorted(binaries)
+        entry = {
+            "key": self.source_key(script_path, root_dir),
+            "binaries": binaries,
+            "binaries_key": _hash_files(binaries)}
+        key = os.path.abspath(script_path)
+
+        def _update(cache: Dict[str, Dict]) -> Dict[str, Dict]:
+            cache[key] = entry
+            return cache
+        update_json(self._path, _update)
+
+    def forget(self, script_path: str) -> None:
+        """
+        Removes any recorded pass for a script.
+
+        :param script_path: Path to the script
+        """
+        key = os.path.abspath(script_path)
+
+        def _update(cache: Dict[str, Dict]) -> Optional[Dict[str, Dict]]:
+            if cache.pop(key, None) is None:
+                return None
+            return cache
+        update_json(self._path, _update)
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """
+    Gets the result cache if one is configured.
+
+    The cache is used when TESTBASE_RESULT_CACHE names a file.
+    Setting TESTBASE_FORCE_RUN to true runs every script regardless,
+    but passes are still recorded.
+
+    :returns: The cache or None if no cache is configured
+    """
+    path = os.environ.get(RESULT_CACHE_ENV, None)
+    if not path:
+        return None
+    return ResultCache(path)
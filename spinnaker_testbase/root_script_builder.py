@@ -19,6 +19,8 @@ from shutil import copyfile
 import sys
 from typing import Dict, List, Optional, Tuple, Union
 
+from .run_history import get_run_history
+
 SKIP_TOO_LONG = "        raise SkipTest(\"{}\")\n"
 NO_SKIP_TOO_LONG = "        # raise SkipTest(\"{}\")\n"
 WARNING_LONG = "        # Warning this test takes {}.\n" \
@@ -162,57 +164,69 @@ class RootScriptBuilder(object):
             test_file.write(f"        self.check_binaries_used("
                             f"[{', '.join(binaries)}])\n")
 
-    def _add_test_directory(
-            self, a_dir: str, prefix_len: int, test_file: TextIOBase,
-            too_long: Dict[str, str], exceptions: Dict[str, str],
-            skip_exceptions: Dict[str, List[str]]) -> None:
+    def _find_scripts(
+            self, a_dir: str, prefix_len: int) -> List[Tuple[str, str]]:
         """
-        Adds any required tests for the scripts in a directory
+        Finds the scripts in a directory and its sub directories
+
+        :param a_dir: Directory to look in
+        :param prefix_len: Length of the repository path to remove
+        :return: The path and the local path of each script
         """
+        scripts = []
         for a_script in os.listdir(a_dir):
             script_path = os.path.join(a_dir, a_script)
             if os.path.isdir(script_path) and not a_script.startswith("."):
-                self._add_test_directory(
-                    script_path, prefix_len, test_file, too_long, exceptions,
-                    skip_exceptions)
+                scripts.extend(self._find_scripts(script_path, prefix_len))
             if a_script.endswith(".py") and a_script != "__init__.py":
                 local_path = script_path[prefix_len:]
                 # As the paths are written to strings in files
                 # Windows needs help!
                 if platform.system() == "Windows":
                     local_path = local_path.replace("\\", "/")
-                if a_script in too_long and len(sys.argv) > 1:
-                    # Lazy boolean distinction based on presence of parameter
-                    self._add_not_testing(
-                        test_file, too_long[a_script], local_path)
-                elif a_script in exceptions:
-                    self._add_not_testing(
-                        test_file, exceptions[a_script], local_path)
-                else:
-                    (has_main, run_script, combined_binaires,
-                     split_binaires) = self._script_details(script_path)
-                    name = local_path[:-3].replace(os.sep, "_").replace(
-                        "-", "_")
-                    skip_imports = skip_exceptions.get(a_script, None)
-                    # use the run_Scripts method style
-                    if run_script:
-                        self._add_split_script(
-                            test_file, name, local_path, False)
-                        self._add_binaries(test_file, combined_binaires)
-                        self._add_split_script(
-                            test_file, name, local_path, True)
-                        self._add_binaries(test_file, split_binaires)
-                    # Due to a main the test will not run if imported
-                    elif has_main:
-                        self._add_not_testing(
-                            test_file, "Unhandled main", local_path)
-                        assert combined_binaires == []
-                        assert split_binaires == []
-                    # Use the import script style
-                    else:
-                        self._add_script(
-                            test_file, name, local_path, skip_imports)
-                        self._add_binaries(test_file, combined_binaires)
+                scripts.append((script_path, local_path))
+        return scripts
+
+    def _add_test_script(
+            self, script_path: str, local_path: str, test_file: TextIOBase,
+            too_long: Dict[str, str], exceptions: Dict[str, str],
+            skip_exceptions: Dict[str, List[str]]) -> None:
+        """
+        Adds any required tests for a script
+        """
+        a_script = os.path.basename(script_path)
+        if a_script in too_long and len(sys.argv) > 1:
+            # Lazy boolean distinction based on presence of parameter
+            self._add_not_testing(
+                test_file, too_long[a_script], local_path)
+        elif a_script in exceptions:
+            self._add_not_testing(
+                test_file, exceptions[a_script], local_path)
+        else:
+            (has_main, run_script, combined_binaires,
+             split_binaires) = self._script_details(script_path)
+            name = local_path[:-3].replace(os.sep, "_").replace(
+                "-", "_")
+            skip_imports = skip_exceptions.get(a_script, None)
+            # use the run_Scripts method style
+            if run_script:
+                self._add_split_script(
+                    test_file, name, local_path, False)
+                self._add_binaries(test_file, combined_binaires)
+                self._add_split_script(
+                    test_file, name, local_path, True)
+                self._add_binaries(test_file, split_binaires)
+            # Due to a main the test will not run if imported
+            elif has_main:
+                self._add_not_testing(
+                    test_file, "Unhandled main", local_path)
+                assert combined_binaires == []
+                assert split_binaires == []
+            # Use the import script style
+            else:
+                self._add_script(
+                    test_file, name, local_path, skip_imports)
+                self._add_binaries(test_file, combined_binaires)
 
     def create_test_scripts(
             self, dirs: Union[str, List[str]],
@@ -241,6 +255,11 @@ class RootScriptBuilder(object):
                 from xyz import Abc
 
             format.
+
+        If TESTBASE_HISTORY names a run history the tests are written
+        with recently failed and changed scripts first,
+        then in order of how long they took.
+        Otherwise they are in directory listing order.
         """
         if too_long is None:
             too_long = {}
@@ -263,9 +282,16 @@ class RootScriptBuilder(object):
         header = os.path.join(test_base_directory, "test_scripts_header")
         copyfile(header, test_script)
 
+        scripts = []
+        for script_dir in dirs:
+            a_dir = os.path.join(repository_dir, script_dir)
+            scripts.extend(self._find_scripts(a_dir, len(repository_dir) + 1))
+        history = get_run_history()
+        if history is not None:
+            scripts = history.order(scripts)
+
         with open(test_script, "a", encoding="utf-8") as test_file:
-            for script_dir in dirs:
-                a_dir = os.path.join(repository_dir, script_dir)
-                self._add_test_directory(
-                    a_dir, len(repository_dir) + 1, test_file,
-                    too_long, exceptions, skip_exceptions)
+            for script_path, local_path in scripts:
+                self._add_test_script(
+                    script_path, local_path, test_file, too_long, exceptions,
+                    skip_exceptions)
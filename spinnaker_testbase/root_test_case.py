@@ -18,11 +18,20 @@ import time
 from typing import Callable, List, Optional
 
 import unittest
+from spinn_utilities.exceptions import SpiNNUtilsException
 from spinnman.exceptions import SpinnmanException
 from pacman.exceptions import PacmanPartitionException, PacmanValueError
 from spalloc_client.job import JobDestroyedError
 from spinn_front_end_common.data import FecDataView
 
+from .coverage_index import get_changed_binaries, get_coverage_index
+from .error_journal import ErrorJournal
+from .metrics import record_attempt, record_retry
+from .output_capture import emit_captured
+from .report_staging import get_report_stager
+from .session_machine import get_session_machine
+from .trace_events import span
+
 if os.environ.get('CONTINUOUS_INTEGRATION', 'false').lower() == 'true':
     MAX_TRIES = 3
 else:
@@ -35,14 +44,79 @@ class RootTestCase(unittest.TestCase):
 
     """
 
+    #: Binaries recorded for the last script if it was a cached pass
+    _cached_binaries: Optional[List[str]] = None
+    #: Run directory before the test started, to spot if it ran anything
+    _coverage_start: Optional[str] = None
+
     def _setup(self, script: str) -> None:
         # Remove random effect for testing
         # Set test_seed to None to allow random
         # pylint: disable=attribute-defined-outside-init
         self._test_seed = 1
 
-        path = os.path.dirname(script)
-        os.chdir(path)
+        with span("setup", script=script):
+            path = os.path.dirname(script)
+            os.chdir(path)
+            stager = get_report_stager()
+            if stager is not None:
+                stager.stage()
+
+            session = get_session_machine()
+            if session is not None:
+                session.prepare()
+
+    def _test_id(self) -> str:
+        """
+        Names the test the same however the tests are collected.
+        """
+        class_file = sys.modules[self.__module__].__file__
+        assert class_file is not None
+        return (f"{os.path.basename(class_file)}::{type(self).__name__}"
+                f"::{self._testMethodName}")
+
+    def _start_coverage(self) -> None:
+        """
+        Skips the test if it is known to load none of the changed binaries.
+
+        Only applies if TESTBASE_COVERAGE_INDEX and TESTBASE_CHANGED are set.
+
+        :raises SkipTest: If the test does not need to run
+        """
+        self._coverage_start = self._timestamp_dir()
+        index = get_coverage_index()
+        changed = get_changed_binaries()
+        if index is None or changed is None:
+            return
+        if not index.selected([self._test_id()], changed):
+            raise unittest.SkipTest("Loads none of the changed binaries")
+
+    def _record_coverage(self) -> None:
+        """
+        Records the binaries the last run loaded in the coverage index.
+
+        Called once runsafe has run the method without an error, so a run
+        that died part way never replaces what the test is known to load.
+        Nothing is recorded if no index is set, the test made no new run
+        or the run loaded nothing. Each run is recorded once.
+        """
+        index = get_coverage_index()
+        run_dir = self._timestamp_dir()
+        if index is None or run_dir is None or \
+                run_dir == self._coverage_start:
+            return
+        binaries = self._binaries_loaded()
+        if binaries:
+            index.record(self._test_id(), binaries)
+            self._coverage_start = run_dir
+
+    def tearDown(self) -> None:
+        """
+        Hands earlier staged runs to the report stager, if any.
+        """
+        stager = get_report_stager()
+        if stager is not None:
+            stager.submit_finished(self._timestamp_dir())
 
     @staticmethod
     def assert_not_spin_three() -> None:
@@ -71,16 +145,23 @@ class RootTestCase(unittest.TestCase):
         if not message.endswith("\n"):
             message += "\n"
 
-        report_path = os.path.join(
-            FecDataView.get_global_reports_dir(), file_name)
-        with open(report_path, "a", encoding="utf-8") as report_file:
-            report_file.write(message)
+        with span("report", file_name=file_name):
+            report_path = os.path.join(
+                FecDataView.get_global_reports_dir(), file_name)
+            with open(report_path, "a", encoding="utf-8") as report_file:
+                report_file.write(message)
 
     def runsafe(self, method: Callable, retry_delay: float = 3.0,
                 skip_exceptions: Optional[List[type]] = None) -> None:
         """
         Will run the method possibly a few times
 
+        Each board or job error is recorded in the error file,
+        see ErrorJournal. In session mode the session machine is prepared
+        again before each retry, replacing the job if it was destroyed.
+        Once the method runs without an error the binaries it loaded are
+        recorded in the coverage index, if any.
+
         :param method:
         :param retry_delay:
         :param skip_exceptions:
@@ -91,7 +172,10 @@ class RootTestCase(unittest.TestCase):
         retries = 0
         while True:
             try:
-                method()
+                record_attempt()
+                with span("runsafe attempt", attempt=retries + 1):
+                    method()
+                self._record_coverage()
                 break
             except (JobDestroyedError, SpinnmanException) as ex:
                 for skip_exception in skip_exceptions:
@@ -100,17 +184,18 @@ class RootTestCase(unittest.TestCase):
                             f"{ex} Still not fixed!", ex)
                 class_file = sys.modules[self.__module__].__file__
                 assert class_file is not None
-                with open(FecDataView.get_error_file(), "a",
-                          encoding="utf-8") as error_file:
-                    error_file.write(class_file)
-                    error_file.write("\n")
-                    error_file.write(str(ex))
-                    error_file.write("\n")
-                    transceiver = FecDataView.get_transceiver()
-                    error_file.write(f"{transceiver=}\n")
+                transceiver = FecDataView.get_transceiver()
+                ErrorJournal(FecDataView.get_error_file()).record(
+                    class_file, ex, f"{transceiver=}")
                 retries += 1
                 if retries >= MAX_TRIES:
                     raise ex
+                record_retry(ex)
+                # The tools are given the session machine's hostname so
+                # a destroyed job shows up as any spinnman error
+                session = get_session_machine()
+                if session is not None:
+                    session.prepare()
             except (PacmanValueError, PacmanPartitionException) as ex:
                 # skip out if on a spin three
                 self.assert_not_spin_three()
@@ -125,7 +210,29 @@ class RootTestCase(unittest.TestCase):
             print(f" retry: {retries}")
             print("==========================================================")
             print("")
-            time.sleep(retry_delay)
+            emit_captured(f"retry {retries}")
+            with span("retry sleep", seconds=retry_delay):
+                time.sleep(retry_delay)
+
+    @staticmethod
+    def _binaries_loaded() -> List[str]:
+        """
+        The paths of the binaries loaded by the last run, if any.
+        """
+        try:
+            return list(FecDataView.get_executable_targets().binaries)
+        except SpiNNUtilsException:
+            return []
+
+    @staticmethod
+    def _timestamp_dir() -> Optional[str]:
+        """
+        The directory of the current or last run, if there is one.
+        """
+        try:
+            return FecDataView.get_timestamp_dir_path()
+        except SpiNNUtilsException:
+            return None
 
     def check_binary_used(self, binary: str) -> None:
         """
@@ -143,13 +250,17 @@ class RootTestCase(unittest.TestCase):
         :param binaries: List of names of the file (no path) to check
         :raises AssertionError: If any binary is not used
         """
-        targets = FecDataView.get_executable_targets()
-        files = set()
-        for target in targets.binaries:
-            _, file = os.path.split(target)
-            files.add(file)
-        for binary in binaries:
-            if not binary.endswith(".aplx"):
-                binary = binary + ".aplx"
-            self.assertIn(binary, files)
-        print(files)
+        with span("check binaries", binaries=binaries):
+            if self._cached_binaries is not None:
+                loaded = self._cached_binaries
+            else:
+                loaded = list(FecDataView.get_executable_targets().binaries)
+            files = set()
+            for target in loaded:
+                _, file = os.path.split(target)
+                files.add(file)
+            for binary in binaries:
+                if not binary.endswith(".aplx"):
+                    binary = binary + ".aplx"
+                self.assertIn(binary, files)
+            print(files)
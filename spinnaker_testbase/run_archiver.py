@@ -0,0 +1,159 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import logging
+import os
+from queue import Queue
+import shutil
+import tarfile
+from threading import Thread
+from typing import List, Optional
+
+#: Environment variable that turns on archiving of finished run directories
+ARCHIVE_ENV = "TESTBASE_ARCHIVE"
+#: Environment variable choosing the compression; xz (default) or gz
+ARCHIVE_FORMAT_ENV = "TESTBASE_ARCHIVE_FORMAT"
+
+logger = logging.getLogger(__name__)
+
+
+def archive_directory(directory: str, compression: str = "xz",
+                      destination: Optional[str] = None) -> str:
+    """
+    Streams a directory into a compressed tar file and deletes it.
+
+    The archive only gets its final name once complete, so a partial
+    archive is never mistaken for a whole one.
+
+    :param directory: The directory to archive
+    :param compression: xz or gz
+    :param destination: Directory to write the archive in;
+        by default next to the directory
+    :returns: Path of the archive
+    """
+    directory = os.path.normpath(directory)
+    if destination is None:
+        destination = os.path.dirname(directory)
+    archive = os.path.join(
+        destination, f"{os.path.basename(directory)}.tar.{compression}")
+    partial = archive + ".partial"
+    with (tarfile.open(partial, "w:gz") if compression == "gz"
+          else tarfile.open(partial, "w:xz")) as tar:
+        tar.add(directory, arcname=os.path.basename(directory))
+    os.replace(partial, archive)
+    shutil.rmtree(directory)
+    return archive
+
+
+class RunArchiver(object):
+    """
+    Archives run directories on a background thread.
+
+    Directories are archived one at a time in the order submitted.
+    """
+
+    __slots__ = ("_compression", "_queue", "_thread", "_archives", "_held")
+
+    def __init__(self, compression: str = "xz"):
+        """
+        :param compression: xz or gz
+        """
+        if compression not in ("xz", "gz"):
+            raise ValueError(f"Unsupported compression {compression}")
+        self._compression = compression
+        self._queue: "Queue[str]" = Queue()
+        self._archives: List[str] = []
+        # The current run, which the tools may still write to
+        self._held: Optional[str] = None
+        self._thread = Thread(
+            target=self._run, daemon=True, name="testbase archiver")
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            directory = self._queue.get()
+            try:
+                self._archives.append(
+                    archive_directory(directory, self._compression))
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Unable to archive %s", directory)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, directory: str) -> None:
+        """
+        Queues a directory to be archived; does not wait.
+
+        :param directory: A finished run directory
+        """
+        self._queue.put(directory)
+
+    def hold(self, directory: str) -> None:
+        """
+        Keeps back the current run directory, queueing any held before.
+
+        The tools write to the current run until a newer one starts, and
+        write its errored file when the interpreter exits, so it is only
+        archived once a newer run is held or finish is called.
+
+        :param directory: The run directory the tools now point at
+        """
+        if self._held is not None and self._held != directory:
+            self.submit(self._held)
+        self._held = directory
+
+    def flush(self) -> List[str]:
+        """
+        Waits for all the queued directories to be archived.
+
+        :returns: The paths of all the archives written so far
+        """
+        self._queue.join()
+        return list(self._archives)
+
+    def finish(self) -> List[str]:
+        """
+        Archives the held directory too and waits.
+
+        :returns: The paths of all the archives written so far
+        """
+        if self._held is not None:
+            self.submit(self._held)
+            self._held = None
+        return self.flush()
+
+
+# pylint: disable=invalid-name
+_archiver: Optional[RunArchiver] = None
+
+
+def get_run_archiver() -> Optional[RunArchiver]:
+    """
+    Gets the archiver if TESTBASE_ARCHIVE is set to true.
+
+    Anything still queued or held is archived before the interpreter exits.
+    Exit handlers run in reverse order, so get the archiver before a run
+    starts for it to archive after the tools have written their errored
+    file.
+
+    :returns: The shared archiver or None if archiving is off
+    """
+    global _archiver  # pylint: disable=global-statement
+    if os.environ.get(ARCHIVE_ENV, 'false').lower() != 'true':
+        return None
+    if _archiver is None:
+        _archiver = RunArchiver(os.environ.get(ARCHIVE_FORMAT_ENV, "xz"))
+        atexit.register(_archiver.finish)
+    return _archiver
@@ -0,0 +1,131 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from .file_lock import update_json
+
+#: Environment variable with the JSON file holding the run history
+HISTORY_ENV = "TESTBASE_HISTORY"
+#: Environment variable with how many days a failure counts as recent
+RECENT_DAYS_ENV = "TESTBASE_HISTORY_DAYS"
+
+# Groups in the order they are run
+_FAILED = 0
+_CHANGED = 1
+_UNKNOWN = 2
+_PASSING = 3
+
+_T = TypeVar("_T", bound=Tuple)
+
+
+class RunHistory(object):
+    """
+    Remembers the last outcome and duration of each script.
+
+    Used to run the scripts most likely to fail first.
+    """
+
+    __slots__ = ("_path",)
+
+    def __init__(self, path: str):
+        """
+        :param path: The JSON file to hold the history
+        """
+        self._path = path
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self._path, encoding="utf-8") as history_file:
+                return json.load(history_file)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            # A damaged history just means the default order is used
+            return {}
+
+    def record(self, script_path: str, status: str, duration: float) -> None:
+        """
+        Records the outcome of a run of a script.
+
+        :param script_path: Path to the script
+        :param status: pass, skip, fail or error
+        :param duration: Seconds the run took
+        """
+        now = time.time()
+        key = os.path.abspath(script_path)
+
+        def _update(history: Dict[str, Dict]) -> Dict[str, Dict]:
+            entry = history.setdefault(key, {})
+            entry["status"] = status
+            entry["duration"] = duration
+            entry["last_run"] = now
+            if status in ("fail", "error"):
+                entry["last_failure"] = now
+            return history
+        update_json(self._path, _update)
+
+    def order(self, scripts: Sequence[_T]) -> List[_T]:
+        """
+        Sorts scripts so the ones most likely to fail come first.
+
+        First scripts that failed recently, most recent failure first.
+        Then scripts changed since their last run, then scripts with no
+        history, then the rest. Within each group the quickest run first.
+        The order only depends on the history and the scripts' modification
+        times, as recent is measured back from the latest recorded run.
+
+        :param scripts: Tuples whose first item is the script path
+        :returns: The same tuples in the order to run them
+        """
+        history = self._read()
+        latest = max((entry.get("last_run", 0.0)
+                      for entry in history.values()), default=0.0)
+        recent = latest - float(
+            os.environ.get(RECENT_DAYS_ENV, "7")) * 24 * 60 * 60
+
+        def key(script: _T) -> Tuple[int, float, float, str]:
+            path = os.path.abspath(script[0])
+            entry = history.get(path)
+            if entry is None:
+                return (_UNKNOWN, 0.0, 0.0, path)
+            duration = entry.get("duration", 0.0)
+            last_failure = entry.get("last_failure", 0.0)
+            if entry.get("status") in ("fail", "error") or \
+                    last_failure > recent:
+                return (_FAILED, -last_failure, duration, path)
+            try:
+                changed = os.path.getmtime(path) > entry.get("last_run", 0.0)
+            except OSError:
+                changed = True
+            return (_CHANGED if changed else _PASSING, 0.0, duration, path)
+
+        return sorted(scripts, key=key)
+
+
+def get_run_history() -> Optional[RunHistory]:
+    """
+    Gets the run history if one is configured.
+
+    The history is used when TESTBASE_HISTORY names a file.
+
+    :returns: The history or None if no history is configured
+    """
+    path = os.environ.get(HISTORY_ENV, None)
+    if not path:
+        return None
+    return RunHistory(path)
@@ -12,21 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
 import os
 import sys
 import time
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
-from unittest import SkipTest
+from unittest import SkipTest, TestLoader
 import matplotlib
 import matplotlib.pyplot as pyplot
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
 
+from .board_scheduler import (
+    BoardScheduler, ScriptOutcome, boards_from_env, find_test_script,
+    in_worker, virtual_boards)
+from .memory_tracker import MemoryTracker, memory_log_enabled
+from .metrics import record_script, record_script_start
+from .output_capture import capture_output
+from .preflight import preflight, preflight_enabled
+from .report_pruner import get_report_pruner
+from .report_staging import get_report_stager
+from .result_cache import ResultCache, get_result_cache
 from .root_test_case import RootTestCase
+from .run_history import get_run_history
+from .run_archiver import get_run_archiver
+from .trace_events import span
+from .warm_up import start_warm_up
+from .work_queue import (
+    LOCAL_WORKERS_ENV, WorkCoordinator, work_queue_address, work_queue_key)
 
 matplotlib.use('Agg')
 
+#: Environment variable with the number of virtual workers to run in parallel
+VIRTUAL_WORKERS_ENV = "TESTBASE_VIRTUAL_WORKERS"
+#: Environment variable with the version of virtual board to use
+VIRTUAL_VERSION_ENV = "TESTBASE_VIRTUAL_VERSION"
+
+logger = logging.getLogger(__name__)
+
 # pylint: disable=invalid-name
 script_checker_shown = False
+# The test methods pytest selected and unittest made, by class
+_pytest_selected: Dict[type, List[str]] = {}
+_instantiated: Dict[type, List[str]] = {}
 
 
 # This is a global function as pydevd calls _needsmain when debugging
@@ -41,18 +70,321 @@ def mockshow() -> None:
     script_checker_shown = True
 
 
+def virtual_workers() -> int:
+    """
+    Gets the number of virtual workers requested.
+
+    TESTBASE_VIRTUAL_WORKERS may be a number or "auto" for one per core.
+
+    :returns: Number of workers or 0 if parallel virtual mode is off
+    """
+    value = os.environ.get(VIRTUAL_WORKERS_ENV, "0").lower()
+    if value == "auto":
+        return os.cpu_count() or 1
+    return int(value)
+
+
+def _replay(outcome: ScriptOutcome) -> Callable[[RootTestCase], None]:
+    """
+    Makes a test method that reports the outcome of a parallel run.
+    """
+    def replay(self: RootTestCase) -> None:
+        if outcome.status == "skip":
+            raise SkipTest(outcome.message)
+        if outcome.status != "pass":
+            raise self.failureException(
+                f"{outcome.status} on {outcome.board}\n{outcome.message}")
+    return replay
+
+
+def pytest_collection_finish(session: Any) -> None:
+    """
+    Pytest hook that tells ScriptChecker which tests were selected.
+
+    Pytest makes every test case, even those deselected by -k or a node
+    id, so without this the parallel modes run the whole class.
+    To use it import it into the conftest.py of the tests::
+
+        from spinnaker_testbase.script_checker import (  # noqa
+            pytest_collection_finish)
+
+    :param session: The pytest session with the selected items
+    """
+    _pytest_selected.clear()
+    for item in session.items:
+        test_class = getattr(item, "cls", None)
+        if test_class is not None and issubclass(test_class, ScriptChecker):
+            _pytest_selected.setdefault(test_class, []).append(item.name)
+
+
 class ScriptChecker(RootTestCase):
     """
     Will run a script. Typically as part of Integration Tests.
+
+    If TESTBASE_WARM_UP is true the boards are pinged, and the session
+    machine allocated, in the background once the class is set up.
+
+    If TESTBASE_PREFLIGHT is true all the scripts are compiled before any
+    test is run. If TESTBASE_BINARY_PATHS is also set their declared
+    binaries are looked for there and in the installed model_binaries.
+
+    If TESTBASE_BOARDS lists real boards, as host:version,host:version,
+    the selected tests of the class are first run in parallel, one worker
+    per board, each worker with its own directory in board_reports.
+    Tests that need a version 5 board, marked with needs_spin_five or
+    running a script with a "# needs spin five" comment, only get one.
+    Otherwise if TESTBASE_VIRTUAL_WORKERS is set they are run the same way
+    on virtual boards, reporting to virtual_reports.
+    The tests then just report the outcome of that run.
+    Workers start afresh as TESTBASE_RECYCLE_SCRIPTS and
+    TESTBASE_RECYCLE_RSS_MB say, by default after every test. Listing a
+    single board in TESTBASE_BOARDS runs the tests one at a time, and is
+    the way to keep memory in check when running on hardware.
+    Under pytest, pytest_collection_finish must be imported into the
+    conftest.py for the selection to be known.
+
+    If TESTBASE_WORK_QUEUE is set the class instead coordinates workers,
+    which may be on other hosts, that pull the tests and run them.
+    Their reports and error files are merged into GLOBAL_REPORTS,
+    or merged_reports next to the test class.
+    TESTBASE_WORK_QUEUE_WORKERS workers are started on this host.
+    Workers start afresh as TESTBASE_RECYCLE_SCRIPTS and
+    TESTBASE_RECYCLE_RSS_MB say, by default after every test.
+
+    If TESTBASE_COVERAGE_INDEX names a file the binaries loaded by each
+    test whose runsafe call succeeds are recorded there. If TESTBASE_CHANGED
+    also lists changed binaries or C source directories, tests known not to
+    load them are skipped.
+
+    If TESTBASE_ARCHIVE is true each script's run directory is compressed
+    and removed in the background once a newer run has started, or at exit.
+
+    If TESTBASE_KEEP_RUNS or TESTBASE_MAX_REPORTS_MB is set, runs from
+    earlier sessions are removed from each reports folder in the background.
+
+    If TESTBASE_STAGE_REPORTS names a fast local directory the scripts
+    write their reports there. Each run is moved, or archived, to its
+    usual reports folder in the background once the next one starts.
     """
 
-    def _script_path(self, script: str) -> str:
+    #: Test methods replaced by replays and what they were, if anything
+    _replaced: Dict[str, Optional[Callable]] = {}
+
+    def __init__(self, methodName: str = "runTest"):
+        """
+        :param methodName: The test method this instance runs
+        """
+        super().__init__(methodName)
+        # unittest only makes the test cases it selected
+        _instantiated.setdefault(type(self), []).append(methodName)
+
+    @classmethod
+    def _selected_tests(cls) -> List[str]:
+        """
+        Gets the test methods of the class selected to run.
+
+        :returns: The names of the selected tests, or of all of them if the
+            selection is not known
+        """
+        names = TestLoader().getTestCaseNames(cls)
+        chosen = _pytest_selected.get(cls) or _instantiated.get(cls, [])
+        return [name for name in names if name in chosen] or list(names)
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        if in_worker():
+            return
+        selected = cls._selected_tests()
+        if preflight_enabled():
+            scripts = set()
+            for name in selected:
+                script = find_test_script(cls, name)
+                if script is not None:
+                    scripts.add(script)
+            problems = preflight(sorted(scripts))
+            if problems:
+                raise AssertionError(
+                    "Preflight check failed:\n" + "\n".join(problems))
+        # Started after preflight so its process pool is not forked
+        # while the warm up thread is running
+        start_warm_up()
+        class_file = sys.modules[cls.__module__].__file__
+        assert class_file is not None
+        class_dir = os.path.dirname(os.path.abspath(class_file))
+        address = work_queue_address()
+        if address is not None:
+            coordinator = WorkCoordinator(
+                address, work_queue_key(), os.environ.get(
+                    "GLOBAL_REPORTS", os.path.join(
+                        class_dir, "merged_reports")))
+            coordinator.start_local_workers(
+                int(os.environ.get(LOCAL_WORKERS_ENV, "0")))
+            cls._replay_all(coordinator.run_tests(
+                cls, selected, on_outcome=lambda outcome: record_script(
+                    outcome.status, outcome.duration)))
+            return
+        boards = boards_from_env()
+        reports_root = os.path.join(class_dir, "board_reports")
+        if not boards:
+            n_workers = virtual_workers()
+            if n_workers < 1:
+                return
+            version = int(os.environ.get(VIRTUAL_VERSION_ENV, "5"))
+            boards = virtual_boards(n_workers, version)
+            reports_root = os.path.join(class_dir, "virtual_reports")
+        scheduler = BoardScheduler(boards, reports_root)
+        cls._replay_all(scheduler.run_tests(
+            cls, selected, on_outcome=lambda outcome: record_script(
+                outcome.status, outcome.duration)))
+
+    @classmethod
+    def _replay_all(cls, outcomes: Sequence[ScriptOutcome]) -> None:
+        """
+        Replaces each test method with one reporting its outcome.
+
+        The test methods are put back by _restore_all.
+        """
+        cls._replaced = {}
+        for outcome in outcomes:
+            cls._replaced[outcome.test] = cls.__dict__.get(outcome.test)
+            setattr(cls, outcome.test, _replay(outcome))
+
+    @classmethod
+    def _restore_all(cls) -> None:
+        """
+        Puts back the test methods replaced by _replay_all.
+        """
+        for name, method in cls._replaced.items():
+            if method is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, method)
+        cls._replaced = {}
+
+    def setUp(self) -> None:
+        self._start_coverage()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._restore_all()
+        _pytest_selected.pop(cls, None)
+        _instantiated.pop(cls, None)
+        archiver = get_run_archiver()
+        if archiver is not None:
+            archiver.flush()
+        stager = get_report_stager()
+        if stager is not None:
+            stager.flush()
+
+    def _archive_run(self, previous_dir: Optional[str]) -> None:
+        """
+        Hands the directory of the run just made to the archiver.
+
+        The archiver holds it until a newer run starts, so the tools can
+        still write to it. Nothing is done if the script did not start a
+        new run, or if the global reports, and so the error file, are
+        inside the run directory.
+        Staged runs are archived by the report stager instead.
+        """
+        archiver = get_run_archiver()
+        if archiver is None or get_report_stager() is not None:
+            return
+        run_dir = self._timestamp_dir()
+        if run_dir is None or run_dir == previous_dir or \
+                not os.path.isdir(run_dir):
+            return
+        run_dir = os.path.abspath(run_dir)
+        reports = os.path.abspath(FecDataView.get_global_reports_dir())
+        if os.path.commonpath([run_dir, reports]) == run_dir:
+            return
+        archiver.hold(run_dir)
+
+    @staticmethod
+    def _record_outcome(script_path: str, status: str,
+                        duration: float) -> None:
+        """
+        Records how a script run went in the metrics and run history.
+        """
+        record_script(status, duration)
+        history = get_run_history()
+        if history is not None:
+            history.record(script_path, status, duration)
+
+    def _prune_reports(self) -> None:
+        """
+        Hands the reports folder of the run just made to the pruner.
+        """
+        pruner = get_report_pruner()
+        if pruner is None:
+            return
+        run_dir = self._timestamp_dir()
+        if run_dir is None:
+            return
+        # Run directories are made directly in the reports folder
+        reports_root = os.path.dirname(os.path.abspath(run_dir))
+        if os.path.basename(reports_root) != FecDataWriter.REPORTS_DIRNAME:
+            return
+        stager = get_report_stager()
+        if stager is not None:
+            # Prune where the staged runs end up
+            reports_root = stager.persistent_path(reports_root)
+        pruner.submit(reports_root, [
+            run_dir, os.path.dirname(FecDataView.get_error_file())])
+
+    def _root_dir(self) -> str:
         class_file = sys.modules[self.__module__].__file__
         assert class_file is not None
         integration_tests_directory = os.path.dirname(class_file)
         root_dir = os.path.dirname(integration_tests_directory)
         assert root_dir is not None
-        return os.path.join(root_dir, script)
+        return root_dir
+
+    def _script_path(self, script: str) -> str:
+        return os.path.join(self._root_dir(), script)
+
+    def _is_cached_pass(self, script: str, script_path: str,
+                        cache: Optional[ResultCache]) -> bool:
+        """
+        Checks the result cache, reporting a cached pass if there is one.
+        """
+        self._cached_binaries = None
+        if cache is None:
+            return False
+        try:
+            binaries = cache.cached_binaries(script_path, self._root_dir())
+        except Exception:  # pylint: disable=broad-except
+            # For example an imported helper that does not parse;
+            # running the script shows the real problem
+            logger.exception("Unable to check the result cache for %s",
+                             script)
+            return False
+        if binaries is None:
+            return False
+        self._cached_binaries = binaries
+        print(f"{script} cached pass")
+        self.report(f"cached pass for {script}", "scripts_cached")
+        record_script("cached", 0.0)
+        return True
+
+    def _update_cache(self, cache: Optional[ResultCache], script_path: str,
+                      passed: bool) -> None:
+        """
+        Records a pass in the result cache or forgets an earlier one.
+
+        A problem with the cache is only logged, so it does not change
+        the outcome of the script.
+        """
+        if cache is None:
+            return
+        try:
+            if passed:
+                cache.record_pass(
+                    script_path, self._root_dir(), self._binaries_loaded())
+            else:
+                cache.forget(script_path)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unable to update the result cache for %s",
+                             script_path)
 
     def check_script(self, script: str, broken_msg: Optional[str] = None,
                      skip_exceptions: Optional[List[type]] = None,
@@ -63,6 +395,20 @@ class ScriptChecker(RootTestCase):
         Includes a work around for matplotlib
         so it does not actually try to plot
 
+        If TESTBASE_RESULT_CACHE is set and nothing the script depends on
+        has changed since it last passed, it is reported as a cached pass
+        and not run.
+
+        If TESTBASE_CAPTURE_OUTPUT is set the script's output is held back
+        and only shown if the script fails or is retried.
+
+        If TESTBASE_MEMORY_LOG is true the growth in memory is reported.
+        Run in this process the scripts share its memory; to have the
+        process replaced as it grows use TESTBASE_BOARDS, see ScriptChecker.
+
+        If TESTBASE_HISTORY is set the outcome and duration are recorded so
+        RootScriptBuilder can put the scripts likely to fail first.
+
         :param script: relative path to the file to run
         :param broken_msg:
             message to print instead of raising an exception;
@@ -79,6 +425,9 @@ class ScriptChecker(RootTestCase):
         global script_checker_shown
 
         script_path = self._script_path(script)
+        cache = get_result_cache()
+        if self._is_cached_pass(script, script_path, cache):
+            return
         if use_script_dir:
             self._setup(script_path)
         # pylint: disable=import-outside-toplevel
@@ -88,20 +437,35 @@ class ScriptChecker(RootTestCase):
             script_checker_shown = False
             pyplot.show = mockshow
         from runpy import run_path
+        record_script_start(script)
+        # Before the run so its exit handler archives after the tools'
+        get_run_archiver()
+        previous_dir = self._timestamp_dir()
+        start = time.time()
         try:
-            start = time.time()
-            self.runsafe(lambda: run_path(script_path),
-                         skip_exceptions=skip_exceptions)
+            with span("script", script=script), capture_output(), \
+                    MemoryTracker() as memory:
+                self.runsafe(lambda: run_path(script_path),
+                             skip_exceptions=skip_exceptions)
             duration = time.time() - start
             self.report(f"{duration} for {script}", "scripts_ran_successfully")
-            if plotting:
-                if not script_checker_shown:
-                    raise SkipTest(f"{script} did not plot")
+            if memory_log_enabled():
+                self.report(memory.summary(script), "scripts_memory")
+            if plotting and not script_checker_shown:
+                raise SkipTest(f"{script} did not plot")
+            self._update_cache(cache, script_path, True)
+            self._record_outcome(script_path, "pass", duration)
         except SkipTest:
+            self._record_outcome(script_path, "skip", time.time() - start)
             raise
         except Exception as ex:  # pylint: disable=broad-except
+            self._record_outcome(script_path, "fail", time.time() - start)
+            self._update_cache(cache, script_path, False)
             if broken_msg:
                 self.report(script, broken_msg)
             else:
                 print(f"Error on {script}")
                 raise ex
+        finally:
+            self._archive_run(previous_dir)
+            self._prune_reports()
@@ -0,0 +1,201 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import os
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from spalloc_client import Job
+from spalloc_client.job import JobDestroyedError
+from spalloc_client.states import JobState
+from spinn_front_end_common.utilities.utility_calls import parse_old_spalloc
+
+from .board_scheduler import in_worker
+from .config_overrides import add_config_override, remove_config_override
+
+#: Environment variable that turns on session machine mode
+SESSION_MACHINE_ENV = "TESTBASE_SESSION_MACHINE"
+#: Optional environment variable with the old style spalloc server to use
+SESSION_SPALLOC_ENV = "TESTBASE_SESSION_SPALLOC"
+
+_MACHINE_OPTIONS = {
+    "spalloc_server": None,
+    "remote_spinnaker_url": None,
+    "virtual_board": "False",
+    "version": "5"}
+
+
+class SessionMachine(object):
+    """
+    Holds one spalloc job and hands it to each script in turn.
+
+    The boards are power cycled between scripts so each starts clean.
+    If the job has been destroyed a new one is requested.
+    """
+
+    __slots__ = ("_fresh", "_job", "_job_factory", "_lock", "_n_boards",
+                 "_scripts_run")
+
+    def __init__(self, n_boards: int = 1,
+                 job_factory: Optional[Callable[..., Any]] = None):
+        """
+        :param n_boards: Number of boards to request
+        :param job_factory:
+            Callable that creates the job. Defaults to a spalloc Job.
+            The result must support the spalloc Job methods used here.
+        """
+        self._job: Any = None
+        self._n_boards = n_boards
+        if job_factory is None:
+            job_factory = self._spalloc_job
+        self._job_factory = job_factory
+        self._scripts_run = 0
+        # True while the job is allocated but no script has used it
+        self._fresh = False
+        # Held while the job is changed, so a warm up and a script wait
+        # for each other
+        self._lock = Lock()
+
+    @staticmethod
+    def _spalloc_job(n_boards: int) -> Job:
+        server = os.environ.get(SESSION_SPALLOC_ENV, None)
+        if server:
+            host, port, owner = parse_old_spalloc(server, 22244, "")
+            return Job(n_boards, hostname=host, port=port, owner=owner)
+        return Job(n_boards)
+
+    @property
+    def hostname(self) -> Optional[str]:
+        """
+        The IP address of the job's root board or None if no job is held.
+        """
+        if self._job is None:
+            return None
+        return self._job.hostname
+
+    @property
+    def scripts_run(self) -> int:
+        """
+        The number of times this session has prepared the boards, once for
+        each script and for each retry.
+        """
+        return self._scripts_run
+
+    def _allocate(self) -> None:
+        job = self._job_factory(self._n_boards)
+        try:
+            job.wait_until_ready()
+            hostname = job.hostname
+        except Exception as ex:
+            job.destroy(str(ex))
+            raise
+        self._job = job
+        self._fresh = True
+        add_config_override("Machine", "machine_name", hostname)
+        for option, value in _MACHINE_OPTIONS.items():
+            add_config_override("Machine", option, value)
+
+    def _drop_job(self) -> None:
+        if self._job is not None:
+            try:
+                self._job.close()
+            except Exception:  # pylint: disable=broad-except
+                pass
+        self._job = None
+
+    def warm_up(self) -> None:
+        """
+        Requests the job before any script needs it.
+
+        Does nothing if a job is already held.
+        A script calling prepare meanwhile waits for the job.
+        """
+        with self._lock:
+            if self._job is None:
+                self._allocate()
+
+    def prepare(self) -> None:
+        """
+        Makes sure the boards are allocated and clean for the next script
+        or for a retry.
+
+        On the first call the job is requested, unless warm_up already did.
+        On later calls the boards are power cycled.
+        A destroyed job is replaced with a new one.
+        """
+        with self._lock:
+            if self._job is not None:
+                try:
+                    if self._job.state == JobState.destroyed:
+                        raise JobDestroyedError(self._job.reason)
+                    if not self._fresh:
+                        self._job.reset()
+                    self._job.wait_until_ready()
+                except JobDestroyedError:
+                    self._drop_job()
+            if self._job is None:
+                self._allocate()
+            self._fresh = False
+            self._scripts_run += 1
+
+    def renew(self) -> None:
+        """
+        Replaces the job with a new one.
+
+        Used when the job is known to be unusable even if spalloc still
+        reports it as ready.
+        """
+        with self._lock:
+            self._drop_job()
+            self._allocate()
+
+    def release(self) -> None:
+        """
+        Destroys the job and stops forcing the config to use it.
+        """
+        with self._lock:
+            if self._job is not None:
+                try:
+                    self._job.destroy("Test session finished")
+                finally:
+                    self._drop_job()
+        remove_config_override("Machine", "machine_name")
+        for option in _MACHINE_OPTIONS:
+            remove_config_override("Machine", option)
+
+
+# pylint: disable=invalid-name
+_session: Optional[SessionMachine] = None
+
+
+def get_session_machine() -> Optional[SessionMachine]:
+    """
+    Gets the session machine if session mode is turned on.
+
+    Session mode is turned on by setting TESTBASE_SESSION_MACHINE to true.
+    It is always off in scheduler workers as they are given a board.
+    The job is destroyed when the Python process exits.
+
+    :returns: The shared SessionMachine or None if not in session mode
+    """
+    global _session  # pylint: disable=global-statement
+    if os.environ.get(SESSION_MACHINE_ENV, 'false').lower() != 'true':
+        return None
+    if in_worker():
+        return None
+    if _session is None:
+        _session = SessionMachine()
+        atexit.register(_session.release)
+    return _session
@@ -17,6 +17,7 @@ import unittest
 
 from spinn_front_end_common.data import FecDataView
 from .base_test_case import BaseTestCase
+from .error_journal import ErrorJournal, journal_line
 
 
 class TestNoJobDestory(BaseTestCase):
@@ -26,16 +27,22 @@ class TestNoJobDestory(BaseTestCase):
 
     def test_no_destory_file(self) -> None:
         """
-        Checks for the error file and prints it out if found
+        Checks for the error file and prints a summary if found
+
+        One line is printed per distinct error, with how often it happened.
 
         :raise AssertionError: if the error file exists
         """
-        if os.path.exists(FecDataView.get_error_file()):
-            with open(FecDataView.get_error_file(),
-                      encoding="utf-8") as error_file:
-                error_text = error_file.read()
-            print(error_text)
-            raise AssertionError(error_text)
+        error_path = FecDataView.get_error_file()
+        if os.path.exists(error_path):
+            n_records = 0
+            n_errors = 0
+            for record in ErrorJournal(error_path).records():
+                print(journal_line(record))
+                n_records += 1
+                n_errors += record.get("count", 1)
+            raise AssertionError(
+                f"{n_errors} errors of {n_records} kinds in {error_path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+#: Environment variable with the file to write trace events to
+TRACE_ENV = "TESTBASE_TRACE"
+
+
+def trace_path() -> Optional[str]:
+    """
+    Gets the trace file set in TESTBASE_TRACE.
+
+    :returns: The path or None if tracing is off
+    """
+    return os.environ.get(TRACE_ENV) or None
+
+
+def _create(path: str) -> None:
+    """
+    Creates the trace file holding the opening bracket, if not there.
+
+    The bracket is written to a private file which is then linked into
+    place, so no process can append an event before the bracket.
+    """
+    if os.path.exists(path):
+        return
+    temp_path = f"{path}.{os.getpid()}"
+    with open(temp_path, "wb") as temp_file:
+        temp_file.write(b"[\n")
+    try:
+        os.link(temp_path, path)
+    except FileExistsError:
+        pass
+    finally:
+        os.remove(temp_path)
+
+
+def _write(path: str, event: Dict[str, Any]) -> None:
+    """
+    Appends one event to the trace file.
+
+    The file is a JSON array with no closing bracket, which trace viewers
+    accept. Each event is a single append so processes can share the file.
+    """
+    _create(path)
+    handle = os.open(path, os.O_WRONLY | os.O_APPEND)
+    try:
+        os.write(handle, (json.dumps(event) + ",\n").encode("utf-8"))
+    finally:
+        os.close(handle)
+
+
+def name_process(name: str) -> None:
+    """
+    Labels the lane of this process in the trace viewer.
+
+    :param name: Label for the process
+    """
+    path = trace_path()
+    if path is not None:
+        _write(path, {
+            "name": "process_name", "ph": "M", "pid": os.getpid(),
+            "tid": threading.get_native_id(), "args": {"name": name}})
+
+
+@contextmanager
+def span(name: str, category: str = "testbase",
+         **args: Any) -> Iterator[None]:
+    """
+    Records the time spent inside the context as a complete event.
+
+    Does nothing if TESTBASE_TRACE is not set.
+
+    :param name: Name shown on the span
+    :param category: Category used to filter spans in the viewer
+    :param args: Extra details shown when the span is selected
+    :returns: Nothing; the span covers the body of the context
+    """
+    path = trace_path()
+    if path is None:
+        yield
+        return
+    start = time.time_ns()
+    try:
+        yield
+    finally:
+        _write(path, {
+            "name": name, "cat": category, "ph": "X",
+            "ts": start / 1000, "dur": (time.time_ns() - start) / 1000,
+            "pid": os.getpid(), "tid": threading.get_native_id(),
+            "args": {key: str(value) for key, value in args.items()}})
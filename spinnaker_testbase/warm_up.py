@@ -0,0 +1,106 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+from threading import Thread
+from typing import Any, List, Optional
+
+from .board_scheduler import WORKER_BOARD_ENV, boards_from_env
+
+#: Environment variable that turns on the warm up
+WARM_UP_ENV = "TESTBASE_WARM_UP"
+#: Environment variable with a comma separated list of boards to ping
+WARM_UP_HOSTS_ENV = "TESTBASE_WARM_UP_HOSTS"
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up_hosts() -> List[str]:
+    """
+    :returns: The boards named in TESTBASE_WARM_UP_HOSTS and TESTBASE_BOARDS
+    """
+    hosts = [host.strip() for host in
+             os.environ.get(WARM_UP_HOSTS_ENV, "").split(",") if host.strip()]
+    return hosts + [board.name for board in boards_from_env()
+                    if board.name not in hosts]
+
+
+def warm_up() -> None:
+    """
+    Pings the boards and allocates the session machine, if there is one.
+
+    The boards are pinged once, at the same time. Those that answer are
+    remembered by Ping for a while, so the first test does not wait for
+    them. Failures are only logged, and not remembered; the test that
+    needs the resource will try again and report the problem.
+    """
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ThreadPoolExecutor
+    from .ping import Ping
+    from .session_machine import get_session_machine
+
+    hosts = warm_up_hosts()
+    if hosts:
+        with ThreadPoolExecutor(len(hosts)) as executor:
+            for host, reachable in zip(
+                    hosts, executor.map(Ping.answers, hosts)):
+                if not reachable:
+                    logger.warning("Board %s did not answer a ping", host)
+    session = get_session_machine()
+    if session is not None:
+        try:
+            session.warm_up()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Unable to allocate the session machine early")
+
+
+# pylint: disable=invalid-name
+_thread: Optional[Thread] = None
+
+
+def start_warm_up() -> Optional[Thread]:
+    """
+    Starts the warm up in the background if TESTBASE_WARM_UP is true.
+
+    Called by ScriptChecker.setUpClass, or earlier by pytest_sessionstart.
+    Only the first call starts a thread. Worker processes never warm up
+    as they are given their board.
+
+    :returns: The warm up thread or None if there is no warm up
+    """
+    global _thread  # pylint: disable=global-statement
+    if os.environ.get(WARM_UP_ENV, 'false').lower() != 'true':
+        return None
+    if WORKER_BOARD_ENV in os.environ:
+        return None
+    if _thread is None:
+        _thread = Thread(target=warm_up, daemon=True,
+                         name="testbase warm up")
+        _thread.start()
+    return _thread
+
+
+def pytest_sessionstart(session: Any) -> None:
+    """
+    Pytest hook that starts the warm up before the tests are collected.
+
+    To use it import it into the conftest.py of the tests::
+
+        from spinnaker_testbase.warm_up import pytest_sessionstart  # noqa
+
+    :param session: The pytest session; not used
+    """
+    _ = session
+    start_warm_up()
@@ -0,0 +1,451 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+from collections import deque
+import logging
+import multiprocessing
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from multiprocessing.process import BaseProcess
+import os
+import shutil
+import socket
+import stat
+import sys
+import tempfile
+from threading import Condition, Thread
+import time
+from typing import (
+    Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple, Type,
+    Union)
+import unittest
+
+from .board_scheduler import (
+    WORKER_BOARD_ENV, ScriptOutcome, run_test_method)
+from .error_journal import ERROR_FILE_NAME, ErrorJournal
+from .memory_tracker import RecyclePolicy, current_rss
+from .trace_events import name_process
+
+#: Environment variable with the address of the work queue;
+#: host:port for TCP or the path of a local socket
+WORK_QUEUE_ENV = "TESTBASE_WORK_QUEUE"
+#: Environment variable with the shared secret workers must know
+WORK_QUEUE_KEY_ENV = "TESTBASE_WORK_QUEUE_KEY"
+#: Environment variable with the number of workers the coordinator starts
+LOCAL_WORKERS_ENV = "TESTBASE_WORK_QUEUE_WORKERS"
+
+Address = Union[str, Tuple[str, int]]
+# Module, class and method name of a test
+_Task = Tuple[str, str, str]
+
+logger = logging.getLogger(__name__)
+
+
+def parse_address(text: str) -> Address:
+    """
+    Converts the text form of a work queue address.
+
+    :param text: host:port for TCP or the path of a local socket
+    :returns: The address in the form multiprocessing.connection uses
+    """
+    host, _, port = text.rpartition(":")
+    if host and port.isdigit():
+        return (host, int(port))
+    return text
+
+
+def work_queue_address() -> Optional[Address]:
+    """
+    Gets the address in TESTBASE_WORK_QUEUE.
+
+    :returns: The address or None if the work queue is not in use
+    """
+    text = os.environ.get(WORK_QUEUE_ENV, None)
+    if not text:
+        return None
+    return parse_address(text)
+
+
+def work_queue_key() -> bytes:
+    """
+    Gets the secret in TESTBASE_WORK_QUEUE_KEY.
+
+    :returns: The secret as bytes
+    :raises ValueError: If no secret is set
+    """
+    key = os.environ.get(WORK_QUEUE_KEY_ENV, None)
+    if not key:
+        raise ValueError(f"{WORK_QUEUE_KEY_ENV} must be set to use the "
+                         f"work queue")
+    return key.encode("utf-8")
+
+
+class _ReportTail(object):
+    """
+    Reads what has been added to the files in a reports directory.
+    """
+
+    __slots__ = ("_directory", "_offsets")
+
+    def __init__(self, directory: str):
+        """
+        :param directory: The directory to watch
+        """
+        self._directory = directory
+        self._offsets: Dict[str, int] = {}
+
+    def read_new(self) -> Dict[str, str]:
+        """
+        :returns: Text added since the last call keyed by file name
+        """
+        added = {}
+        for name in sorted(os.listdir(self._directory)):
+            path = os.path.join(self._directory, name)
+            if name == ERROR_FILE_NAME or not os.path.isfile(path):
+                continue
+            with open(path, "rb") as report_file:
+                report_file.seek(self._offsets.get(name, 0))
+                data = report_file.read()
+            if data:
+                self._offsets[name] = self._offsets.get(name, 0) + len(data)
+                added[name] = data.decode("utf-8", "replace")
+        return added
+
+
+def run_worker(address: Address, authkey: bytes, name: Optional[str] = None,
+               policy: Optional[RecyclePolicy] = None) -> Tuple[int, bool]:
+    """
+    Pulls tests from a coordinator and runs them until none are left,
+    or until the process is due to be replaced by a fresh one.
+
+    The global reports of this process are written to a private directory
+    and what each test adds to them is sent back with its result, as are
+    the records of the error file.
+
+    :param address: Where the coordinator listens
+    :param authkey: The secret shared with the coordinator
+    :param name: Name reported with each result; defaults to host and pid
+    :param policy:
+        When to stop so the process can be replaced.
+        Defaults to RecyclePolicy.from_env()
+    :returns: The number of tests run and True if the worker stopped to
+        be replaced rather than because no tests were left
+    """
+    if name is None:
+        name = f"{socket.gethostname()}-{os.getpid()}"
+    if policy is None:
+        policy = RecyclePolicy.from_env()
+    os.environ[WORKER_BOARD_ENV] = name
+    name_process(f"worker {name}")
+    reports_dir = tempfile.mkdtemp(prefix="testbase_worker_")
+    os.environ["GLOBAL_REPORTS"] = reports_dir
+    tail = _ReportTail(reports_dir)
+    n_run = 0
+    try:
+        with Client(address, authkey=authkey) as connection:
+            connection.send(("hello", name))
+            while True:
+                task = connection.recv()
+                if task is None:
+                    return n_run, False
+                start = time.time()
+                status, message = run_test_method(*task, worker=name)
+                n_run += 1
+                recycle = policy.should_recycle(n_run, current_rss())
+                connection.send((
+                    "result", status, message, time.time() - start,
+                    tail.read_new(), ErrorJournal(os.path.join(
+                        reports_dir, ERROR_FILE_NAME)).take(), recycle))
+                if recycle:
+                    return n_run, True
+    finally:
+        shutil.rmtree(reports_dir, ignore_errors=True)
+
+
+class WorkCoordinator(object):  # pylint: disable=too-many-instance-attributes
+    """
+    Hands out the tests of a generated class to workers that ask for them.
+
+    Workers connect, possibly from other hosts, and pull one test at a
+    time, so faster workers take more of the work. Each result comes back
+    with what the test added to the worker's global reports, which is
+    appended to the file of the same name in one reports directory.
+    The workers' error records are merged into one error file.
+
+    A test whose worker is lost is handed to another worker once and then
+    reported as an error. Without local workers the coordinator waits
+    for remote workers for as long as it takes.
+    Workers leave once their RecyclePolicy is due; local workers that do
+    are replaced while tests remain.
+    A coordinator runs the tests of a single call to run_tests.
+    """
+
+    __slots__ = ("_authkey", "_condition", "_connected", "_listener",
+                 "_local", "_outcomes", "_pending", "_reports_dir",
+                 "_retried", "_tests")
+
+    def __init__(self, address: Address, authkey: bytes, reports_dir: str):
+        """
+        :param address:
+            Where to listen; host:port as a tuple or the path of a local
+            socket. Port 0 picks a free port.
+        :param authkey: The secret workers must know
+        :param reports_dir: Directory to merge the workers' reports into
+        """
+        if isinstance(address, str) and os.path.exists(address) and \
+                stat.S_ISSOCK(os.stat(address).st_mode):
+            # Left behind by an earlier coordinator
+            os.remove(address)
+        self._listener = Listener(address, authkey=authkey)
+        self._authkey = authkey
+        self._reports_dir = reports_dir
+        os.makedirs(reports_dir, exist_ok=True)
+        self._condition = Condition()
+        self._tests: List[_Task] = []
+        self._pending: Deque[int] = deque()
+        self._outcomes: List[Optional[ScriptOutcome]] = []
+        self._retried: Set[int] = set()
+        self._connected = 0
+        # Local worker processes by name
+        self._local: Dict[str, BaseProcess] = {}
+
+    @property
+    def address(self) -> Address:
+        """
+        The address workers connect to, with the real port if 0 was asked.
+        """
+        return self._listener.address
+
+    def start_local_workers(self, n_workers: int) -> None:
+        """
+        Starts workers on this host in separate processes.
+
+        :param n_workers: Number of workers to start
+        """
+        for index in range(len(self._local), len(self._local) + n_workers):
+            self._start_local_worker(f"local{index}")
+
+    def _start_local_worker(self, name: str) -> None:
+        process = multiprocessing.get_context("spawn").Process(
+            target=run_worker, args=(self.address, self._authkey, name))
+        process.start()
+        self._local[name] = process
+
+    def _unfinished(self) -> bool:
+        return any(outcome is None for outcome in self._outcomes)
+
+    def _next_task(self) -> Optional[int]:
+        """
+        Waits for a test to hand out.
+
+        Idle workers wait while others are busy in case a test comes back.
+        """
+        with self._condition:
+            while not self._pending and self._unfinished():
+                self._condition.wait()
+            if self._pending:
+                return self._pending.popleft()
+            return None
+
+    def _merge_reports(self, reports: Dict[str, str],
+                       errors: List[Dict[str, Any]]) -> None:
+        for name, text in reports.items():
+            with open(os.path.join(self._reports_dir, name), "a",
+                      encoding="utf-8") as report_file:
+                report_file.write(text)
+        if errors:
+            ErrorJournal(os.path.join(
+                self._reports_dir, ERROR_FILE_NAME)).merge(errors)
+
+    def _finish(self, index: int, outcome: ScriptOutcome,
+                on_outcome: Optional[Callable[[ScriptOutcome], None]]
+                ) -> None:
+        with self._condition:
+            self._outcomes[index] = outcome
+            self._condition.notify_all()
+        if on_outcome is not None:
+            on_outcome(outcome)
+
+    def _lost(self, index: int, worker: str,
+              on_outcome: Optional[Callable[[ScriptOutcome], None]]) -> None:
+        with self._condition:
+            if index not in self._retried:
+                self._retried.add(index)
+                self._pending.appendleft(index)
+                self._condition.notify_all()
+                return
+        self._finish(index, ScriptOutcome(
+            self._tests[index][2], "error", worker, 0.0,
+            f"Lost worker {worker} twice"), on_outcome)
+
+    def _serve(self, connection: Connection,
+               on_outcome: Optional[Callable[[ScriptOutcome], None]]
+               ) -> None:
+        """
+        Answers one worker until it is told to stop or goes away.
+        """
+        worker = "unknown"
+        current: Optional[int] = None
+        try:
+            while True:
+                message = connection.recv()
+                if message[0] == "hello":
+                    worker = message[1]
+                elif message[0] == "result" and current is not None:
+                    (_, status, text, duration, reports, errors,
+                     recycle) = message
+                    with self._condition:
+                        self._merge_reports(reports, errors)
+                    self._finish(current, ScriptOutcome(
+                        self._tests[current][2], status, worker, duration,
+                        text), on_outcome)
+                    if recycle:
+                        current = None
+                        self._replace(worker)
+                        return
+                current = self._next_task()
+                connection.send(
+                    None if current is None else self._tests[current])
+                if current is None:
+                    return
+        except (EOFError, OSError):
+            if current is not None:
+                self._lost(current, worker, on_outcome)
+        finally:
+            connection.close()
+            with self._condition:
+                self._connected -= 1
+                self._condition.notify_all()
+
+    def _replace(self, worker: str) -> None:
+        """
+        Starts a fresh process for a local worker that is leaving.
+
+        Started before the old one is forgotten, so the coordinator never
+        sees a moment with no local workers.
+        """
+        with self._condition:
+            old = self._local.get(worker)
+            if old is None or not self._unfinished():
+                return
+            self._start_local_worker(worker)
+        old.join()
+
+    def _accept(self, on_outcome: Optional[Callable[[ScriptOutcome], None]]
+                ) -> None:
+        while True:
+            try:
+                connection = self._listener.accept()
+            except AuthenticationError:
+                logger.warning("Refused a worker with the wrong key")
+                continue
+            except OSError:
+                return
+            with self._condition:
+                if not self._unfinished():
+                    connection.close()
+                    return
+                self._connected += 1
+            Thread(target=self._serve, args=(connection, on_outcome),
+                   daemon=True, name="testbase work queue").start()
+
+    def _abandon_if_no_workers(self) -> None:
+        """
+        Reports the remaining tests as errors if every local worker died.
+
+        Only applies when there were local workers and no remote ones.
+        """
+        if not self._local or self._connected or any(
+                process.is_alive() for process in self._local.values()):
+            return
+        for index, outcome in enumerate(self._outcomes):
+            if outcome is None:
+                self._outcomes[index] = ScriptOutcome(
+                    self._tests[index][2], "error", None, 0.0,
+                    "No workers left")
+        self._pending.clear()
+        self._condition.notify_all()
+
+    def _close(self) -> None:
+        # Wakes the accepting thread so it sees the work is done
+        try:
+            Client(self.address, authkey=self._authkey).close()
+        except (OSError, EOFError, AuthenticationError):
+            pass
+        self._listener.close()
+        for process in self._local.values():
+            process.join()
+
+    def run_tests(self, test_class: Type[unittest.TestCase],
+                  method_names: Optional[Sequence[str]] = None,
+                  on_outcome: Optional[Callable[[ScriptOutcome], None]] = None
+                  ) -> List[ScriptOutcome]:
+        """
+        Runs the test methods on whichever workers ask for them.
+
+        :param test_class: The generated TestScripts class
+        :param method_names:
+            The test methods to run. Defaults to all starting with test
+        :param on_outcome:
+            Called with each outcome as soon as its test finishes
+        :returns: One outcome per method in the order given
+        """
+        if method_names is None:
+            method_names = unittest.TestLoader().getTestCaseNames(test_class)
+        name_process("coordinator")
+        with self._condition:
+            self._tests = [(test_class.__module__, test_class.__name__, name)
+                           for name in method_names]
+            self._pending = deque(range(len(self._tests)))
+            self._outcomes = [None] * len(self._tests)
+        Thread(target=self._accept, args=(on_outcome,), daemon=True,
+               name="testbase work queue listener").start()
+        try:
+            with self._condition:
+                while self._unfinished():
+                    self._condition.wait(1.0)
+                    self._abandon_if_no_workers()
+                # Stops idle workers waiting for a test to come back
+                self._condition.notify_all()
+        finally:
+            self._close()
+        return [outcome for outcome in self._outcomes if outcome is not None]
+
+
+def main() -> None:
+    """
+    Runs a worker for the coordinator given on the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run tests handed out by a testbase work queue. "
+                    f"The secret is read from {WORK_QUEUE_KEY_ENV}. "
+                    "The worker starts afresh whenever its recycle "
+                    "policy is due.")
+    parser.add_argument(
+        "address", help="host:port or local socket path of the coordinator")
+    parser.add_argument("--name", help="Name to report results under")
+    args = parser.parse_args()
+    n_run, recycle = run_worker(parse_address(args.address),
+                                work_queue_key(), args.name)
+    print(f"Ran {n_run} tests")
+    if recycle:
+        sys.stdout.flush()
+        os.execv(sys.executable, [
+            sys.executable, "-m", "spinnaker_testbase.work_queue"] +
+            sys.argv[1:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+from threading import Thread
+import time
+import unittest
+from unittest import mock
+
+from spinnaker_testbase import board_scheduler
+from spinnaker_testbase.board_scheduler import (
+    Board, BoardLeaseManager, BoardScheduler, boards_from_env,
+    method_needs_spin_five, needs_spin_five, script_needs_spin_five,
+    virtual_boards)
+from spinnaker_testbase.config_overrides import get_config_overrides
+from spinnaker_testbase.memory_tracker import RecyclePolicy
+from spinnaker_testbase.root_test_case import RootTestCase
+
+
+class VirtualScripts(unittest.TestCase):
+    """
+    Methods run by the scheduler in worker processes.
+
+    None start with test so they are only run through the scheduler.
+    """
+
+    def check_virtual(self) -> None:
+        overrides = get_config_overrides()
+        self.assertEqual("True", overrides[("Machine", "virtual_board")])
+
+    def check_reports(self) -> None:
+        overrides = get_config_overrides()
+        reports = overrides[("Reports", "default_report_file_path")]
+        self.assertEqual(os.environ["TESTBASE_WORKER_BOARD"],
+                         os.path.basename(reports))
+
+    def check_skip(self) -> None:
+        raise unittest.SkipTest("not today")
+
+    def check_fail(self) -> None:
+        self.fail("expected")
+
+    def check_crash(self) -> None:
+        os._exit(3)
+
+    @needs_spin_five
+    def check_spin_five(self) -> None:
+        pass
+
+    def check_pid(self) -> None:
+        pid_dir = os.environ["TESTBASE_TEST_PID_DIR"]
+        with open(os.path.join(pid_dir, str(os.getpid())), "a",
+                  encoding="utf-8") as pid_file:
+            pid_file.write("ran\n")
+
+
+class SpinFiveScripts(RootTestCase):
+    """
+    Only checked for what it needs; never run.
+    """
+
+    def check_not_spin_three(self) -> None:
+        self.assert_not_spin_three()
+
+
+class TestBoardScheduler(unittest.TestCase):
+
+    def test_lease_prefers_spin_three(self) -> None:
+        leases = BoardLeaseManager(
+            [Board("five", 5), Board("three", 3)])
+        board = leases.acquire()
+        self.assertEqual("three", board.name)
+        self.assertEqual("five", leases.acquire(True).name)
+        self.assertEqual(0, leases.n_free)
+        leases.release(board)
+        self.assertEqual(1, leases.n_free)
+
+    def test_lease_waits(self) -> None:
+        leases = BoardLeaseManager([Board("only", 5)])
+        held = leases.acquire()
+        got = []
+        waiter = Thread(target=lambda: got.append(leases.acquire()))
+        waiter.start()
+        time.sleep(0.1)
+        self.assertEqual([], got)
+        leases.release(held)
+        waiter.join(5)
+        self.assertEqual([held], got)
+
+    def test_no_suitable_board(self) -> None:
+        leases = BoardLeaseManager([Board("three", 3)])
+        self.assertFalse(leases.can_satisfy(True))
+        with self.assertRaises(ValueError):
+            leases.acquire(True)
+
+    def test_spin_five_only(self) -> None:
+        self.assertTrue(
+            method_needs_spin_five(VirtualScripts, "check_spin_five"))
+        self.assertTrue(
+            method_needs_spin_five(SpinFiveScripts, "check_not_spin_three"))
+        self.assertFalse(
+            method_needs_spin_five(VirtualScripts, "check_virtual"))
+        scheduler = BoardScheduler(virtual_boards(1, version=3))
+        outcomes = scheduler.run_tests(VirtualScripts, ["check_spin_five"])
+        self.assertEqual("skip", outcomes[0].status)
+        self.assertEqual("No suitable board", outcomes[0].message)
+
+    def test_script_needs_spin_five(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            marked = os.path.join(temp, "marked.py")
+            with open(marked, "w", encoding="utf-8") as script:
+                script.write("import pyNN.spiNNaker as sim\n"
+                             "# Needs spin 5 as it uses 20 chips\n")
+            plain = os.path.join(temp, "plain.py")
+            with open(plain, "w", encoding="utf-8") as script:
+                script.write("print('needs spin five')\n")
+            self.assertTrue(script_needs_spin_five(marked))
+            self.assertFalse(script_needs_spin_five(plain))
+            self.assertFalse(script_needs_spin_five(
+                os.path.join(temp, "missing.py")))
+            with mock.patch.object(board_scheduler, "find_test_script",
+                                   return_value=marked):
+                self.assertTrue(
+                    method_needs_spin_five(VirtualScripts, "check_virtual"))
+
+    def test_boards_from_env(self) -> None:
+        with mock.patch.dict(os.environ, {"TESTBASE_BOARDS": ""}):
+            self.assertEqual([], boards_from_env())
+        with mock.patch.dict(os.environ, {
+                "TESTBASE_BOARDS": "192.168.240.1:5, spin3:3,,other"}):
+            self.assertEqual(
+                [Board("192.168.240.1", 5), Board("spin3", 3),
+                 Board("other", 5)], boards_from_env())
+        with mock.patch.dict(os.environ, {"TESTBASE_BOARDS": "spin3:three"}):
+            with self.assertRaises(ValueError):
+                boards_from_env()
+
+    def test_run_on_virtual_boards(self) -> None:
+        scheduler = BoardScheduler(virtual_boards(2))
+        outcomes = scheduler.run_tests(
+            VirtualScripts,
+            ["check_virtual", "check_skip", "check_fail", "check_crash"])
+        self.assertEqual(["pass", "skip", "fail", "error"],
+                         [outcome.status for outcome in outcomes])
+        self.assertIn("code 3", outcomes[3].message)
+
+    def test_reports_per_board(self) -> None:
+        with tempfile.TemporaryDirectory() as reports_root:
+            scheduler = BoardScheduler(virtual_boards(2), reports_root)
+            outcomes = scheduler.run_tests(
+                VirtualScripts, ["check_reports", "check_reports"])
+            self.assertEqual(["pass", "pass"],
+                             [outcome.status for outcome in outcomes])
+            used = os.listdir(reports_root)
+            self.assertTrue(used)
+            self.assertTrue(set(used) <= {"virtual0", "virtual1"})
+
+    def test_recycle_after_scripts(self) -> None:
+        with tempfile.TemporaryDirectory() as pid_dir:
+            os.environ["TESTBASE_TEST_PID_DIR"] = pid_dir
+            try:
+                scheduler = BoardScheduler(
+                    virtual_boards(1), policy=RecyclePolicy(2))
+                outcomes = scheduler.run_tests(
+                    VirtualScripts, ["check_pid"] * 3)
+            finally:
+                del os.environ["TESTBASE_TEST_PID_DIR"]
+            self.assertEqual(["pass"] * 3,
+                             [outcome.status for outcome in outcomes])
+            self.assertEqual(2, len(os.listdir(pid_dir)))
@@ -0,0 +1,124 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import tempfile
+from typing import List
+import unittest
+from unittest import mock
+
+from spinnaker_testbase import coverage_index
+from spinnaker_testbase.coverage_index import (
+    CoverageIndex, changed_binaries)
+from spinnaker_testbase.root_test_case import RootTestCase
+
+
+class CoveredTests(RootTestCase):
+
+    def setUp(self) -> None:
+        self._start_coverage()
+
+    def check_loads(self) -> None:
+        self.runsafe(lambda: None)
+
+    def check_fails(self) -> None:
+        def run() -> None:
+            raise AssertionError("broken part way through the run")
+        self.runsafe(run)
+
+
+class TestCoverageIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.root = self._dir.name
+        self.index_path = os.path.join(self.root, "index.json")
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_changed_binaries(self) -> None:
+        neuron = os.path.join(self.root, "makefiles", "IF_curr_exp")
+        os.makedirs(neuron)
+        with open(os.path.join(neuron, "Makefile"), "w",
+                  encoding="utf-8") as makefile:
+            makefile.write("APP = IF_curr_exp\nNEURON_MODEL = x\n")
+        os.makedirs(os.path.join(self.root, "src"))
+        self.assertEqual(
+            {"delay_extension.aplx", "IF_curr_exp.aplx"},
+            changed_binaries(["/opt/aplx/delay_extension.aplx",
+                              os.path.join(self.root, "makefiles")]))
+        self.assertIsNone(changed_binaries(
+            [os.path.join(self.root, "src")]))
+
+    def test_selected(self) -> None:
+        index = CoverageIndex(self.index_path)
+        index.record("a::T::test_a", ["/bin/IF_curr_exp.aplx",
+                                      "reverse_iptag_multicast_source"])
+        index.record("a::T::test_b", ["/bin/delay_extension.aplx"])
+        self.assertEqual(["a::T::test_a", "a::T::test_b"], index.test_ids())
+        self.assertEqual(
+            ["a::T::test_a", "a::T::test_new"],
+            index.selected(["a::T::test_a", "a::T::test_b",
+                            "a::T::test_new"], {"IF_curr_exp.aplx"}))
+
+    def test_skip_unselected(self) -> None:
+        test = CoveredTests("check_loads")
+        index = CoverageIndex(self.index_path)
+        index.record(test._test_id(), ["delay_extension.aplx"])
+        with mock.patch.dict(os.environ,
+                             {"TESTBASE_COVERAGE_INDEX": self.index_path}), \
+                mock.patch.object(coverage_index, "_changed",
+                                  {"IF_curr_exp.aplx"}), \
+                mock.patch.object(coverage_index, "_changed_read", True):
+            with self.assertRaises(unittest.SkipTest):
+                test._start_coverage()
+            coverage_index._changed = {"delay_extension.aplx"}
+            test._start_coverage()
+
+    def test_parallel_records(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            index = CoverageIndex(os.path.join(temp, "index.json"))
+            test_ids = [f"test_scripts.py::Scripts::test_{i}"
+                        for i in range(16)]
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(
+                    lambda test_id: index.record(test_id, ["a.aplx"]),
+                    test_ids))
+            self.assertEqual(sorted(test_ids), index.test_ids())
+
+    def _run(self, method: str, binaries: List[str]) -> None:
+        # Only setUp runs before the new run is made
+        test = CoveredTests(method)
+        with mock.patch.dict(os.environ,
+                             {"TESTBASE_COVERAGE_INDEX": self.index_path}), \
+                mock.patch.object(RootTestCase, "_timestamp_dir",
+                                  side_effect=[None, "run", "run"]), \
+                mock.patch.object(RootTestCase, "_binaries_loaded",
+                                  return_value=binaries):
+            test.run(unittest.TestResult())
+
+    def test_record_on_pass_only(self) -> None:
+        index = CoverageIndex(self.index_path)
+        test_id = CoveredTests("check_loads")._test_id()
+        self._run("check_loads", [])
+        self.assertEqual([], index.test_ids())
+        self._run("check_loads", ["/bin/IF_curr_exp.aplx"])
+        self.assertEqual([test_id], index.test_ids())
+        failed_id = CoveredTests("check_fails")._test_id()
+        index.record(failed_id, ["delay_extension.aplx"])
+        self._run("check_fails", ["/bin/IF_curr_exp.aplx"])
+        self.assertEqual(
+            [failed_id], index.selected([failed_id], {"delay_extension.aplx"}))
@@ -0,0 +1,89 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import tempfile
+import unittest
+
+from spinnaker_testbase.error_journal import ErrorJournal, journal_line
+
+
+class TestErrorJournal(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "ErrorFile.txt")
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_repeats_counted(self) -> None:
+        journal = ErrorJournal(self.path)
+        for _ in range(3):
+            journal.record("a.py", ValueError("lost"), "transceiver=big")
+        journal.record("b.py", ValueError("lost"))
+        records = list(journal.records())
+        self.assertEqual([3, 1], [record["count"] for record in records])
+        self.assertEqual("3 x ValueError in a.py: lost",
+                         journal_line(records[0]))
+
+    def test_size_limit(self) -> None:
+        journal = ErrorJournal(self.path, limit=2000)
+        for index in range(50):
+            journal.record("a.py", ValueError(f"error {index}"),
+                           "x" * 10000)
+        self.assertLessEqual(os.path.getsize(self.path), 2000)
+        records = list(journal.records())
+        self.assertEqual("Dropped", records[0]["error"])
+        self.assertEqual(50, sum(record["count"] for record in records))
+        self.assertEqual("error 49", records[-1]["message"])
+
+    def test_old_text_file(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as error_file:
+            error_file.write("some/test.py\nJob destroyed\n")
+        journal = ErrorJournal(self.path)
+        journal.record("a.py", ValueError("lost"))
+        self.assertEqual(
+            ["some/test.py\nJob destroyed", "lost"],
+            [record["message"] for record in journal.records()])
+
+    def test_appended_tracebacks(self) -> None:
+        journal = ErrorJournal(self.path, limit=1500)
+        journal.record("a.py", ValueError("lost"))
+        traceback = (
+            "Traceback (most recent call last):\n"
+            '  File "spinnman_simulation.py", line 99, in _run\n'
+            "    self._machine_generation()\n"
+            "spinnman.exceptions.SpinnmanTimeoutException: timed out\n")
+        for _ in range(2):
+            with open(self.path, "a", encoding="utf-8") as error_file:
+                error_file.write("\n" + traceback)
+            journal.record("b.py", ValueError("lost"))
+        messages = [record["message"] for record in journal.records()]
+        self.assertEqual(["lost", traceback.rstrip(), "lost",
+                          traceback.rstrip()], messages)
+        for index in range(20):
+            journal.record("c.py", ValueError(f"error {index}"))
+        for record in journal.records():
+            if "Traceback" in record["message"]:
+                self.assertEqual(traceback.rstrip(), record["message"])
+
+    def test_parallel_merges(self) -> None:
+        journal = ErrorJournal(self.path)
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(
+                lambda index: journal.record(
+                    f"{index}.py", ValueError("lost")), range(16)))
+        self.assertEqual(16, len(list(journal.records())))
@@ -0,0 +1,61 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import tempfile
+import unittest
+
+from spinnaker_testbase.file_lock import update_json
+
+
+def _add(name: str):
+    def _update(data):
+        data[name] = True
+        return data
+    return _update
+
+
+class TestFileLock(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "shared.json")
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def _read(self):
+        with open(self.path, encoding="utf-8") as json_file:
+            return json.load(json_file)
+
+    def test_parallel_updates(self) -> None:
+        names = [f"test{index}" for index in range(40)]
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(
+                lambda name: update_json(self.path, _add(name)), names))
+        self.assertEqual(sorted(names), sorted(self._read()))
+        self.assertEqual(
+            ["shared.json", "shared.json.lock"],
+            sorted(os.listdir(self._dir.name)))
+
+    def test_damaged_file(self) -> None:
+        with open(self.path, "w", encoding="utf-8") as json_file:
+            json_file.write("{broken")
+        update_json(self.path, _add("a"))
+        self.assertEqual({"a": True}, self._read())
+
+    def test_unchanged(self) -> None:
+        update_json(self.path, lambda data: None)
+        self.assertFalse(os.path.exists(self.path))
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy
+
+from spinnaker_testbase.base_test_case import BaseTestCase
+from spinnaker_testbase.golden_data import compare_arrays
+
+
+class GoldenTests(BaseTestCase):
+
+    def check_nothing(self) -> None:
+        pass
+
+
+class TestGoldenData(unittest.TestCase):
+
+    def test_compare(self) -> None:
+        expected = numpy.arange(12, dtype=float).reshape(3, 4)
+        self.assertIsNone(compare_arrays(expected.copy(), expected))
+        actual = expected.copy()
+        actual[1, 2] += 0.5
+        actual[2, 3] = numpy.nan
+        problem = compare_arrays(actual, expected)
+        assert problem is not None
+        self.assertIn("2 of 12 values differ", problem)
+        self.assertIn("at (2, 3)", problem)
+        self.assertIsNone(
+            compare_arrays(expected + 0.01, expected, atol=0.1))
+        self.assertIn("shape", str(compare_arrays(expected[1:], expected)))
+        self.assertIn("1 of 2", str(compare_arrays(
+            numpy.array(["a", "b"]), numpy.array(["a", "c"]))))
+
+    def test_regenerate_then_check(self) -> None:
+        test = GoldenTests("check_nothing")
+        spikes = numpy.array([[0, 1.0], [3, 2.5]])
+        with tempfile.TemporaryDirectory() as temp:
+            golden = os.path.join(temp, "golden", "results.npz")
+            with self.assertRaises(AssertionError):
+                test.assert_matches_golden(golden, spikes=spikes)
+            with mock.patch.dict(
+                    os.environ, {"TESTBASE_REGENERATE_GOLDEN": "true"}):
+                test.assert_matches_golden(golden, spikes=spikes)
+                test.assert_matches_golden(golden, v=numpy.zeros(5))
+            test.assert_matches_golden(golden, spikes=spikes,
+                                       v=numpy.zeros(5))
+            with self.assertRaises(AssertionError) as context:
+                test.assert_matches_golden(golden, v=numpy.ones(5))
+            self.assertIn("5 of 5 values differ", str(context.exception))
+
+    def test_relative_to_test_directory(self) -> None:
+        test = GoldenTests("check_nothing")
+        name = "golden_relative_test.npz"
+        golden = os.path.join(os.path.dirname(__file__), name)
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp:
+            os.chdir(temp)
+            try:
+                with mock.patch.dict(
+                        os.environ, {"TESTBASE_REGENERATE_GOLDEN": "true"}):
+                    test.assert_matches_golden(name, v=numpy.ones(3))
+                self.assertFalse(os.path.exists(name))
+            finally:
+                os.chdir(cwd)
+        try:
+            self.assertTrue(os.path.exists(golden))
+            test.assert_matches_golden(name, v=numpy.ones(3))
+        finally:
+            os.remove(golden)
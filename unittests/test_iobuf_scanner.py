@@ -0,0 +1,66 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from spinnaker_testbase import iobuf_scanner
+from spinnaker_testbase.iobuf_scanner import ERROR_PATTERN, scan_iobufs
+
+
+class TestIobufScanner(unittest.TestCase):
+
+    def test_scan(self) -> None:
+        with tempfile.TemporaryDirectory() as app, \
+                tempfile.TemporaryDirectory() as system:
+            with open(os.path.join(
+                    app, "iobuf_for_chip_1_0_processor_id_3.txt"), "w",
+                    encoding="utf-8") as iobuf:
+                iobuf.write("[INFO] (a.c: 1): starting\n")
+                iobuf.write("[ERROR] (a.c: 9): dropped 4 packets\n")
+                iobuf.write("[WARNING] (a.c: 12): late")
+            open(os.path.join(
+                system, "iobuf_for_chip_0_0_processor_id_1.txt"), "w",
+                encoding="utf-8").close()
+            with open(os.path.join(app, "other.txt"), "w",
+                      encoding="utf-8") as other:
+                other.write("[ERROR] not an iobuf\n")
+
+            errors = scan_iobufs([app, system], [ERROR_PATTERN])
+            self.assertEqual(1, len(errors))
+            self.assertEqual((1, 0, 3, 2, "ERROR"), errors[0][:5])
+            self.assertEqual("[ERROR] (a.c: 9): dropped 4 packets",
+                             errors[0].line)
+
+            found = scan_iobufs([app], [r"dropped \d+", "late", "missing"])
+            self.assertEqual([2, 3], [match.line_number for match in found])
+            self.assertEqual("WARNING", found[1].severity)
+
+    def test_scan_in_processes(self) -> None:
+        with tempfile.TemporaryDirectory() as app:
+            for core in range(1, 6):
+                with open(os.path.join(
+                        app, f"iobuf_for_chip_0_0_processor_id_{core}.txt"),
+                        "w", encoding="utf-8") as iobuf:
+                    iobuf.write("[INFO] ok\n" * core)
+                    iobuf.write(f"[ERROR] core {core} failed\n")
+            serial = scan_iobufs([app], [ERROR_PATTERN], max_workers=1)
+            with mock.patch.object(iobuf_scanner, "_PARALLEL_BYTES", 0):
+                parallel = scan_iobufs([app], [ERROR_PATTERN], max_workers=2)
+            self.assertEqual(5, len(parallel))
+            self.assertEqual(serial, parallel)
+            self.assertEqual([2, 3, 4, 5, 6],
+                             [match.line_number for match in parallel])
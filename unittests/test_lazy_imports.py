@@ -0,0 +1,46 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+import unittest
+
+import spinnaker_testbase
+
+_CHECK = """
+import sys
+from spinnaker_testbase import RootScriptBuilder
+heavy = [name for name in ("spinnman", "pacman", "spalloc_client",
+         "spinn_front_end_common", "matplotlib") if name in sys.modules]
+print(",".join(heavy))
+"""
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_builder_only(self) -> None:
+        result = subprocess.run(
+            [sys.executable, "-c", _CHECK], capture_output=True, text=True,
+            check=True, cwd=os.path.dirname(
+                os.path.dirname(spinnaker_testbase.__file__)))
+        self.assertEqual("", result.stdout.strip())
+
+    def test_all(self) -> None:
+        for name in spinnaker_testbase.__all__:
+            self.assertEqual(
+                name, getattr(spinnaker_testbase, name).__name__)
+            self.assertIn(name, dir(spinnaker_testbase))
+        with self.assertRaises(AttributeError):
+            getattr(spinnaker_testbase, "NotThere")
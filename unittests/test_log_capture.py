@@ -0,0 +1,67 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import re
+import unittest
+
+from spinnaker_testbase import BaseTestCase
+from spinnaker_testbase.log_capture import IndexedLogCapture
+
+logger = logging.getLogger(__name__)
+
+
+class TestLogCapture(unittest.TestCase):
+
+    def test_counts(self) -> None:
+        with IndexedLogCapture() as capture:
+            logger.error("core %d failed", 3)
+            logger.error("core %d failed", 4)
+            logger.warning("core %d failed", 5)
+            self.assertEqual(2, capture.count("failed"))
+            self.assertEqual(1, capture.count("core 4"))
+            self.assertEqual(1, capture.count("core 5", "WARNING"))
+            logger.error("core %d failed", 6)
+            self.assertEqual(3, capture.count("failed"))
+            self.assertEqual(
+                [3, 1, 0],
+                capture.count_matches([r"core \d", "6", "missing"]))
+        logger.error("after the capture")
+        self.assertEqual(4, len(capture.records))
+
+    def test_no_match_across_messages(self) -> None:
+        with IndexedLogCapture() as capture:
+            logger.error("load %s", "failed")
+            self.assertEqual(1, capture.count("load %s"))
+            self.assertEqual(1, capture.count("load failed"))
+            self.assertEqual(0, capture.count_matches([r"%s\nload"])[0])
+
+    def test_pattern_flags(self) -> None:
+        with IndexedLogCapture() as capture:
+            logger.error("Core %d FAILED", 3)
+            self.assertEqual([0], capture.count_matches(["failed"]))
+            self.assertEqual(
+                [1], capture.count_matches([re.compile("failed", re.I)]))
+            self.assertEqual([0], capture.count_matches(["failed"]))
+
+    def test_assert_logs_messages(self) -> None:
+        checker = BaseTestCase()
+        with IndexedLogCapture() as capture:
+            logger.warning("bad value %s", "xyz")
+        checker.assert_logs_messages(capture, "value xyz", "WARNING")
+        checker.assert_logs_messages(capture.records, "value xyz", "WARNING")
+        checker.assert_logs_messages(
+            capture.records, "bad value %s", "WARNING")
+        with self.assertRaises(AssertionError):
+            checker.assert_logs_messages(capture, "value", "WARNING", 2)
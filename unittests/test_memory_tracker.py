@@ -0,0 +1,48 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tracemalloc
+import unittest
+from unittest import mock
+
+from spinnaker_testbase.memory_tracker import (
+    MemoryTracker, RecyclePolicy, current_rss)
+
+
+class TestMemoryTracker(unittest.TestCase):
+
+    def test_tracker(self) -> None:
+        tracemalloc.start()
+        try:
+            with MemoryTracker() as memory:
+                kept = [bytearray(1024) for _ in range(10000)]
+        finally:
+            tracemalloc.stop()
+        summary = memory.summary("script.py")
+        self.assertTrue(summary.startswith("script.py rss before"))
+        self.assertIn("test_memory_tracker.py", summary)
+        self.assertEqual(10000, len(kept))
+
+    def test_policy(self) -> None:
+        policy = RecyclePolicy(3, 1000)
+        self.assertFalse(policy.should_recycle(1, 10))
+        self.assertTrue(policy.should_recycle(3, 10))
+        self.assertTrue(policy.should_recycle(1, 1000))
+        self.assertFalse(RecyclePolicy(3).should_recycle(2, current_rss()))
+        with mock.patch.dict(os.environ, {
+                "TESTBASE_RECYCLE_SCRIPTS": "5",
+                "TESTBASE_RECYCLE_RSS_MB": "2"}):
+            self.assertEqual(RecyclePolicy(5, 2 * 1024 * 1024),
+                             RecyclePolicy.from_env())
@@ -0,0 +1,57 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+from unittest import mock
+from urllib.request import urlopen
+
+from spinnaker_testbase.metrics import MetricsRegistry, get_metrics
+
+
+class TestMetrics(unittest.TestCase):
+
+    def test_render(self) -> None:
+        metrics = MetricsRegistry(buckets=[1, 10])
+        metrics.inc("scripts_total", "Scripts", status="pass")
+        metrics.inc("scripts_total", "Scripts", status="pass")
+        metrics.set("current", "Current", 5, script='a "b"')
+        metrics.observe("duration_seconds", "Durations", 0.5)
+        metrics.observe("duration_seconds", "Durations", 20)
+        text = metrics.render()
+        self.assertIn("# TYPE scripts_total counter\n", text)
+        self.assertIn('scripts_total{status="pass"} 2\n', text)
+        self.assertIn('current{script="a \\"b\\""} 5\n', text)
+        self.assertIn('duration_seconds_bucket{le="1"} 1\n', text)
+        self.assertIn('duration_seconds_bucket{le="10"} 1\n', text)
+        self.assertIn('duration_seconds_bucket{le="+Inf"} 2\n', text)
+        self.assertIn("duration_seconds_sum 20.5\n", text)
+        metrics.clear("current")
+        self.assertNotIn("current{", metrics.render())
+
+    def test_serve(self) -> None:
+        metrics = MetricsRegistry()
+        metrics.inc("retries_total", "Retries", exception="Timeout")
+        port = metrics.serve(0)
+        try:
+            with urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+                body = response.read().decode("utf-8")
+        finally:
+            metrics.shutdown()
+        self.assertEqual(metrics.render(), body)
+
+    def test_off(self) -> None:
+        with mock.patch.dict(os.environ, {
+                "TESTBASE_METRICS_PORT": "", "TESTBASE_METRICS_FILE": ""}):
+            self.assertIsNone(get_metrics())
@@ -0,0 +1,93 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from spinn_front_end_common.interface.config_setup import unittest_setup
+
+from spinnaker_testbase.base_test_case import BaseTestCase
+from spinnaker_testbase.micro_benchmark import (
+    BaselineStore, BenchmarkStats, get_baseline_store, measure)
+
+
+class BenchmarkTests(BaseTestCase):
+
+    def check_nothing(self) -> None:
+        pass
+
+
+class TestMicroBenchmark(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_measure(self) -> None:
+        calls = []
+        times = measure(lambda: calls.append(1), repeats=7, warmup=2)
+        self.assertEqual(7, len(times))
+        self.assertEqual(9, len(calls))
+
+    def test_stats(self) -> None:
+        stats = BenchmarkStats.from_times("x", [0.004, 0.001, 0.002, 0.003])
+        self.assertEqual(0.001, stats.minimum)
+        self.assertEqual(0.004, stats.maximum)
+        self.assertAlmostEqual(0.0025, stats.median)
+        self.assertIn("median 2.500 ms", stats.summary())
+
+    def test_budget_and_baseline(self) -> None:
+        test = BenchmarkTests("check_nothing")
+        with self.assertRaises(AssertionError):
+            test.assert_benchmark(
+                "slow", lambda: sum(range(100000)), repeats=3, budget=0.0)
+        with tempfile.TemporaryDirectory() as temp:
+            baselines = os.path.join(temp, "baselines.json")
+            with mock.patch.dict(os.environ, {
+                    "TESTBASE_BENCHMARK_BASELINES": baselines,
+                    "TESTBASE_BENCHMARK_UPDATE": "true"}):
+                test.assert_benchmark("sleep", lambda: None, repeats=3)
+            self.assertTrue(os.path.exists(baselines))
+            with mock.patch.dict(os.environ, {
+                    "TESTBASE_BENCHMARK_BASELINES": baselines}):
+                test.assert_benchmark("sleep", lambda: None, repeats=3)
+                with self.assertRaises(AssertionError):
+                    test.assert_benchmark(
+                        "sleep", lambda: sum(range(300000)), repeats=3)
+
+    def test_store(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            store = BaselineStore(os.path.join(temp, "b.json"), noise=0.01)
+            store.store_all({"a": 0.1, "b": 0.001})
+            self.assertEqual({"a": 0.1, "b": 0.001}, store.read())
+            # b is slower but within the noise
+            self.assertEqual([], store.regressions(
+                {"a": 0.2, "b": 0.005, "c": 5.0}))
+            problems = store.regressions({"a": 0.3})
+            self.assertEqual(1, len(problems))
+            self.assertIn("a took 300.000 ms", problems[0])
+
+    def test_relative_path(self) -> None:
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp, mock.patch.dict(
+                os.environ, {"TESTBASE_BENCHMARK_BASELINES": "b.json"}):
+            try:
+                os.chdir(temp)
+                store = get_baseline_store()
+                assert store is not None
+                self.assertEqual(os.path.join(os.getcwd(), "b.json"),
+                                 store.path)
+            finally:
+                os.chdir(cwd)
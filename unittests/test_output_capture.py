@@ -0,0 +1,104 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import logging
+import os
+import sys
+import unittest
+from unittest import mock
+
+from spinnaker_testbase.output_capture import (
+    RingBuffer, SpoolFile, capture_output, emit_captured)
+
+
+class TestOutputCapture(unittest.TestCase):
+
+    def test_ring(self) -> None:
+        ring = RingBuffer(10)
+        ring.write("abcdef")
+        ring.write("ghijkl")
+        self.assertEqual("... 2 characters dropped ...\ncdefghijkl",
+                         ring.getvalue())
+        ring.clear()
+        self.assertEqual("", ring.getvalue())
+
+    def test_spool(self) -> None:
+        spool = SpoolFile()
+        spool.write("hello ")
+        self.assertEqual("hello ", spool.getvalue())
+        spool.write("world" * 1000)
+        self.assertEqual("hello " + "world" * 1000, spool.getvalue())
+        spool.clear()
+        spool.write("again")
+        self.assertEqual("again", spool.getvalue())
+        spool.close()
+
+    def _run(self, mode: str, fail: bool) -> str:
+        out = io.StringIO()
+        with mock.patch.dict(os.environ, {"TESTBASE_CAPTURE_OUTPUT": mode}), \
+                mock.patch.object(sys, "stdout", out):
+            try:
+                with capture_output():
+                    print("noise")
+                    if fail:
+                        raise ValueError("broken")
+            except ValueError:
+                pass
+        return out.getvalue()
+
+    def test_capture(self) -> None:
+        for mode in ["ring", "spool"]:
+            self.assertEqual("", self._run(mode, False))
+            self.assertIn("noise\n", self._run(mode, True))
+            self.assertIn("ValueError", self._run(mode, True))
+        self.assertEqual("noise\n", self._run("", False))
+
+    def test_emit(self) -> None:
+        out = io.StringIO()
+        env = {"TESTBASE_CAPTURE_OUTPUT": "ring"}
+        with mock.patch.dict(os.environ, env), \
+                mock.patch.object(sys, "stdout", out):
+            with capture_output():
+                print("first try")
+                emit_captured("retry 1")
+                print("second try")
+        self.assertIn("retry 1", out.getvalue())
+        self.assertIn("first try", out.getvalue())
+        self.assertNotIn("second try", out.getvalue())
+
+    def test_logging(self) -> None:
+        out = io.StringIO()
+        logger = logging.getLogger("test_output_capture")
+        handler = logging.StreamHandler(out)
+        logger.addHandler(handler)
+        env = {"TESTBASE_CAPTURE_OUTPUT": "ring"}
+        try:
+            with mock.patch.dict(os.environ, env), \
+                    mock.patch.object(sys, "stdout", out):
+                with capture_output():
+                    logger.error("logged while held")
+                self.assertEqual("", out.getvalue())
+                self.assertIs(out, handler.stream)
+                try:
+                    with capture_output():
+                        logger.error("logged before failing")
+                        raise ValueError("broken")
+                except ValueError:
+                    pass
+        finally:
+            logger.removeHandler(handler)
+        self.assertNotIn("logged while held", out.getvalue())
+        self.assertIn("Captured output", out.getvalue())
+        self.assertIn("logged before failing", out.getvalue())
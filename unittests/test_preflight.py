@@ -0,0 +1,91 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from spinnaker_testbase import preflight as preflight_module
+from spinnaker_testbase.preflight import (
+    BINARY_PATHS_ENV, binary_search_paths, preflight)
+
+
+class TestPreflight(unittest.TestCase):
+
+    def test_preflight(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            binaries = os.path.join(root, "binaries")
+            os.makedirs(binaries)
+            with open(os.path.join(binaries, "found.aplx"), "w",
+                      encoding="utf-8") as binary:
+                binary.write("binary")
+            good = os.path.join(root, "good.py")
+            with open(good, "w", encoding="utf-8") as script:
+                script.write("# combined binaries [found.aplx,\n")
+                script.write("#     renamed]\n")
+                script.write("print('hello')\n")
+            bad = os.path.join(root, "bad.py")
+            with open(bad, "w", encoding="utf-8") as script:
+                script.write("def broken(:\n")
+            missing = os.path.join(root, "missing.py")
+
+            problems = preflight([good, bad, missing], [binaries])
+            self.assertEqual(3, len(problems))
+            self.assertIn("missing.py: script not found", problems[0])
+            self.assertIn("renamed.aplx not found", problems[1])
+            self.assertIn("good.py", problems[1])
+            self.assertIn("bad.py:1", problems[2])
+
+            self.assertEqual(1, len(preflight([good], [binaries])))
+
+    def test_spawned_pool(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            good = os.path.join(root, "good.py")
+            with open(good, "w", encoding="utf-8") as script:
+                script.write("print('hello')\n")
+            with mock.patch.object(
+                    preflight_module, "ProcessPoolExecutor",
+                    side_effect=ProcessPoolExecutor) as pool:
+                self.assertEqual([], preflight([good], [root]))
+        context = pool.call_args.kwargs["mp_context"]
+        self.assertEqual("spawn", context.get_start_method())
+
+    def test_search_paths(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            good = os.path.join(root, "good.py")
+            with open(good, "w", encoding="utf-8") as script:
+                script.write("# combined binaries [unknown.aplx]\n")
+            old = os.environ.pop(BINARY_PATHS_ENV, None)
+            try:
+                # Without search paths the binaries are not looked for
+                self.assertIsNone(binary_search_paths())
+                self.assertEqual([], preflight([good]))
+                os.environ[BINARY_PATHS_ENV] = root
+                paths = binary_search_paths()
+                assert paths is not None
+                self.assertEqual(root, paths[0])
+                # The tools' own binaries are found without being set up
+                self.assertTrue(any(
+                    path.endswith("common_model_binaries")
+                    for path in paths))
+                problems = preflight([good])
+                self.assertEqual(1, len(problems))
+                self.assertIn("unknown.aplx not found", problems[0])
+            finally:
+                if old is None:
+                    os.environ.pop(BINARY_PATHS_ENV, None)
+                else:
+                    os.environ[BINARY_PATHS_ENV] = old
@@ -0,0 +1,79 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from spinnaker_testbase.provenance_queries import (
+    close_provenance_connections, provenance_database)
+
+
+class TestProvenanceQueries(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "data.sqlite3")
+        with sqlite3.connect(self.path) as db:
+            db.execute(
+                "CREATE TABLE core_provenance_view("
+                "core_name, x, y, p, description, the_value)")
+            db.execute(
+                "CREATE TABLE router_provenance("
+                "x, y, description, the_value, expected)")
+            db.executemany(
+                "INSERT INTO core_provenance_view VALUES(?, ?, ?, ?, ?, ?)",
+                [("a", 0, 0, p, "Late_packets", p) for p in range(1, 17)])
+            db.executemany(
+                "INSERT INTO router_provenance VALUES(?, ?, ?, ?, 0)",
+                [(0, 0, "Dropped_Multicast_Packets", 0),
+                 (1, 0, "Dropped_Multicast_Packets", 5),
+                 (1, 0, "Local_Multicast_Packets", 7)])
+
+    def tearDown(self) -> None:
+        close_provenance_connections()
+        self._dir.cleanup()
+
+    def test_queries(self) -> None:
+        provenance = provenance_database(self.path)
+        self.assertIs(provenance, provenance_database(self.path))
+        late = provenance.cores("Late")
+        self.assertEqual(16, len(late))
+        self.assertEqual(16, late.max())
+        self.assertEqual([(0, 0, 16, 16.0)], late.above(15))
+        dropped = provenance.routers("Dropped")
+        self.assertEqual(5, dropped.total())
+        self.assertEqual([(1, 0, -1, 5.0)], dropped.above(0))
+        self.assertEqual(0, len(provenance.cores("missing")))
+        self.assertEqual(["Dropped_Multicast_Packets",
+                          "Local_Multicast_Packets"],
+                         provenance.router_descriptions())
+
+    def test_replaced_file(self) -> None:
+        provenance = provenance_database(self.path)
+        self.assertEqual(16, len(provenance.cores("Late")))
+        # A later run writes a new database at the same path
+        new_path = self.path + ".new"
+        with sqlite3.connect(new_path) as db:
+            db.execute(
+                "CREATE TABLE core_provenance_view("
+                "core_name, x, y, p, description, the_value)")
+            db.execute(
+                "INSERT INTO core_provenance_view "
+                "VALUES('a', 0, 0, 1, 'Late_packets', 3)")
+        os.replace(new_path, self.path)
+        replaced = provenance_database(self.path)
+        self.assertIsNot(provenance, replaced)
+        self.assertEqual(1, len(replaced.cores("Late")))
@@ -0,0 +1,71 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+
+from spinnaker_testbase.report_pruner import (
+    ReportPruner, RetentionPolicy, stale_runs)
+
+_STARTED = "2026-06-01-00-00-00-000000"
+
+
+def _make_run(root: str, name: str, size: int) -> str:
+    path = os.path.join(root, name)
+    os.makedirs(path)
+    with open(os.path.join(path, "report.txt"), "wb") as report:
+        report.write(b"x" * size)
+    return path
+
+
+class TestReportPruner(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.root = self._dir.name
+        self.runs = [_make_run(self.root, f"2026-0{month}-01-00-00-00-000000",
+                               1000) for month in range(1, 5)]
+        self.current = _make_run(self.root, "2026-07-01-00-00-00-000000", 10)
+        self.other = _make_run(self.root, "keep_me", 10)
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_keep_runs(self) -> None:
+        stale = stale_runs(self.root, RetentionPolicy(keep_runs=3),
+                           [self.runs[2]], _STARTED)
+        # The current run counts towards the three kept
+        self.assertEqual(self.runs[:2], stale)
+
+    def test_protected(self) -> None:
+        stale = stale_runs(self.root, RetentionPolicy(keep_runs=1),
+                           [os.path.join(self.runs[0], "ErrorFile.txt")],
+                           _STARTED)
+        self.assertEqual(self.runs[1:], stale)
+
+    def test_max_bytes(self) -> None:
+        stale = stale_runs(self.root, RetentionPolicy(max_bytes=2500),
+                           [], _STARTED)
+        self.assertEqual(self.runs[:2], stale)
+
+    def test_pruner(self) -> None:
+        pruner = ReportPruner(RetentionPolicy(keep_runs=2), _STARTED)
+        pruner.submit(self.root, [self.current])
+        pruner.submit(self.root, [self.current])
+        self.assertEqual(self.runs[:3], pruner.flush())
+        self.assertEqual(
+            sorted(["keep_me", "2026-04-01-00-00-00-000000",
+                    "2026-07-01-00-00-00-000000"]),
+            sorted(os.listdir(self.root)))
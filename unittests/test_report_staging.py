@@ -0,0 +1,93 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tarfile
+import tempfile
+import unittest
+
+from spinnaker_testbase.config_overrides import (
+    add_config_override, clear_config_overrides, get_config_overrides)
+from spinnaker_testbase.report_staging import ReportStager
+
+_REPORT_PATH = ("Reports", "default_report_file_path")
+
+
+class TestReportStaging(unittest.TestCase):
+
+    def setUp(self) -> None:
+        clear_config_overrides()
+        self._cwd = os.getcwd()
+
+    def tearDown(self) -> None:
+        os.chdir(self._cwd)
+        clear_config_overrides()
+
+    @staticmethod
+    def _make_run(staging: str, name: str) -> str:
+        run = os.path.join(staging, "reports", name)
+        os.makedirs(os.path.join(run, "run_1"))
+        with open(os.path.join(run, "run_1", "data.txt"), "w",
+                  encoding="utf-8") as data:
+            data.write("spikes\n" * 100)
+        return run
+
+    def test_move_behind(self) -> None:
+        with tempfile.TemporaryDirectory() as scratch, \
+                tempfile.TemporaryDirectory() as persistent:
+            os.chdir(persistent)
+            stager = ReportStager(scratch)
+            staging = stager.stage()
+            self.assertEqual(staging, get_config_overrides()[_REPORT_PATH])
+            self.assertTrue(staging.startswith(os.path.abspath(scratch)))
+            old = self._make_run(staging, "2026-01-01-00-00-00-000000")
+            current = self._make_run(staging, "2026-01-01-00-00-01-000000")
+            stager.submit_finished(current)
+            moved = stager.flush()
+            target = os.path.join(
+                os.path.realpath(persistent), "reports",
+                "2026-01-01-00-00-00-000000")
+            self.assertEqual([target], moved)
+            self.assertEqual(target, stager.persistent_path(old))
+            self.assertFalse(os.path.exists(old))
+            self.assertTrue(os.path.isdir(current))
+            self.assertTrue(os.path.isfile(
+                os.path.join(target, "run_1", "data.txt")))
+            # A second submit does not move the first run again
+            stager.submit_finished(current)
+            self.assertEqual([target], stager.flush())
+            self.assertEqual(2, len(stager.finish()))
+            self.assertFalse(os.path.exists(current))
+            self.assertEqual(
+                ["2026-01-01-00-00-00-000000", "2026-01-01-00-00-01-000000"],
+                sorted(os.listdir(os.path.join(persistent, "reports"))))
+
+    def test_override_kept(self) -> None:
+        with tempfile.TemporaryDirectory() as scratch, \
+                tempfile.TemporaryDirectory() as persistent:
+            os.chdir(scratch)
+            stager = ReportStager(scratch, "gz")
+            add_config_override(*_REPORT_PATH, persistent)
+            staging = stager.stage()
+            # The next script keeps the same persistent location
+            os.chdir(persistent)
+            self.assertEqual(staging, stager.stage())
+            self._make_run(staging, "2026-01-01-00-00-00-000000")
+            archives = stager.finish()
+            self.assertEqual([os.path.join(
+                persistent, "reports",
+                "2026-01-01-00-00-00-000000.tar.gz")], archives)
+            with tarfile.open(archives[0]) as tar:
+                self.assertIn("2026-01-01-00-00-00-000000/run_1/data.txt",
+                              tar.getnames())
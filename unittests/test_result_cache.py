@@ -0,0 +1,115 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+import json
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+from spinnaker_testbase.result_cache import (
+    ResultCache, _package_key, local_imports)
+
+
+def _write(path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as a_file:
+        a_file.write(text)
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.root = self._dir.name
+        self.helper = os.path.join(self.root, "pkg", "helper.py")
+        _write(os.path.join(self.root, "pkg", "__init__.py"), "")
+        _write(self.helper, "import os\nVALUE = 1\n")
+        self.script = os.path.join(self.root, "scripts", "script.py")
+        _write(self.script, "from pkg.helper import VALUE\nprint(VALUE)\n")
+        self.binary = os.path.join(self.root, "binaries", "a.aplx")
+        _write(self.binary, "binary")
+        self.cache = ResultCache(os.path.join(self.root, "cache.json"))
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_local_imports(self) -> None:
+        found = local_imports(self.script, self.root)
+        self.assertIn(os.path.abspath(self.helper), found)
+        self.assertIn(os.path.abspath(self.script), found)
+        self.assertEqual(3, len(found))
+
+    def test_cached_pass(self) -> None:
+        self.assertIsNone(self.cache.cached_binaries(self.script, self.root))
+        self.cache.record_pass(self.script, self.root, [self.binary])
+        self.assertEqual(
+            [self.binary], self.cache.cached_binaries(self.script, self.root))
+        with mock.patch.dict(os.environ, {"TESTBASE_FORCE_RUN": "true"}):
+            self.assertIsNone(
+                self.cache.cached_binaries(self.script, self.root))
+        self.cache.forget(self.script)
+        self.assertIsNone(self.cache.cached_binaries(self.script, self.root))
+
+    def test_import_changed(self) -> None:
+        self.cache.record_pass(self.script, self.root, [self.binary])
+        _write(self.helper, "VALUE = 2\n")
+        self.assertIsNone(self.cache.cached_binaries(self.script, self.root))
+
+    def test_binary_changed(self) -> None:
+        self.cache.record_pass(self.script, self.root, [self.binary])
+        _write(self.binary, "rebuilt")
+        self.assertIsNone(self.cache.cached_binaries(self.script, self.root))
+        self.cache.record_pass(self.script, self.root, [self.binary])
+        os.remove(self.binary)
+        self.assertIsNone(self.cache.cached_binaries(self.script, self.root))
+
+    def test_parallel_passes(self) -> None:
+        scripts = [os.path.join(self.root, "scripts", f"script{i}.py")
+                   for i in range(16)]
+        for script in scripts:
+            _write(script, "print('hello')\n")
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(lambda script: self.cache.record_pass(
+                script, self.root, [self.binary]), scripts))
+        for script in scripts:
+            self.assertEqual([self.binary],
+                             self.cache.cached_binaries(script, self.root))
+
+    def test_package_key(self) -> None:
+        source = os.path.join(self.root, "source")
+        _write(os.path.join(source, "pkg", "model.py"), "A = 1\n")
+        info = os.path.join(self.root, "pkg-1.0.dist-info")
+        _write(os.path.join(info, "METADATA"),
+               "Metadata-Version: 2.1\nName: pkg\nVersion: 1.0\n")
+        dist = metadata.PathDistribution(Path(info))
+
+        def installed_from(origin: dict) -> str:
+            _write(os.path.join(info, "direct_url.json"), json.dumps(origin))
+            return _package_key(dist)
+
+        commit = installed_from({"url": "https://github.com/x/pkg",
+                                 "vcs_info": {"commit_id": "abc"}})
+        self.assertNotEqual(commit, installed_from(
+            {"url": "https://github.com/x/pkg",
+             "vcs_info": {"commit_id": "def"}}))
+        editable = {"url": Path(source).as_uri(),
+                    "dir_info": {"editable": True}}
+        before = installed_from(editable)
+        self.assertEqual(before, installed_from(editable))
+        _write(os.path.join(source, "pkg", "model.py"), "A = 2\n")
+        self.assertNotEqual(before, installed_from(editable))
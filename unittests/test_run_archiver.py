@@ -0,0 +1,66 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tarfile
+import tempfile
+import unittest
+
+from spinnaker_testbase.run_archiver import RunArchiver
+
+
+class TestRunArchiver(unittest.TestCase):
+
+    def test_archive(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            runs = []
+            for index in range(3):
+                run = os.path.join(root, f"2026-01-0{index}")
+                os.makedirs(os.path.join(run, "provenance_data"))
+                with open(os.path.join(run, "provenance_data", "iobuf.txt"),
+                          "w", encoding="utf-8") as iobuf:
+                    iobuf.write("[INFO] hello\n" * 1000)
+                runs.append(run)
+            archiver = RunArchiver("gz")
+            for run in runs:
+                archiver.submit(run)
+            archives = archiver.flush()
+            self.assertEqual([run + ".tar.gz" for run in runs], archives)
+            self.assertEqual(sorted(os.path.basename(archive)
+                                    for archive in archives),
+                             sorted(os.listdir(root)))
+            with tarfile.open(archives[0]) as tar:
+                self.assertIn("2026-01-00/provenance_data/iobuf.txt",
+                              tar.getnames())
+
+    def test_hold(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            first = os.path.join(root, "2026-01-01")
+            second = os.path.join(root, "2026-01-02")
+            os.makedirs(first)
+            os.makedirs(second)
+            archiver = RunArchiver("gz")
+            archiver.hold(first)
+            archiver.hold(first)
+            self.assertEqual([], archiver.flush())
+            archiver.hold(second)
+            self.assertEqual([first + ".tar.gz"], archiver.flush())
+            self.assertTrue(os.path.isdir(second))
+            self.assertEqual([first + ".tar.gz", second + ".tar.gz"],
+                             archiver.finish())
+            self.assertFalse(os.path.exists(second))
+
+    def test_bad_compression(self) -> None:
+        with self.assertRaises(ValueError):
+            RunArchiver("zip")
@@ -0,0 +1,84 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from spinnaker_testbase.root_script_builder import RootScriptBuilder
+from spinnaker_testbase.run_history import RunHistory
+
+
+class TestRunHistory(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._dir = tempfile.TemporaryDirectory()
+        self.root = self._dir.name
+        self.scripts = {}
+        for name in ["slow", "quick", "broken", "edited", "new"]:
+            path = os.path.join(self.root, "examples", f"{name}.py")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as script:
+                script.write("print('hello')\n")
+            os.utime(path, (1000, 1000))
+            self.scripts[name] = path
+        self.history_path = os.path.join(self.root, "history.json")
+        history = RunHistory(self.history_path)
+        history.record(self.scripts["slow"], "pass", 100)
+        history.record(self.scripts["quick"], "pass", 1)
+        history.record(self.scripts["broken"], "fail", 50)
+        history.record(self.scripts["edited"], "pass", 10)
+        now = time.time() + 10
+        os.utime(self.scripts["edited"], (now, now))
+
+    def tearDown(self) -> None:
+        self._dir.cleanup()
+
+    def test_order(self) -> None:
+        history = RunHistory(self.history_path)
+        ordered = history.order(
+            [(path, name) for name, path in sorted(self.scripts.items())])
+        self.assertEqual(["broken", "edited", "new", "quick", "slow"],
+                         [name for _, name in ordered])
+
+    def test_builder(self) -> None:
+        module = mock.Mock(__file__=os.path.join(
+            self.root, "integration_tests", "script_builder.py"))
+        os.makedirs(os.path.join(self.root, "integration_tests"))
+        with mock.patch.dict("sys.modules", {"history_builder": module}), \
+                mock.patch.dict(os.environ,
+                                {"TESTBASE_HISTORY": self.history_path}):
+            builder = type("HistoryBuilder", (RootScriptBuilder,),
+                           {"__module__": "history_builder"})()
+            builder.create_test_scripts(["examples"])
+        with open(os.path.join(self.root, "integration_tests",
+                               "test_scripts.py"), encoding="utf-8") as tests:
+            text = tests.read()
+        positions = [text.index(f"def test_examples_{name}(")
+                     for name in ["broken", "edited", "new", "quick", "slow"]]
+        self.assertEqual(sorted(positions), positions)
+
+    def test_parallel_records(self) -> None:
+        history = RunHistory(os.path.join(self.root, "parallel.json"))
+        paths = [os.path.join(self.root, f"script{i}.py") for i in range(16)]
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(
+                lambda path: history.record(path, "pass", 1.0), paths))
+        with open(os.path.join(self.root, "parallel.json"),
+                  encoding="utf-8") as history_file:
+            self.assertEqual(16, len(json.load(history_file)))
@@ -0,0 +1,131 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from spinnaker_testbase.board_scheduler import ScriptOutcome
+from spinnaker_testbase.result_cache import ResultCache
+from spinnaker_testbase.script_checker import (
+    ScriptChecker, _replay, pytest_collection_finish, virtual_workers)
+
+
+class Scripts(ScriptChecker):
+    # Only used by the tests below
+    __test__ = False
+
+    def test_a(self) -> None:
+        pass
+
+    def test_b(self) -> None:
+        pass
+
+
+class Item(object):
+    """
+    Stands in for a pytest item.
+    """
+
+    def __init__(self, name: str):
+        self.cls = Scripts
+        self.name = name
+
+
+class Session(object):
+    """
+    Stands in for a pytest session.
+    """
+
+    def __init__(self, *names: str):
+        self.items = [Item(name) for name in names]
+
+
+class TestScriptChecker(unittest.TestCase):
+
+    def test_virtual_workers(self) -> None:
+        with mock.patch.dict(os.environ, {"TESTBASE_VIRTUAL_WORKERS": "3"}):
+            self.assertEqual(3, virtual_workers())
+        with mock.patch.dict(
+                os.environ, {"TESTBASE_VIRTUAL_WORKERS": "auto"}):
+            self.assertEqual(os.cpu_count(), virtual_workers())
+        with mock.patch.dict(os.environ):
+            os.environ.pop("TESTBASE_VIRTUAL_WORKERS", None)
+            self.assertEqual(0, virtual_workers())
+
+    def test_replay(self) -> None:
+        checker = ScriptChecker()
+        _replay(ScriptOutcome("test_a", "pass", "virtual0", 1.0))(checker)
+        with self.assertRaises(unittest.SkipTest):
+            _replay(ScriptOutcome(
+                "test_a", "skip", "virtual0", 1.0, "why"))(checker)
+        with self.assertRaises(AssertionError):
+            _replay(ScriptOutcome(
+                "test_a", "fail", "virtual0", 1.0, "boom"))(checker)
+
+    def test_selected_by_unittest(self) -> None:
+        Scripts("test_b")
+        try:
+            self.assertEqual(["test_b"], Scripts._selected_tests())
+        finally:
+            Scripts.tearDownClass()
+        unittest.TestLoader().loadTestsFromTestCase(Scripts)
+        try:
+            self.assertEqual(["test_a", "test_b"], Scripts._selected_tests())
+        finally:
+            Scripts.tearDownClass()
+
+    def test_selected_by_pytest(self) -> None:
+        # pytest makes every test case whatever is selected
+        unittest.TestLoader().loadTestsFromTestCase(Scripts)
+        pytest_collection_finish(Session("test_a"))
+        try:
+            self.assertEqual(["test_a"], Scripts._selected_tests())
+        finally:
+            Scripts.tearDownClass()
+
+    def test_replays_restored(self) -> None:
+        original = Scripts.__dict__["test_a"]
+        Scripts._replay_all([
+            ScriptOutcome("test_a", "fail", "virtual0", 1.0, "boom")])
+        self.assertIsNot(original, Scripts.__dict__["test_a"])
+        Scripts.tearDownClass()
+        self.assertIs(original, Scripts.__dict__["test_a"])
+
+    def test_cache_problems_logged(self) -> None:
+        checker = Scripts("test_a")
+        try:
+            with tempfile.TemporaryDirectory() as temp:
+                script = os.path.join(temp, "script.py")
+                with open(script, "w", encoding="utf-8") as script_file:
+                    script_file.write("import helper\n")
+                helper = os.path.join(temp, "helper.py")
+                with open(helper, "w", encoding="utf-8") as helper_file:
+                    helper_file.write("VALUE = 1\n")
+                cache = ResultCache(os.path.join(temp, "cache.json"))
+                checker._update_cache(cache, script, True)
+                with open(helper, "w", encoding="utf-8") as helper_file:
+                    helper_file.write("def broken(:\n")
+                with self.assertLogs("spinnaker_testbase.script_checker"):
+                    self.assertFalse(
+                        checker._is_cached_pass("script.py", script, cache))
+                with self.assertLogs("spinnaker_testbase.script_checker"):
+                    checker._update_cache(cache, script, True)
+                with mock.patch.object(ResultCache, "forget",
+                                       side_effect=OSError("disk full")), \
+                        self.assertLogs("spinnaker_testbase.script_checker"):
+                    checker._update_cache(cache, script, False)
+        finally:
+            Scripts.tearDownClass()
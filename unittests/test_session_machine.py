@@ -0,0 +1,142 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+from typing import List, Optional
+import unittest
+from unittest import mock
+
+from spalloc_client.job import JobDestroyedError
+from spalloc_client.states import JobState
+from spinn_utilities import conf_loader
+from spinn_utilities.config_holder import get_default_cfgs
+from spinnman.exceptions import SpinnmanException
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.config_setup import unittest_setup
+
+from spinnaker_testbase.config_overrides import (
+    clear_config_overrides, get_config_overrides)
+from spinnaker_testbase import root_test_case
+from spinnaker_testbase.root_test_case import RootTestCase
+from spinnaker_testbase.session_machine import SessionMachine
+
+
+class LocalJob(object):
+    """
+    Stands in for a spalloc Job without needing a server.
+    """
+    created: List["LocalJob"] = []
+
+    def __init__(self, n_boards: int):
+        self.n_boards = n_boards
+        self.hostname = f"10.0.0.{len(LocalJob.created) + 1}"
+        self.state = JobState.ready
+        self.reason: Optional[str] = None
+        self.resets = 0
+        self.closed = False
+        LocalJob.created.append(self)
+
+    def wait_until_ready(self) -> None:
+        if self.state == JobState.destroyed:
+            raise JobDestroyedError(self.reason)
+
+    def reset(self) -> None:
+        self.resets += 1
+
+    def destroy(self, reason: Optional[str] = None) -> None:
+        self.state = JobState.destroyed
+        self.reason = reason
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class SessionTests(RootTestCase):
+
+    def check_nothing(self) -> None:
+        pass
+
+
+class TestSessionMachine(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        LocalJob.created = []
+
+    def tearDown(self) -> None:
+        clear_config_overrides()
+
+    def test_reuse(self) -> None:
+        session = SessionMachine(job_factory=LocalJob)
+        session.prepare()
+        session.prepare()
+        session.prepare()
+        self.assertEqual(1, len(LocalJob.created))
+        self.assertEqual(2, LocalJob.created[0].resets)
+        self.assertEqual(3, session.scripts_run)
+        self.assertEqual(
+            "10.0.0.1", get_config_overrides()[("Machine", "machine_name")])
+
+    def test_destroyed(self) -> None:
+        session = SessionMachine(job_factory=LocalJob)
+        session.prepare()
+        LocalJob.created[0].destroy("timeout")
+        session.prepare()
+        self.assertEqual(2, len(LocalJob.created))
+        self.assertTrue(LocalJob.created[0].closed)
+        self.assertEqual("10.0.0.2", session.hostname)
+
+    def test_renew_and_release(self) -> None:
+        session = SessionMachine(job_factory=LocalJob)
+        session.prepare()
+        session.renew()
+        self.assertEqual("10.0.0.2", session.hostname)
+        session.release()
+        self.assertEqual(JobState.destroyed, LocalJob.created[1].state)
+        self.assertIsNone(session.hostname)
+        self.assertEqual({}, get_config_overrides())
+
+    def test_overrides_survive_reload(self) -> None:
+        session = SessionMachine(job_factory=LocalJob)
+        session.prepare()
+        configs = conf_loader.load_config(None, None, list(get_default_cfgs()))
+        self.assertEqual(
+            "10.0.0.1", configs.get_str("Machine", "machine_name"))
+        self.assertIsNone(configs.get_str("Machine", "spalloc_server"))
+
+    def test_retry_replaces_destroyed_job(self) -> None:
+        session = SessionMachine(job_factory=LocalJob)
+        session.prepare()
+        hostnames: List[Optional[str]] = []
+
+        def run() -> None:
+            hostnames.append(session.hostname)
+            if len(hostnames) == 1:
+                # The tools only see the board stop answering
+                LocalJob.created[0].destroy("timeout")
+                raise SpinnmanException("board not responding")
+
+        with tempfile.TemporaryDirectory() as temp, \
+                mock.patch.object(root_test_case, "MAX_TRIES", 2), \
+                mock.patch.object(root_test_case, "get_session_machine",
+                                  return_value=session), \
+                mock.patch.object(FecDataView, "get_transceiver"), \
+                mock.patch.object(
+                    FecDataView, "get_error_file",
+                    return_value=os.path.join(temp, "ErrorFile.txt")):
+            SessionTests("check_nothing").runsafe(run, retry_delay=0)
+        self.assertEqual(["10.0.0.1", "10.0.0.2"], hostnames)
+        self.assertEqual(
+            "10.0.0.2", get_config_overrides()[("Machine", "machine_name")])
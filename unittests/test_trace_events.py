@@ -0,0 +1,68 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from spinnaker_testbase.trace_events import name_process, span
+
+
+class TestTraceEvents(unittest.TestCase):
+
+    def test_spans(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            with mock.patch.dict(os.environ, {"TESTBASE_TRACE": path}):
+                name_process("main")
+                with span("outer", attempt=1):
+                    with span("inner"):
+                        pass
+            with open(path, encoding="utf-8") as trace:
+                text = trace.read()
+        self.assertTrue(text.startswith("[\n"))
+        events = json.loads(text.rstrip(",\n") + "]")
+        self.assertEqual(["process_name", "inner", "outer"],
+                         [event["name"] for event in events])
+        outer = events[2]
+        self.assertEqual("X", outer["ph"])
+        self.assertEqual({"attempt": "1"}, outer["args"])
+        self.assertEqual(os.getpid(), outer["pid"])
+        self.assertLessEqual(outer["ts"], events[1]["ts"])
+
+    def test_bracket_before_events(self) -> None:
+        write = os.write
+        starts = []
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+
+            def _write(handle: int, data: bytes) -> int:
+                with open(path, "rb") as trace:
+                    starts.append(trace.read(2))
+                return write(handle, data)
+            with mock.patch.dict(os.environ, {"TESTBASE_TRACE": path}):
+                with mock.patch("os.write", _write):
+                    name_process("main")
+                    name_process("again")
+            self.assertEqual(["trace.json"], os.listdir(tmp))
+        self.assertEqual([b"[\n", b"[\n"], starts)
+
+    def test_off(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.dict(os.environ, {"TESTBASE_TRACE": ""}):
+                with span("nothing"):
+                    pass
+            self.assertEqual([], os.listdir(tmp))
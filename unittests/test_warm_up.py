@@ -0,0 +1,105 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from threading import Event, Thread
+from typing import List
+import unittest
+from unittest import mock
+
+from spalloc_client.states import JobState
+from spinn_front_end_common.interface.config_setup import unittest_setup
+
+from spinnaker_testbase.config_overrides import clear_config_overrides
+from spinnaker_testbase.ping import Ping
+from spinnaker_testbase.session_machine import SessionMachine
+from spinnaker_testbase.warm_up import warm_up, warm_up_hosts
+
+
+class SlowJob(object):
+    """
+    Stands in for a spalloc Job that takes a while to be ready.
+    """
+    created: List["SlowJob"] = []
+    release = Event()
+
+    def __init__(self, n_boards: int):
+        self.hostname = "10.0.0.1"
+        self.state = JobState.ready
+        self.resets = 0
+        SlowJob.created.append(self)
+
+    def wait_until_ready(self) -> None:
+        SlowJob.release.wait(5)
+
+    def reset(self) -> None:
+        self.resets += 1
+
+
+class TestWarmUp(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        SlowJob.created = []
+        SlowJob.release.clear()
+
+    def tearDown(self) -> None:
+        clear_config_overrides()
+
+    def test_prepare_waits_for_warm_up(self) -> None:
+        session = SessionMachine(job_factory=SlowJob)
+        warming = Thread(target=session.warm_up)
+        warming.start()
+        while not SlowJob.created:
+            pass
+        preparing = Thread(target=session.prepare)
+        preparing.start()
+        SlowJob.release.set()
+        warming.join(5)
+        preparing.join(5)
+        self.assertEqual(1, len(SlowJob.created))
+        self.assertEqual(0, SlowJob.created[0].resets)
+        self.assertEqual(1, session.scripts_run)
+        session.prepare()
+        self.assertEqual(1, SlowJob.created[0].resets)
+
+    def test_hosts_pinged(self) -> None:
+        with mock.patch.dict(os.environ,
+                             {"TESTBASE_WARM_UP_HOSTS": "board1, board2"}), \
+                mock.patch.object(Ping, "ping", return_value=0) as ping, \
+                mock.patch.object(Ping, "reachable", {}):
+            warm_up()
+            self.assertEqual({"board1", "board2"}, set(Ping.reachable))
+            self.assertTrue(Ping.host_is_reachable("board1"))
+            self.assertEqual(2, ping.call_count)
+            # Answers are only trusted for a while
+            with mock.patch.object(Ping, "reachable_ttl", 0.0):
+                self.assertTrue(Ping.host_is_reachable("board1"))
+            self.assertEqual(3, ping.call_count)
+
+    def test_down_not_remembered(self) -> None:
+        with mock.patch.dict(os.environ,
+                             {"TESTBASE_WARM_UP_HOSTS": "board1"}), \
+                mock.patch.object(Ping, "ping", return_value=1), \
+                mock.patch.object(Ping, "reachable", {}), \
+                mock.patch.object(Ping, "unreachable", set()):
+            warm_up()
+            self.assertEqual({}, Ping.reachable)
+            self.assertEqual(set(), Ping.unreachable)
+
+    def test_hosts_include_boards(self) -> None:
+        with mock.patch.dict(os.environ,
+                             {"TESTBASE_WARM_UP_HOSTS": "board1",
+                              "TESTBASE_BOARDS": "board1:5,board2:3"}):
+            self.assertEqual(["board1", "board2"], warm_up_hosts())
@@ -0,0 +1,121 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+from typing import List
+import unittest
+from unittest import mock
+
+from spinnaker_testbase.board_scheduler import ScriptOutcome
+from spinnaker_testbase.error_journal import ErrorJournal
+from spinnaker_testbase.work_queue import WorkCoordinator, parse_address
+
+
+class QueueScripts(unittest.TestCase):
+    """
+    Methods run by workers pulling from the queue.
+
+    None start with test so they are only run through the coordinator.
+    """
+
+    def _report(self, file_name: str) -> None:
+        with open(os.path.join(os.environ["GLOBAL_REPORTS"], file_name), "a",
+                  encoding="utf-8") as report_file:
+            report_file.write(
+                f"{self._testMethodName} on "
+                f"{os.environ['TESTBASE_WORKER_BOARD']}\n")
+
+    def check_pass(self) -> None:
+        self._report("scripts_ran_successfully")
+
+    def check_error_file(self) -> None:
+        ErrorJournal(os.path.join(
+            os.environ["GLOBAL_REPORTS"], "ErrorFile.txt")).record(
+                "queue", ValueError("board lost"))
+
+    def check_skip(self) -> None:
+        raise unittest.SkipTest("not today")
+
+    def check_fail(self) -> None:
+        self.fail("expected")
+
+    def check_crash(self) -> None:
+        os._exit(3)
+
+    def check_pid(self) -> None:
+        with open(os.path.join(os.environ["GLOBAL_REPORTS"], "pids"), "a",
+                  encoding="utf-8") as pid_file:
+            pid_file.write(f"{os.getpid()}\n")
+
+
+class TestWorkQueue(unittest.TestCase):
+
+    def test_parse_address(self) -> None:
+        self.assertEqual(("localhost", 6000), parse_address("localhost:6000"))
+        self.assertEqual("/tmp/queue", parse_address("/tmp/queue"))
+
+    def test_local_socket(self) -> None:
+        with tempfile.TemporaryDirectory() as temp:
+            reports = os.path.join(temp, "reports")
+            coordinator = WorkCoordinator(
+                os.path.join(temp, "queue"), b"secret", reports)
+            coordinator.start_local_workers(3)
+            seen: List[ScriptOutcome] = []
+            outcomes = coordinator.run_tests(
+                QueueScripts,
+                ["check_pass", "check_skip", "check_fail", "check_crash",
+                 "check_pass", "check_error_file", "check_error_file"],
+                on_outcome=seen.append)
+            self.assertEqual(
+                ["pass", "skip", "fail", "error", "pass", "pass", "pass"],
+                [outcome.status for outcome in outcomes])
+            self.assertIn("twice", outcomes[3].message)
+            self.assertEqual(7, len(seen))
+            with open(os.path.join(reports, "scripts_ran_successfully"),
+                      encoding="utf-8") as report_file:
+                self.assertEqual(2, len(report_file.readlines()))
+            errors = list(ErrorJournal(
+                os.path.join(reports, "ErrorFile.txt")).records())
+            self.assertEqual(1, len(errors))
+            self.assertEqual(2, errors[0]["count"])
+
+    def test_tcp(self) -> None:
+        with tempfile.TemporaryDirectory() as reports:
+            coordinator = WorkCoordinator(
+                ("localhost", 0), b"secret", reports)
+            coordinator.start_local_workers(2)
+            outcomes = coordinator.run_tests(QueueScripts, ["check_pass"] * 4)
+            self.assertEqual(["pass"] * 4,
+                             [outcome.status for outcome in outcomes])
+            with open(os.path.join(reports, "scripts_ran_successfully"),
+                      encoding="utf-8") as report_file:
+                self.assertEqual(4, len(report_file.readlines()))
+
+    def test_recycle_local_workers(self) -> None:
+        with tempfile.TemporaryDirectory() as temp, \
+                mock.patch.dict(os.environ,
+                                {"TESTBASE_RECYCLE_SCRIPTS": "2"}):
+            reports = os.path.join(temp, "reports")
+            coordinator = WorkCoordinator(
+                os.path.join(temp, "queue"), b"secret", reports)
+            coordinator.start_local_workers(1)
+            outcomes = coordinator.run_tests(QueueScripts, ["check_pid"] * 5)
+            self.assertEqual(["pass"] * 5,
+                             [outcome.status for outcome in outcomes])
+            with open(os.path.join(reports, "pids"),
+                      encoding="utf-8") as pid_file:
+                pids = pid_file.read().split()
+            self.assertEqual(5, len(pids))
+            self.assertEqual(3, len(set(pids)))